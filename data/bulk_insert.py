@@ -4,17 +4,21 @@ JSONL Manga Data Bulk Insert Script
 Reads JSONL file and inserts manga data into PostgreSQL database
 """
 
-import json
+import io
 import logging
+import mmap
+import multiprocessing
+import re
+import struct
 import sys
 from datetime import datetime
-from typing import Dict, List, Optional, Set, Tuple
-from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from dataclasses import dataclass, field
+from itertools import islice
 import orjson
 # from pathlib import Path
 
 import psycopg2
-from psycopg2.extras import execute_values #, execute_batch
 from psycopg2.extensions import connection
 import click
 
@@ -30,7 +34,20 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+
+def _copy_text(value) -> str:
+    """Render a single value as a field of PostgreSQL's text COPY format"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    return (str(value)
+            .replace('\\', '\\\\')
+            .replace('\t', '\\t')
+            .replace('\n', '\\n')
+            .replace('\r', '\\r'))
+
+@dataclass(slots=True)
 class MangaData:
     """Data class for manga information"""
     id: int
@@ -62,16 +79,176 @@ class MangaData:
     tags: Optional[List[str]]
     last_updated_at: str
     source: Dict
+    # Normalized names, extracted once at parse time
+    author_names: frozenset = field(default=frozenset())
+    artist_names: frozenset = field(default=frozenset())
+    genre_names: frozenset = field(default=frozenset())
+    tag_names: frozenset = field(default=frozenset())
+    publisher_names: frozenset = field(default=frozenset())
+
+# Link type classification in a single regex pass; group index maps to LINK_TYPES
+LINK_TYPE_RE = re.compile(r'(fakku\.net)|(mangadex|mangabaka)|(anilist|myanimelist)')
+LINK_TYPES = ('store', 'reader', 'database')
+
+# Defaults for missing JSON keys, in MangaData field order (keys double as the positional order)
+MANGA_DEFAULTS = {
+    'id': None,
+    'state': 'active',
+    'merged_with': None,
+    'title': '',
+    'native_title': None,
+    'romanized_title': None,
+    'secondary_titles': {},
+    'cover': {},
+    'authors': [],
+    'artists': [],
+    'description': None,
+    'year': None,
+    'status': None,
+    'is_licensed': False,
+    'has_anime': False,
+    'anime': None,
+    'content_rating': None,
+    'type': 'manga',
+    'rating': None,
+    'final_volume': None,
+    'final_chapter': None,
+    'total_chapters': None,
+    'links': [],
+    'publishers': None,
+    'relationships': {},
+    'genres': [],
+    'tags': None,
+    'last_updated_at': None,
+    'source': {},
+}
+
+# Column order of the tuples built by insert_manga_data
+MANGA_COLUMNS = (
+    'id', 'state', 'title', 'native_title', 'romanized_title',
+    'description', 'year', 'status', 'is_licensed', 'has_anime', 'anime',
+    'content_rating', 'type', 'rating', 'final_volume', 'final_chapter',
+    'total_chapters', 'last_updated_at',
+)
+
+# Binary COPY framing for (manga_id BIGINT, other_id INTEGER) junction rows
+PGCOPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+PGCOPY_TRAILER = struct.pack('>h', -1)
+ID_PAIR_ROW = struct.Struct('>hiqii')
+ID_PAIR_TABLES = frozenset({
+    'manga_authors', 'manga_artists', 'manga_genres', 'manga_tags', 'manga_publishers',
+})
+
+
+def _encode_text_rows(rows: List[Tuple]) -> io.StringIO:
+    """Render rows as a text COPY stream"""
+    buf = io.StringIO()
+    for row in rows:
+        buf.write('\t'.join([_copy_text(value) for value in row]))
+        buf.write('\n')
+    buf.seek(0)
+    return buf
+
+
+def _encode_id_pairs(rows: List[Tuple]) -> io.BytesIO:
+    """Pack (bigint, integer) rows as a binary COPY stream, skipping text rendering and parsing"""
+    buf = io.BytesIO()
+    buf.write(PGCOPY_HEADER)
+    pack = ID_PAIR_ROW.pack
+    for manga_id, other_id in rows:
+        buf.write(pack(2, 8, manga_id, 4, other_id))
+    buf.write(PGCOPY_TRAILER)
+    buf.seek(0)
+    return buf
+
+# Lines handed to each parse worker at a time
+PARSE_CHUNKSIZE = 512
+
+# Relationships are staged for the whole import and merged once every target can exist
+RELATIONSHIP_COLUMNS = ('manga_id', 'related_manga_id', 'relationship_type')
+
+# Tables COPYed straight into place
+COPY_TARGETS = {
+    'manga_relationships_stage': RELATIONSHIP_COLUMNS,
+}
+
+# Tables loaded through a stage table and merged together by one fused statement per batch:
+# columns copied and the merge conflict clause (empty for tables without a unique key)
+MERGE_TARGETS = {
+    'manga': (MANGA_COLUMNS, """
+        ON CONFLICT (id) DO UPDATE SET
+            state = EXCLUDED.state,
+            title = EXCLUDED.title,
+            native_title = EXCLUDED.native_title,
+            romanized_title = EXCLUDED.romanized_title,
+            description = EXCLUDED.description,
+            year = EXCLUDED.year,
+            status = EXCLUDED.status,
+            is_licensed = EXCLUDED.is_licensed,
+            has_anime = EXCLUDED.has_anime,
+            anime = EXCLUDED.anime,
+            content_rating = EXCLUDED.content_rating,
+            rating = EXCLUDED.rating,
+            final_volume = EXCLUDED.final_volume,
+            final_chapter = EXCLUDED.final_chapter,
+            total_chapters = EXCLUDED.total_chapters,
+            last_updated_at = EXCLUDED.last_updated_at,
+            updated_at = CURRENT_TIMESTAMP
+    """),
+    'manga_secondary_titles': (('manga_id', 'language_code', 'title', 'type', 'note'), ""),
+    'manga_covers': (('manga_id', 'type', 'url'), ""),
+    'manga_links': (('manga_id', 'url', 'link_type'), ""),
+    'manga_authors': (('manga_id', 'author_id'), "ON CONFLICT DO NOTHING"),
+    'manga_artists': (('manga_id', 'artist_id'), "ON CONFLICT DO NOTHING"),
+    'manga_genres': (('manga_id', 'genre_id'), "ON CONFLICT DO NOTHING"),
+    'manga_tags': (('manga_id', 'tag_id'), "ON CONFLICT DO NOTHING"),
+    'manga_publishers': (('manga_id', 'publisher_id'), "ON CONFLICT DO NOTHING"),
+    'manga_external_sources': ((
+        'manga_id', 'source_id', 'external_id', 'rating', 'cover_url',
+        'last_updated_at', 'response_data', 'statistics'
+    ), """
+        ON CONFLICT (manga_id, source_id) DO UPDATE SET
+            external_id = EXCLUDED.external_id,
+            rating = EXCLUDED.rating,
+            cover_url = EXCLUDED.cover_url,
+            last_updated_at = EXCLUDED.last_updated_at,
+            response_data = EXCLUDED.response_data,
+            statistics = EXCLUDED.statistics
+    """),
+}
+
+# DO UPDATE merges may not touch a row twice, so keep only the last staged row per key
+MERGE_DEDUP_KEYS = {
+    'manga': 'id',
+    'manga_external_sources': 'manga_id, source_id',
+}
+
+# Tables the importer writes to; their secondary indexes are rebuilt after an initial load
+LOADED_TABLES = ('manga', 'manga_secondary_titles', 'manga_covers', 'manga_links',
+                 'manga_authors', 'manga_artists', 'manga_genres', 'manga_tags',
+                 'manga_publishers', 'manga_relationships', 'manga_external_sources')
+
+# Materialized views over the loaded tables; the API refreshes them only after its own writes
+MATERIALIZED_VIEWS = ('manga_search_facets', 'mv_year_distribution', 'mv_rating_distribution')
 
 class MangaBulkImporter:
     """Bulk importer for manga data"""
     
-    def __init__(self, connection_string: str, batch_size: int = 1000):
+    def __init__(self, connection_string: str, batch_size: int = 1000, workers: int = 1):
         self.connection_string = connection_string
         self.batch_size = batch_size
+        self.workers = workers
         self.conn: Optional[connection] = None
 
-        self.manga_ids = set()
+        # Per-table COPY writers, built once so batches only touch data
+        self.writers = {
+            table_name: self._build_writer(table_name, table_name, columns)
+            for table_name, columns in COPY_TARGETS.items()
+        }
+        self.writers.update({
+            table_name: self._build_writer(table_name, f"{table_name}_stage", columns)
+            for table_name, (columns, _) in MERGE_TARGETS.items()
+        })
 
         # Cache for normalized data
         self.authors_cache: Dict[str, int] = {}
@@ -86,10 +263,50 @@ class MangaBulkImporter:
         try:
             self.conn = psycopg2.connect(self.connection_string)
             self.conn.autocommit = False
+            self._prepare_merges()
             logger.info("Connected to database")
         except Exception as e:
             logger.error(f"Failed to connect to database: {e}")
             raise
+
+    def _prepare_merges(self):
+        """Create session-lived stage tables and prepare the fused per-batch merge statement"""
+        merges = []
+        with self.conn.cursor() as cur:
+            for table_name, (columns, on_conflict) in MERGE_TARGETS.items():
+                column_list = ', '.join(columns)
+                cur.execute(f"""
+                    CREATE TEMP TABLE {table_name}_stage ON COMMIT DELETE ROWS AS
+                    SELECT {column_list} FROM {table_name} WITH NO DATA
+                """)
+                dedup_key = MERGE_DEDUP_KEYS.get(table_name)
+                if dedup_key:
+                    # Rows land in a freshly emptied stage in file order, so the highest ctid is the latest
+                    select = (f"SELECT DISTINCT ON ({dedup_key}) {column_list} FROM {table_name}_stage "
+                              f"ORDER BY {dedup_key}, ctid DESC")
+                else:
+                    select = f"SELECT {column_list} FROM {table_name}_stage"
+                merges.append(f"""
+                    merge_{table_name} AS (
+                        INSERT INTO {table_name} ({column_list})
+                        {select}
+                        {on_conflict}
+                    )""")
+
+            # Foreign keys are checked at the end of the statement, so child rows may
+            # reference manga inserted by a sibling CTE
+            cur.execute(f"""
+                PREPARE merge_batch AS
+                WITH {','.join(merges)}
+                SELECT 1
+            """)
+
+            # Unlike the per-batch stages, relationship rows must survive commits
+            cur.execute(f"""
+                CREATE TEMP TABLE manga_relationships_stage AS
+                SELECT {', '.join(RELATIONSHIP_COLUMNS)} FROM manga_relationships WITH NO DATA
+            """)
+        self.conn.commit()
             
     def disconnect(self):
         """Disconnect from database"""
@@ -102,23 +319,23 @@ class MangaBulkImporter:
         with self.conn.cursor() as cur:
             # Load authors
             cur.execute("SELECT name, id FROM authors")
-            self.authors_cache = {name: id for name, id in cur.fetchall()}
+            self.authors_cache = {sys.intern(name): id for name, id in cur.fetchall()}
             
             # Load artists
             cur.execute("SELECT name, id FROM artists")
-            self.artists_cache = {name: id for name, id in cur.fetchall()}
+            self.artists_cache = {sys.intern(name): id for name, id in cur.fetchall()}
 
             # Load genres
             cur.execute("SELECT name, id FROM genres")
-            self.genres_cache = {name: id for name, id in cur.fetchall()}
+            self.genres_cache = {sys.intern(name): id for name, id in cur.fetchall()}
 
             # Load tags
             cur.execute("SELECT name, id FROM tags")
-            self.tags_cache = {name: id for name, id in cur.fetchall()}
+            self.tags_cache = {sys.intern(name): id for name, id in cur.fetchall()}
             
             # Load publishers
             cur.execute("SELECT name, id FROM publishers")
-            self.publishers_cache = {name: id for name, id in cur.fetchall()}
+            self.publishers_cache = {sys.intern(name): id for name, id in cur.fetchall()}
             
             # Load external sources
             cur.execute("SELECT name, id FROM external_sources")
@@ -128,31 +345,31 @@ class MangaBulkImporter:
                    f"{len(self.artists_cache)} artists, {len(self.genres_cache)} genres")
 
 
-    def parse_jsonl_file(self, file_path: str) -> List[MangaData]:
-        """Parse JSONL file and return manga data"""
-        manga_list = []
+    def parse_jsonl_file(self, file_path: str) -> Iterator[MangaData]:
+        """Parse JSONL file and lazily yield manga data"""
+        parsed_count = 0
+        # Decoding is CPU bound, so fan lines out to worker processes when asked to
+        pool = multiprocessing.Pool(self.workers) if self.workers > 1 else None
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                for line_num, line in enumerate(file, 1):
-                    line = line.strip()
-                    if not line:
-                        continue
-                        
-                    try:
-                        data = json.loads(line)
-                        manga = self._parse_manga_json(data)
-                        manga_list.append(manga)
-                        
-                        if line_num % 1000 == 0:
-                            logger.info(f"Parsed {line_num} lines")
-                            
-                    except json.JSONDecodeError as e:
-                        logger.error(f"JSON decode error at line {line_num}: {e}")
-                        continue
-                    except Exception as e:
-                        logger.error(f"Error parsing line {line_num}: {e}")
-                        continue
+            lines = _iter_lines(file_path)
+            if pool:
+                results = pool.imap(_parse_line, lines, chunksize=PARSE_CHUNKSIZE)
+            else:
+                results = map(_parse_line, lines)
+
+            for line_num, (manga, error) in enumerate(results, 1):
+                if error:
+                    logger.error(f"Error parsing line {line_num}: {error}")
+                    continue
+                if manga is None:
+                    continue
+
+                if line_num % 1000 == 0:
+                    logger.info(f"Parsed {line_num} lines")
+
+                parsed_count += 1
+                yield manga
                         
         except FileNotFoundError:
             logger.error(f"File not found: {file_path}")
@@ -160,11 +377,32 @@ class MangaBulkImporter:
         except Exception as e:
             logger.error(f"Error reading file {file_path}: {e}")
             raise
+        finally:
+            if pool:
+                pool.terminate()
             
-        logger.info(f"Successfully parsed {len(manga_list)} manga records")
-        return manga_list
+        logger.info(f"Successfully parsed {parsed_count} manga records")
+
+    def iter_batches(self, file_path: str) -> Iterator[List[MangaData]]:
+        """Yield parsed manga in lists of at most batch_size records"""
+        records = self.parse_jsonl_file(file_path)
+        while True:
+            batch = list(islice(records, self.batch_size))
+            if not batch:
+                return
+            yield batch
         
-    def _extract_names(self, data_list) -> Set[str]:
+    @classmethod
+    def _fast_names(cls, data_list) -> frozenset:
+        """Extract names, skipping per-item type dispatch for plain string lists"""
+        if not data_list:
+            return frozenset()
+        if isinstance(data_list, list) and all(isinstance(item, str) for item in data_list):
+            return frozenset(map(sys.intern, filter(None, map(str.strip, data_list))))
+        return frozenset(cls._extract_names(data_list))
+
+    @staticmethod
+    def _extract_names(data_list) -> Set[str]:
         """Extract names from various data formats (strings, dicts, mixed)"""
         names = set()
         if not data_list:
@@ -175,7 +413,7 @@ class MangaBulkImporter:
                 if isinstance(item, str):
                     # Simple string
                     if item.strip():
-                        names.add(item.strip())
+                        names.add(sys.intern(item.strip()))
                 elif isinstance(item, dict):
                     # Dictionary format - try common name fields
                     name = (item.get('name') or 
@@ -184,56 +422,31 @@ class MangaBulkImporter:
                            item.get('Title') or
                            str(item))
                     if name and isinstance(name, str) and name.strip():
-                        names.add(name.strip())
+                        names.add(sys.intern(name.strip()))
                 elif item is not None:
                     # Convert other types to string
                     name_str = str(item).strip()
                     if name_str:
-                        names.add(name_str)
+                        names.add(sys.intern(name_str))
         except (TypeError, AttributeError) as e:
             logger.warning(f"Error extracting names from {data_list}: {e}")
             # Fallback: try to convert the whole thing to string if it's not iterable
             try:
                 if isinstance(data_list, str) and data_list.strip():
-                    names.add(data_list.strip())
+                    names.add(sys.intern(data_list.strip()))
             except Exception as e:
                 print(f"> Exception while extracting names: {e}")
                 
         return names
         
-    def _parse_manga_json(self, data: Dict) -> MangaData:
+    @classmethod
+    def _parse_manga_json(cls, data: Dict) -> MangaData:
         """Parse single manga JSON record"""
-        manga = MangaData(
-            id=data.get('id'),
-            state=data.get('state', 'active'),
-            merged_with=data.get('merged_with'),
-            title=data.get('title', ''),
-            native_title=data.get('native_title'),
-            romanized_title=data.get('romanized_title'),
-            secondary_titles=data.get('secondary_titles', {}),
-            cover=data.get('cover', {}),
-            authors=data.get('authors', []),
-            artists=data.get('artists', []),
-            description=data.get('description'),
-            year=data.get('year'),
-            status=data.get('status'),
-            is_licensed=data.get('is_licensed', False),
-            has_anime=data.get('has_anime', False),
-            anime=data.get('anime'),
-            content_rating=data.get('content_rating'),
-            type=data.get('type', 'manga'),
-            rating=data.get('rating'),
-            final_volume=data.get('final_volume'),
-            final_chapter=data.get('final_chapter'),
-            total_chapters=data.get('total_chapters'),
-            links=data.get('links', []),
-            publishers=data.get('publishers'),
-            relationships=data.get('relationships', {}),
-            genres=data.get('genres', []),
-            tags=data.get('tags'),
-            last_updated_at=data.get('last_updated_at', datetime.now().isoformat()),
-            source=data.get('source', {})
-        )
+        # Overlay the record on the defaults in one C-level merge, then build positionally
+        fields = {**MANGA_DEFAULTS, **data}
+        if 'last_updated_at' not in data:
+            fields['last_updated_at'] = datetime.now().isoformat()
+        manga = MangaData(*map(fields.__getitem__, MANGA_DEFAULTS))
 
         # final_chapter -> convert to float if it's a string
         if isinstance(manga.final_chapter, str):
@@ -242,6 +455,12 @@ class MangaBulkImporter:
             except ValueError:
                 manga.final_chapter = None
 
+        manga.author_names = cls._fast_names(manga.authors)
+        manga.artist_names = cls._fast_names(manga.artists)
+        manga.genre_names = cls._fast_names(manga.genres)
+        manga.tag_names = cls._fast_names(manga.tags)
+        manga.publisher_names = cls._fast_names(manga.publishers)
+
         return manga
 
         
@@ -255,14 +474,11 @@ class MangaBulkImporter:
         publishers = set()
         
         for manga in manga_list:
-            # Handle different data formats safely
-            authors.update(self._extract_names(manga.authors))
-            artists.update(self._extract_names(manga.artists))
-            genres.update(self._extract_names(manga.genres))
-            if manga.tags:
-                tags.update(self._extract_names(manga.tags))
-            if manga.publishers:
-                publishers.update(self._extract_names(manga.publishers))
+            authors.update(manga.author_names)
+            artists.update(manga.artist_names)
+            genres.update(manga.genre_names)
+            tags.update(manga.tag_names)
+            publishers.update(manga.publisher_names)
                 
         # Insert new authors
         new_authors = [(name,) for name in authors if name not in self.authors_cache]
@@ -294,33 +510,45 @@ class MangaBulkImporter:
         if not data:
             return
             
+        names = [item[0] for item in data]
         with self.conn.cursor() as cur:
-            query = f"""
-                INSERT INTO {table_name} (name) 
-                VALUES %s 
-                ON CONFLICT (name) DO NOTHING
-                RETURNING name, id
-            """
-            
-            execute_values(cur, query, data, template=None, page_size=self.batch_size)
-            results = cur.fetchall()
-            
+            # One round trip: newly inserted rows come back from the CTE, existing ones from the table
+            cur.execute(f"""
+                WITH ins AS (
+                    INSERT INTO {table_name} (name)
+                    SELECT unnest(%s::text[])
+                    ON CONFLICT (name) DO NOTHING
+                    RETURNING name, id
+                )
+                SELECT name, id FROM ins
+                UNION ALL
+                SELECT name, id FROM {table_name}
+                WHERE name = ANY(%s::text[])
+                  AND name NOT IN (SELECT name FROM ins)
+            """, (names, names))
+
             # Update cache
-            for name, id in results:
-                cache[name] = id
-                
-            # Get IDs for items that already existed
-            if len(results) < len(data):
-                existing_names = [item[0] for item in data]
-                placeholders = ','.join(['%s'] * len(existing_names))
-                cur.execute(f"SELECT name, id FROM {table_name} WHERE name IN ({placeholders})", 
-                           existing_names)
-                for name, id in cur.fetchall():
-                    cache[name] = id
+            for name, id in cur.fetchall():
+                cache[sys.intern(name)] = id
                     
         logger.info(f"Inserted/cached {len(data)} {table_name}")
 
 
+    @staticmethod
+    def _build_writer(table_name: str, target: str, columns: Tuple[str, ...]):
+        """Precompute one table's COPY statement and return a closure that only streams rows"""
+        binary = table_name in ID_PAIR_TABLES
+        encode = _encode_id_pairs if binary else _encode_text_rows
+        copy_sql = f"COPY {target} ({', '.join(columns)}) FROM STDIN"
+        if binary:
+            copy_sql += " WITH (FORMAT BINARY)"
+
+        def write(cur, rows: List[Tuple]):
+            cur.copy_expert(copy_sql, encode(rows))
+
+        return write
+
+
     def insert_manga_data(self, manga_list: List[MangaData]):
         """Insert main manga data"""
         manga_data = []
@@ -355,40 +583,17 @@ class MangaBulkImporter:
                 manga.total_chapters,
                 manga.last_updated_at
             ))
-            self.manga_ids.add(manga.id)
 
         with self.conn.cursor() as cur:
-            query = """
-                INSERT INTO manga (
-                    id, state, title, native_title, romanized_title,
-                    description, year, status, is_licensed, has_anime, anime,
-                    content_rating, type, rating, final_volume, final_chapter,
-                    total_chapters, last_updated_at
-                ) VALUES %s
-                ON CONFLICT (id) DO UPDATE SET
-                    state = EXCLUDED.state,
-                    title = EXCLUDED.title,
-                    native_title = EXCLUDED.native_title,
-                    romanized_title = EXCLUDED.romanized_title,
-                    description = EXCLUDED.description,
-                    year = EXCLUDED.year,
-                    status = EXCLUDED.status,
-                    is_licensed = EXCLUDED.is_licensed,
-                    has_anime = EXCLUDED.has_anime,
-                    anime = EXCLUDED.anime,
-                    content_rating = EXCLUDED.content_rating,
-                    rating = EXCLUDED.rating,
-                    final_volume = EXCLUDED.final_volume,
-                    final_chapter = EXCLUDED.final_chapter,
-                    total_chapters = EXCLUDED.total_chapters,
-                    last_updated_at = EXCLUDED.last_updated_at,
-                    updated_at = CURRENT_TIMESTAMP
-            """
-            
-            execute_values(cur, query, manga_data, template=None, page_size=self.batch_size)
+            self.writers['manga'](cur, manga_data)
+
+        logger.info(f"Staged {len(manga_data)} manga records")
 
-        logger.info(f"Inserted {len(manga_data)} manga records")
 
+    def merge_batch(self):
+        """Merge every staged table into place with the prepared fused statement"""
+        with self.conn.cursor() as cur:
+            cur.execute("EXECUTE merge_batch")
 
     def insert_related_data(self, manga_list: List[MangaData]):
         """Insert all related data (covers, links, relationships, etc.)"""
@@ -421,14 +626,13 @@ class MangaBulkImporter:
                                     title_info.get('note')
                                 ))
                                 
+        # Drop rows repeated within the batch before they go over the wire
+        data = list(dict.fromkeys(data))
+
         if data:
             with self.conn.cursor() as cur:
-                query = """
-                    INSERT INTO manga_secondary_titles (manga_id, language_code, title, type, note)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """
-                execute_values(cur, query, data, template=None, page_size=self.batch_size)
-            logger.info(f"Inserted {len(data)} secondary titles")
+                self.writers['manga_secondary_titles'](cur, data)
+            logger.info(f"Staged {len(data)} secondary titles")
             
     def _insert_covers(self, manga_list: List[MangaData]):
         """Insert cover images"""
@@ -439,104 +643,77 @@ class MangaBulkImporter:
                     if url:
                         data.append((manga.id, cover_type, url))
                         
+        data = list(dict.fromkeys(data))
+
         if data:
             with self.conn.cursor() as cur:
-                query = """
-                    INSERT INTO manga_covers (manga_id, type, url)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """
-                execute_values(cur, query, data, template=None, page_size=self.batch_size)
-            logger.info(f"Inserted {len(data)} cover images")
+                self.writers['manga_covers'](cur, data)
+            logger.info(f"Staged {len(data)} cover images")
             
     def _insert_manga_authors(self, manga_list: List[MangaData]):
         """Insert manga-author relationships"""
         data = []
         for manga in manga_list:
-            author_names = self._extract_names(manga.authors)
-            for author_name in author_names:
+            for author_name in manga.author_names:
                 if author_name in self.authors_cache:
                     data.append((manga.id, self.authors_cache[author_name]))
                     
         if data:
             with self.conn.cursor() as cur:
-                query = """
-                    INSERT INTO manga_authors (manga_id, author_id)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """
-                execute_values(cur, query, data, template=None, page_size=self.batch_size)
-            logger.info(f"Inserted {len(data)} manga-author relationships")
+                self.writers['manga_authors'](cur, data)
+            logger.info(f"Staged {len(data)} manga-author relationships")
             
     def _insert_manga_artists(self, manga_list: List[MangaData]):
         """Insert manga-artist relationships"""
         data = []
         for manga in manga_list:
-            artist_names = self._extract_names(manga.artists)
-            for artist_name in artist_names:
+            for artist_name in manga.artist_names:
                 if artist_name in self.artists_cache:
                     data.append((manga.id, self.artists_cache[artist_name]))
                     
         if data:
             with self.conn.cursor() as cur:
-                query = """
-                    INSERT INTO manga_artists (manga_id, artist_id)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """
-                execute_values(cur, query, data, template=None, page_size=self.batch_size)
-            logger.info(f"Inserted {len(data)} manga-artist relationships")
+                self.writers['manga_artists'](cur, data)
+            logger.info(f"Staged {len(data)} manga-artist relationships")
             
     def _insert_manga_genres(self, manga_list: List[MangaData]):
         """Insert manga-genre relationships"""
         data = []
         for manga in manga_list:
-            genre_names = self._extract_names(manga.genres)
-            for genre_name in genre_names:
+            for genre_name in manga.genre_names:
                 if genre_name in self.genres_cache:
                     data.append((manga.id, self.genres_cache[genre_name]))
                     
         if data:
             with self.conn.cursor() as cur:
-                query = """
-                    INSERT INTO manga_genres (manga_id, genre_id)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """
-                execute_values(cur, query, data, template=None, page_size=self.batch_size)
-            logger.info(f"Inserted {len(data)} manga-genre relationships")
+                self.writers['manga_genres'](cur, data)
+            logger.info(f"Staged {len(data)} manga-genre relationships")
             
     def _insert_manga_tags(self, manga_list: List[MangaData]):
         """Insert manga-tag relationships"""
         data = []
         for manga in manga_list:
-            tag_names = self._extract_names(manga.tags)
-            for tag_name in tag_names:
+            for tag_name in manga.tag_names:
                 if tag_name in self.tags_cache:
                     data.append((manga.id, self.tags_cache[tag_name]))
                     
         if data:
             with self.conn.cursor() as cur:
-                query = """
-                    INSERT INTO manga_tags (manga_id, tag_id)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """
-                execute_values(cur, query, data, template=None, page_size=self.batch_size)
-            logger.info(f"Inserted {len(data)} manga-tag relationships")
+                self.writers['manga_tags'](cur, data)
+            logger.info(f"Staged {len(data)} manga-tag relationships")
             
     def _insert_manga_publishers(self, manga_list: List[MangaData]):
         """Insert manga-publisher relationships"""
         data = []
         for manga in manga_list:
-            publisher_names = self._extract_names(manga.publishers)
-            for publisher_name in publisher_names:
+            for publisher_name in manga.publisher_names:
                 if publisher_name in self.publishers_cache:
                     data.append((manga.id, self.publishers_cache[publisher_name]))
                     
         if data:
             with self.conn.cursor() as cur:
-                query = """
-                    INSERT INTO manga_publishers (manga_id, publisher_id)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """
-                execute_values(cur, query, data, template=None, page_size=self.batch_size)
-            logger.info(f"Inserted {len(data)} manga-publisher relationships")
+                self.writers['manga_publishers'](cur, data)
+            logger.info(f"Staged {len(data)} manga-publisher relationships")
             
     def _insert_links(self, manga_list: List[MangaData]):
         """Insert external links"""
@@ -545,46 +722,50 @@ class MangaBulkImporter:
             for link in manga.links or []:
                 if link:
                     # Determine link type based on domain
-                    link_type = 'unknown'
-                    if 'fakku.net' in link:
-                        link_type = 'store'
-                    elif 'mangadex' in link or 'mangabaka' in link:
-                        link_type = 'reader'
-                    elif 'anilist' in link or 'myanimelist' in link:
-                        link_type = 'database'
-                        
+                    m = LINK_TYPE_RE.search(link)
+                    link_type = LINK_TYPES[m.lastindex - 1] if m else 'unknown'
+
                     data.append((manga.id, link, link_type))
                     
+        data = list(dict.fromkeys(data))
+
         if data:
             with self.conn.cursor() as cur:
-                query = """
-                    INSERT INTO manga_links (manga_id, url, link_type)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """
-                execute_values(cur, query, data, template=None, page_size=self.batch_size)
-            logger.info(f"Inserted {len(data)} external links")
+                self.writers['manga_links'](cur, data)
+            logger.info(f"Staged {len(data)} external links")
 
 
     def _insert_relationships(self, manga_list: List[MangaData]):
-        """Insert manga relationships"""
+        """Stage manga relationships; they are merged by flush_relationships"""
         data = []
         for manga in manga_list:
             if manga.relationships:
                 for rel_type, related_ids in manga.relationships.items():
                     if isinstance(related_ids, list):
                         for related_id in related_ids:
-                            # check if related_id is in manga_ids
-                            if related_id in self.manga_ids:
-                                data.append((manga.id, related_id, rel_type))
+                            data.append((manga.id, related_id, rel_type))
+
+        data = list(dict.fromkeys(data))
 
         if data:
             with self.conn.cursor() as cur:
-                query = """
-                    INSERT INTO manga_relationships (manga_id, related_manga_id, relationship_type)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """
-                execute_values(cur, query, data, template=None, page_size=self.batch_size)
-            logger.info(f"Inserted {len(data)} manga relationships")
+                self.writers['manga_relationships_stage'](cur, data)
+            logger.info(f"Staged {len(data)} manga relationships")
+
+    def flush_relationships(self):
+        """Merge staged relationships whose target manga exists in the database"""
+        column_list = ', '.join(RELATIONSHIP_COLUMNS)
+        with self.conn.cursor() as cur:
+            cur.execute(f"""
+                INSERT INTO manga_relationships ({column_list})
+                SELECT {column_list} FROM manga_relationships_stage s
+                WHERE EXISTS (SELECT 1 FROM manga m WHERE m.id = s.related_manga_id)
+                ON CONFLICT DO NOTHING
+            """)
+            inserted = cur.rowcount
+            cur.execute("TRUNCATE manga_relationships_stage")
+        self.conn.commit()
+        logger.info(f"Inserted {inserted} manga relationships")
 
 
     def _insert_external_sources(self, manga_list: List[MangaData]):
@@ -602,48 +783,60 @@ class MangaBulkImporter:
                             source_data.get('rating'),
                             source_data.get('cover'),
                             source_data.get('last_updated_at'),
-                            json.dumps(source_data.get('response')) if source_data.get('response') else None,
-                            json.dumps(source_data.get('statistics')) if source_data.get('statistics') else None
+                            orjson.dumps(source_data['response']).decode('utf-8') if source_data.get('response') else None,
+                            orjson.dumps(source_data['statistics']).decode('utf-8') if source_data.get('statistics') else None
                         ))
                         
         if data:
             with self.conn.cursor() as cur:
-                query = """
-                    INSERT INTO manga_external_sources (
-                        manga_id, source_id, external_id, rating, cover_url,
-                        last_updated_at, response_data, statistics
-                    ) VALUES %s
-                    ON CONFLICT (manga_id, source_id) DO UPDATE SET
-                        external_id = EXCLUDED.external_id,
-                        rating = EXCLUDED.rating,
-                        cover_url = EXCLUDED.cover_url,
-                        last_updated_at = EXCLUDED.last_updated_at,
-                        response_data = EXCLUDED.response_data,
-                        statistics = EXCLUDED.statistics
-                """
-                execute_values(cur, query, data, template=None, page_size=self.batch_size)
-            logger.info(f"Inserted {len(data)} external source records")
-
-
-    def import_file(self, file_path: str):
+                self.writers['manga_external_sources'](cur, data)
+            logger.info(f"Staged {len(data)} external source records")
+
+
+    def drop_secondary_indexes(self) -> List[str]:
+        """Drop indexes not backing a constraint on the loaded tables and return their definitions"""
+        with self.conn.cursor() as cur:
+            cur.execute("""
+                SELECT i.indexrelid::regclass::text, pg_get_indexdef(i.indexrelid)
+                FROM pg_index i
+                WHERE i.indrelid = ANY(%s::regclass[])
+                  AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+            """, (list(LOADED_TABLES),))
+            indexes = cur.fetchall()
+            for index_name, _ in indexes:
+                cur.execute(f"DROP INDEX {index_name}")
+        self.conn.commit()
+        logger.info(f"Dropped {len(indexes)} secondary indexes for initial load")
+        return [definition for _, definition in indexes]
+
+    def restore_indexes(self, definitions: List[str]):
+        """Recreate indexes dropped by drop_secondary_indexes"""
+        with self.conn.cursor() as cur:
+            for definition in definitions:
+                cur.execute(definition)
+        self.conn.commit()
+        logger.info(f"Rebuilt {len(definitions)} secondary indexes")
+
+    def refresh_materialized_views(self):
+        """Rebuild the views derived from the imported rows so the API serves them"""
+        with self.conn.cursor() as cur:
+            for view in MATERIALIZED_VIEWS:
+                cur.execute(f"REFRESH MATERIALIZED VIEW {view}")
+        self.conn.commit()
+        logger.info(f"Refreshed {len(MATERIALIZED_VIEWS)} materialized views")
+
+    def import_file(self, file_path: str, initial_load: bool = False):
         """Main import function"""
+        dropped_indexes = self.drop_secondary_indexes() if initial_load else []
         try:
             logger.info(f"Starting import of {file_path}")
             
-            # Parse JSONL file
-            manga_list = self.parse_jsonl_file(file_path)
-            if not manga_list:
-                logger.warning("No manga data found in file")
-                return
+            # Stream the file in batches so only one batch is held in memory
+            total_records = 0
+            for batch_num, batch in enumerate(self.iter_batches(file_path), 1):
+                total_records += len(batch)
 
-
-            # Process in batches
-            for i in range(0, len(manga_list), self.batch_size):
-                batch = manga_list[i:i + self.batch_size]
-                batch_num = i // self.batch_size + 1
-                total_batches = (len(manga_list) + self.batch_size - 1) // self.batch_size
-
-                logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} records)")
+                logger.info(f"Processing batch {batch_num} ({len(batch)} records)")
 
                 lookup_done = False
                 manga_data_done = False
@@ -661,9 +854,10 @@ class MangaBulkImporter:
                     self.insert_manga_data(batch)
                     manga_data_done = True
 
-                    # # Insert related data
-                    # self.insert_related_data(batch)
-                    # related_data_done = True
+                    # Insert related data; relationships are only staged until the final flush
+                    self.insert_related_data(batch)
+                    self.merge_batch()
+                    related_data_done = True
 
                     # Commit transaction
                     self.conn.commit()
@@ -683,45 +877,59 @@ class MangaBulkImporter:
 
                     raise
 
-            # Process in batches
-            for i in range(0, len(manga_list), self.batch_size):
-                batch = manga_list[i:i + self.batch_size]
-                batch_num = i // self.batch_size + 1
-                total_batches = (len(manga_list) + self.batch_size - 1) // self.batch_size
-
-                logger.info(f"Processing batch {batch_num}/{total_batches} ({len(batch)} records)")
-
-                lookup_done = False
-                manga_data_done = False
-                related_data_done = False
-                try:
-                    # Start transaction
-                    with self.conn.cursor() as cur:
-                        cur.execute("BEGIN")
-
-                    # Insert related data
-                    self.insert_related_data(batch)
-                    related_data_done = True
-
-                    # Commit transaction
-                    self.conn.commit()
-                    logger.info(f"Batch {batch_num} completed successfully")
-
-                except Exception as e:
-                    self.conn.rollback()
-                    logger.error(f"Error processing batch {batch_num}: {e}")
-                    if not related_data_done:
-                        logger.error("Related data insertion failed, rolling back")
-                    else:
-                        logger.error("Unknown error occurred, rolling back")
+            if not total_records:
+                logger.warning("No manga data found in file")
+                return
 
-                    raise
+            try:
+                self.flush_relationships()
+            except Exception as e:
+                self.conn.rollback()
+                logger.error(f"Relationship insertion failed, rolling back: {e}")
+                raise
 
-            logger.info(f"Import completed successfully. Total records: {len(manga_list)}")
+            logger.info(f"Import completed successfully. Total records: {total_records}")
             
         except Exception as e:
             logger.error(f"Import failed: {e}")
             raise
+        finally:
+            if dropped_indexes:
+                self.conn.rollback()
+                self.restore_indexes(dropped_indexes)
+
+
+def _iter_lines(file_path: str) -> Iterator[bytes]:
+    """Yield raw lines from a memory-mapped file without decoding them to str"""
+    with open(file_path, 'rb') as file:
+        try:
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return
+        with mm:
+            start = 0
+            size = len(mm)
+            while start < size:
+                end = mm.find(b'\n', start)
+                if end == -1:
+                    end = size
+                yield mm[start:end]
+                start = end + 1
+
+
+def _parse_line(line: bytes) -> Tuple[Optional[MangaData], Optional[str]]:
+    """Decode and parse one JSONL line; module level so worker processes can pickle it"""
+    line = line.strip()
+    if not line:
+        return None, None
+
+    try:
+        return MangaBulkImporter._parse_manga_json(orjson.loads(line)), None
+    except orjson.JSONDecodeError as e:
+        return None, f"JSON decode error: {e}"
+    except Exception as e:
+        return None, str(e)
 
 
 @click.command()
@@ -732,14 +940,16 @@ class MangaBulkImporter:
 @click.option('--username', '-u', required=True, help='Database username')
 @click.option('--password', '-p', prompt=True, hide_input=True, help='Database password')
 @click.option('--batch-size', default=1000, help='Batch size for bulk operations')
-def main(file, host, port, database, username, password, batch_size):
+@click.option('--workers', default=1, help='Worker processes used to parse the JSONL file')
+@click.option('--initial-load', is_flag=True, help='Drop secondary indexes during the load and rebuild them afterwards')
+def main(file, host, port, database, username, password, batch_size, workers, initial_load):
     """Import manga data from JSONL file to PostgreSQL database"""
     
     # Build connection string
     connection_string = f"host={host} port={port} dbname={database} user={username} password={password}"
     
     # Create importer
-    importer = MangaBulkImporter(connection_string, batch_size)
+    importer = MangaBulkImporter(connection_string, batch_size, workers)
 
     try:
         # Connect to database
@@ -749,7 +959,10 @@ def main(file, host, port, database, username, password, batch_size):
         importer.load_caches()
 
         # Import file
-        importer.import_file(file)
+        importer.import_file(file, initial_load=initial_load)
+
+        # After import_file so any dropped indexes are back for the rebuild
+        importer.refresh_materialized_views()
         
     except Exception as e:
         logger.error(f"Import failed: {e}")
@@ -4,51 +4,228 @@ Simple JSONL Manga Import Script
 Simplified version for basic manga data import
 """
 
-import json
-import psycopg2
-from psycopg2.extras import execute_values
+import asyncio
+import csv
+import io
+import os
+import re
+import asyncpg
+import orjson
 import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import chain, islice
 
 
-def connect_db(host, port, database, username, password):
+# Records parsed, transformed and written per transaction
+BATCH_SIZE = 10000
+
+# Bytes of JSONL handed to a parse worker at a time
+CHUNK_BYTES = 32 * 1024 * 1024
+
+# Single-pass link classification; the matching group index selects the link type
+LINK_TYPE_RE = re.compile(r'(fakku\.net)|(mangadex|mangabaka)')
+LINK_TYPES = ('store', 'reader')
+
+# Manga fields holding lookup-table names
+LOOKUP_FIELDS = ('authors', 'artists', 'genres', 'publishers')
+
+# Tables written by the import; their secondary indexes are rebuilt after an initial load
+IMPORT_TABLES = [
+    'manga', 'manga_covers', 'manga_links', 'manga_secondary_titles',
+    'manga_authors', 'manga_artists', 'manga_genres', 'manga_publishers',
+    'manga_external_sources',
+]
+
+# Materialized views over the imported tables; the API refreshes them only after its own writes
+MATERIALIZED_VIEWS = ['manga_search_facets', 'mv_year_distribution', 'mv_rating_distribution']
+
+
+async def connect_db(host, port, database, username, password):
     """Connect to PostgreSQL database"""
     try:
-        conn = psycopg2.connect(
+        conn = await asyncpg.connect(
             host=host,
             port=port,
             database=database,
             user=username,
             password=password
         )
-        conn.autocommit = False
         print("✓ Connected to database")
         return conn
     except Exception as e:
         print(f"✗ Database connection failed: {e}")
         sys.exit(1)
 
-def read_jsonl_file(file_path):
-    """Read and parse JSONL file"""
-    manga_data = []
+def dump_json(value):
+    """Serialize a JSONB value to text, or None when empty"""
+    return orjson.dumps(value).decode() if value else None
+
+def prepare_manga(manga):
+    """
+    Turn one parsed manga into its per-table rows.
+    Runs in the parse workers, so classification and JSON encoding stay off the writer process.
+    """
+    manga_id = manga.get('id')
+    if not manga_id:
+        return None
     
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            for line_num, line in enumerate(file, 1):
-                line = line.strip()
-                if not line:
-                    continue
-                    
+    # Main manga record
+    manga_row = (
+        manga_id,
+        manga.get('state', 'active'),
+        manga.get('merged_with'),
+        manga.get('title', ''),
+        manga.get('native_title'),
+        manga.get('romanized_title'),
+        manga.get('description'),
+        manga.get('year'),
+        manga.get('status'),
+        manga.get('is_licensed', False),
+        manga.get('has_anime', False),
+        dump_json(manga.get('anime')),
+        manga.get('content_rating'),
+        manga.get('type', 'manga'),
+        manga.get('rating'),
+        manga.get('final_volume'),
+        manga.get('final_chapter'),
+        manga.get('total_chapters'),
+        manga.get('last_updated_at', datetime.now().isoformat())
+    )
+    
+    # Cover images
+    covers = []
+    if manga.get('cover'):
+        for cover_type, url in manga['cover'].items():
+            if url:
+                covers.append((manga_id, cover_type, url))
+    
+    # External links
+    links = []
+    for link in manga.get('links', []):
+        if link:
+            m = LINK_TYPE_RE.search(link)
+            link_type = LINK_TYPES[m.lastindex - 1] if m else 'unknown'
+            links.append((manga_id, link, link_type))
+    
+    # Secondary titles
+    secondary_titles = []
+    if manga.get('secondary_titles'):
+        for lang_code, titles in manga['secondary_titles'].items():
+            if isinstance(titles, list):
+                for title_info in titles:
+                    if isinstance(title_info, dict) and title_info.get('title'):
+                        secondary_titles.append((
+                            manga_id,
+                            lang_code,
+                            title_info['title'],
+                            title_info.get('type'),
+                            title_info.get('note')
+                        ))
+    
+    # External sources, keyed by source name until the writer resolves the id
+    sources = []
+    if manga.get('source'):
+        for source_name, source_data in manga['source'].items():
+            if source_data:
+                sources.append((
+                    manga_id,
+                    source_name,
+                    source_data.get('id'),
+                    source_data.get('rating'),
+                    source_data.get('cover'),
+                    source_data.get('last_updated_at'),
+                    dump_json(source_data.get('response')),
+                    dump_json(source_data.get('statistics'))
+                ))
+    
+    return {
+        'id': manga_id,
+        'manga': manga_row,
+        'covers': covers,
+        'links': links,
+        'secondary_titles': secondary_titles,
+        'sources': sources,
+        'authors': manga.get('authors'),
+        'artists': manga.get('artists'),
+        'genres': manga.get('genres'),
+        'publishers': manga.get('publishers'),
+    }
+
+def read_jsonl_lines(file_path):
+    """Parse and prepare a JSONL file line by line in this process"""
+    with open(file_path, 'rb') as file:
+        for line_num, line in enumerate(file, 1):
+            # orjson accepts the surrounding whitespace, so only blank lines need skipping
+            if line.isspace():
+                continue
+                
+            try:
+                record = prepare_manga(orjson.loads(line))
+            except orjson.JSONDecodeError as e:
+                print(f"Warning: JSON error at line {line_num}: {e}")
+                continue
+            if record:
+                yield record
+
+            if line_num % 1000 == 0:
+                print(f"Parsed {line_num} lines...")
+
+def parse_jsonl_range(file_path, start, end):
+    """Parse and prepare the JSONL records that begin inside the byte range [start, end)"""
+    records = []
+    with open(file_path, 'rb') as file:
+        if start:
+            # Step back one byte so a range starting exactly on a record keeps it
+            file.seek(start - 1)
+            file.readline()
+        line_start = file.tell()
+        while line_start < end:
+            line = file.readline()
+            if not line:
+                break
+            if not line.isspace():
                 try:
-                    data = json.loads(line)
-                    manga_data.append(data)
-                    
-                    if line_num % 1000 == 0:
-                        print(f"Parsed {line_num} lines...")
-                        
-                except json.JSONDecodeError as e:
-                    print(f"Warning: JSON error at line {line_num}: {e}")
-                    continue
+                    record = prepare_manga(orjson.loads(line))
+                except orjson.JSONDecodeError as e:
+                    print(f"Warning: JSON error at byte {line_start}: {e}")
+                else:
+                    if record:
+                        records.append(record)
+            line_start += len(line)
+    return records
+
+def read_jsonl_parallel(file_path, workers):
+    """Parse newline-aligned byte ranges of a JSONL file across worker processes"""
+    size = os.path.getsize(file_path)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Keep a bounded window of ranges in flight and yield them in file order
+        pending = deque()
+        for start in range(0, size, CHUNK_BYTES):
+            end = min(start + CHUNK_BYTES, size)
+            pending.append((end, pool.submit(parse_jsonl_range, file_path, start, end)))
+            if len(pending) >= workers * 2:
+                done_at, future = pending.popleft()
+                yield from future.result()
+                print(f"Parsed {done_at} of {size} bytes...")
+        while pending:
+            _, future = pending.popleft()
+            yield from future.result()
+
+def iter_jsonl(file_path, workers=1):
+    """Lazily read and parse a JSONL file, one record at a time"""
+    parsed = 0
+    
+    try:
+        if workers > 1:
+            records = read_jsonl_parallel(file_path, workers)
+        else:
+            records = read_jsonl_lines(file_path)
+
+        for data in records:
+            parsed += 1
+            yield data
                     
     except FileNotFoundError:
         print(f"✗ File not found: {file_path}")
@@ -57,325 +234,301 @@ def read_jsonl_file(file_path):
         print(f"✗ Error reading file: {e}")
         sys.exit(1)
         
-    print(f"✓ Parsed {len(manga_data)} manga records")
-    return manga_data
+    print(f"✓ Parsed {parsed} manga records")
+
+def iter_batches(records, batch_size=BATCH_SIZE):
+    """Group an iterable of records into lists of at most batch_size"""
+    while batch := list(islice(records, batch_size)):
+        yield batch
 
 
-def get_or_create_lookup_ids(conn, table_name, names):
+async def get_or_create_lookup_ids(conn, table_name, names):
     """Get or create IDs for lookup table entries"""
     if not names:
         return {}
-        
-    name_to_id = {}
     
-    with conn.cursor() as cur:
-        # Get existing IDs
-        placeholders = ','.join(['%s'] * len(names))
-        cur.execute(f"SELECT name, id FROM {table_name} WHERE name IN ({placeholders})", list(names))
-        name_to_id = {name: id for name, id in cur.fetchall()}
-        
-        # Insert new entries
-        new_names = [name for name in names if name not in name_to_id]
-        if new_names:
-            data = [(name,) for name in new_names]
-            cur.execute(f"INSERT INTO {table_name} (name) VALUES %s ON CONFLICT (name) DO NOTHING RETURNING name, id", data)
-            for name, id in cur.fetchall():
-                name_to_id[name] = id
-                
-            # Get IDs for entries that already existed (conflict case)
-            if len(name_to_id) < len(names):
-                missing_names = [name for name in new_names if name not in name_to_id]
-                if missing_names:
-                    placeholders = ','.join(['%s'] * len(missing_names))
-                    cur.execute(f"SELECT name, id FROM {table_name} WHERE name IN ({placeholders})", missing_names)
-                    for name, id in cur.fetchall():
-                        name_to_id[name] = id
+    # One round trip: new rows come back from the insert, existing ones from the join
+    rows = await conn.fetch(f"""
+        WITH input AS (SELECT unnest($1::text[]) AS name),
+        ins AS (
+            INSERT INTO {table_name} (name)
+            SELECT name FROM input
+            ON CONFLICT (name) DO NOTHING
+            RETURNING name, id
+        )
+        SELECT name, id FROM ins
+        UNION ALL
+        SELECT t.name, t.id FROM {table_name} t JOIN input USING (name)
+    """, list(names))
     
-    return name_to_id
+    return {sys.intern(row['name']): row['id'] for row in rows}
+
+async def copy_rows(conn, table_name, columns, rows):
+    """Stream rows into a table with COPY ... FORMAT CSV"""
+    buf = io.StringIO()
+    # QUOTE_NOTNULL leaves only None unquoted, which COPY reads back as NULL
+    csv.writer(buf, quoting=csv.QUOTE_NOTNULL).writerows(rows)
+    await conn.copy_to_table(table_name, source=io.BytesIO(buf.getvalue().encode('utf-8')),
+                             columns=list(columns), format='csv')
+
+async def copy_and_merge(conn, table_name, columns, rows, key, when_matched=""):
+    """
+    COPY rows into a temporary stage table, then apply them with a single MERGE.
+    Rows matching `key` are left alone unless `when_matched` supplies an action for them.
+    When a key repeats within `rows`, only its last row is merged.
+    """
+    column_list = ', '.join(columns)
+    stage_table = f"{table_name}_stage"
+    await conn.execute(f"""
+        CREATE TEMP TABLE {stage_table} ON COMMIT DROP AS
+        SELECT {column_list} FROM {table_name} WITH NO DATA
+    """)
+    await copy_rows(conn, stage_table, columns, rows)
+    # MERGE may touch each target row once, so duplicate keys are collapsed first; the stage is
+    # filled in input order, so the highest ctid per key is the latest row
+    key_list = ', '.join(key)
+    await conn.execute(f"""
+        MERGE INTO {table_name} t
+        USING (
+            SELECT DISTINCT ON ({key_list}) {column_list} FROM {stage_table}
+            ORDER BY {key_list}, ctid DESC
+        ) s ON {' AND '.join(f't.{column} = s.{column}' for column in key)}
+        {when_matched}
+        WHEN NOT MATCHED THEN
+            INSERT ({column_list}) VALUES ({', '.join(f's.{column}' for column in columns)})
+    """)
+
+async def insert_id_pairs(conn, table_name, id_column, manga_ids, lookup_ids):
+    """Insert (manga_id, lookup id) pairs in one statement from two parallel arrays"""
+    await conn.execute(f"""
+        INSERT INTO {table_name} (manga_id, {id_column})
+        SELECT * FROM unnest($1::bigint[], $2::int[])
+        ON CONFLICT DO NOTHING
+    """, manga_ids, lookup_ids)
+
+def resolve_relation_ids(manga_data, field, id_map):
+    """Resolve one lookup field for the whole batch into (manga ids, lookup ids) columns"""
+    manga_ids = []
+    names = []
+    for manga in manga_data:
+        values = manga.get(field)
+        if values and manga.get('id'):
+            manga_ids.extend([manga['id']] * len(values))
+            names.extend(values)
+    # Every collected name was inserted or found, so the probes run in one C-level map
+    return manga_ids, list(map(id_map.__getitem__, names))
+
+async def drop_secondary_indexes(conn):
+    """Drop indexes that do not back a constraint and return their definitions"""
+    async with conn.transaction():
+        # Primary keys and unique constraints stay, ON CONFLICT needs them
+        indexes = await conn.fetch("""
+            SELECT i.indexrelid::regclass::text AS name, pg_get_indexdef(i.indexrelid) AS definition
+            FROM pg_index i
+            WHERE i.indrelid = ANY($1::regclass[])
+              AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+        """, IMPORT_TABLES)
+        for index in indexes:
+            await conn.execute(f"DROP INDEX {index['name']}")
+    print(f"✓ Dropped {len(indexes)} secondary indexes for initial load")
+    return [index['definition'] for index in indexes]
+
+async def restore_indexes(conn, definitions):
+    """Rebuild indexes dropped by drop_secondary_indexes in bulk"""
+    async with conn.transaction():
+        await conn.execute("SET LOCAL maintenance_work_mem = '1GB'")
+        await conn.execute("SET LOCAL max_parallel_maintenance_workers = 4")
+        for definition in definitions:
+            await conn.execute(definition)
+    print(f"✓ Rebuilt {len(definitions)} secondary indexes")
+
+async def refresh_materialized_views(conn):
+    """Rebuild the views derived from the imported rows so the API serves them"""
+    for view in MATERIALIZED_VIEWS:
+        await conn.execute(f"REFRESH MATERIALIZED VIEW {view}")
+    print(f"✓ Refreshed {len(MATERIALIZED_VIEWS)} materialized views")
 
-def import_manga_simple(conn, manga_data):
+async def import_manga_simple(conn, manga_data):
     """Import manga data with simplified approach"""
     
     print("Starting import process...")
     
-    # Collect all unique lookup values
-    all_authors = set()
-    all_artists = set()
-    all_genres = set()
-    all_publishers = set()
-    
+    # Intern names so a name repeated across manga is one object for every later dict lookup
     for manga in manga_data:
-        all_authors.update(manga.get('authors', []))
-        all_artists.update(manga.get('artists', []))
-        all_genres.update(manga.get('genres', []))
-        if manga.get('publishers'):
-            all_publishers.update(manga.get('publishers', []))
+        for field in LOOKUP_FIELDS:
+            if manga.get(field):
+                manga[field] = [sys.intern(name) for name in manga[field]]
+    
+    # Collect all unique lookup values
+    all_authors = dict.fromkeys(chain.from_iterable(manga.get('authors') or [] for manga in manga_data))
+    all_artists = dict.fromkeys(chain.from_iterable(manga.get('artists') or [] for manga in manga_data))
+    all_genres = dict.fromkeys(chain.from_iterable(manga.get('genres') or [] for manga in manga_data))
+    all_publishers = dict.fromkeys(chain.from_iterable(manga.get('publishers') or [] for manga in manga_data))
     
     print(f"Found {len(all_authors)} unique authors, {len(all_artists)} artists, {len(all_genres)} genres")
     
     # Get/create lookup IDs
-    author_ids = get_or_create_lookup_ids(conn, 'authors', all_authors)
-    artist_ids = get_or_create_lookup_ids(conn, 'artists', all_artists)
-    genre_ids = get_or_create_lookup_ids(conn, 'genres', all_genres)
-    publisher_ids = get_or_create_lookup_ids(conn, 'publishers', all_publishers)
+    author_ids = await get_or_create_lookup_ids(conn, 'authors', all_authors)
+    artist_ids = await get_or_create_lookup_ids(conn, 'artists', all_artists)
+    genre_ids = await get_or_create_lookup_ids(conn, 'genres', all_genres)
+    publisher_ids = await get_or_create_lookup_ids(conn, 'publishers', all_publishers)
     
     # Get external source IDs
-    source_ids = {}
-    with conn.cursor() as cur:
-        cur.execute("SELECT name, id FROM external_sources")
-        source_ids = {name: id for name, id in cur.fetchall()}
+    source_ids = {row['name']: row['id'] for row in await conn.fetch("SELECT name, id FROM external_sources")}
     
     # Prepare manga data for insertion
     manga_records = []
     cover_records = []
     link_records = []
-    author_relations = []
-    artist_relations = []
-    genre_relations = []
-    publisher_relations = []
     secondary_titles = []
     external_source_records = []
     
-    for manga in manga_data:
-        manga_id = manga.get('id')
-        if not manga_id:
-            continue
-            
-        # Main manga record
-        manga_records.append((
-            manga_id,
-            manga.get('state', 'active'),
-            manga.get('merged_with'),
-            manga.get('title', ''),
-            manga.get('native_title'),
-            manga.get('romanized_title'),
-            manga.get('description'),
-            manga.get('year'),
-            manga.get('status'),
-            manga.get('is_licensed', False),
-            manga.get('has_anime', False),
-            manga.get('anime'),
-            manga.get('content_rating'),
-            manga.get('type', 'manga'),
-            manga.get('rating'),
-            manga.get('final_volume'),
-            manga.get('final_chapter'),
-            manga.get('total_chapters'),
-            manga.get('last_updated_at', datetime.now().isoformat())
-        ))
-        
-        # Cover images
-        if manga.get('cover'):
-            for cover_type, url in manga['cover'].items():
-                if url:
-                    cover_records.append((manga_id, cover_type, url))
-        
-        # External links
-        for link in manga.get('links', []):
-            if link:
-                link_type = 'unknown'
-                if 'fakku.net' in link:
-                    link_type = 'store'
-                elif any(domain in link for domain in ['mangadex', 'mangabaka']):
-                    link_type = 'reader'
-                link_records.append((manga_id, link, link_type))
-        
-        # Author relationships
-        for author_name in manga.get('authors', []):
-            if author_name in author_ids:
-                author_relations.append((manga_id, author_ids[author_name]))
-        
-        # Artist relationships
-        for artist_name in manga.get('artists', []):
-            if artist_name in artist_ids:
-                artist_relations.append((manga_id, artist_ids[artist_name]))
-        
-        # Genre relationships
-        for genre_name in manga.get('genres', []):
-            if genre_name in genre_ids:
-                genre_relations.append((manga_id, genre_ids[genre_name]))
-        
-        # Publisher relationships
-        for publisher_name in manga.get('publishers', []):
-            if publisher_name in publisher_ids:
-                publisher_relations.append((manga_id, publisher_ids[publisher_name]))
-        
-        # Secondary titles
-        if manga.get('secondary_titles'):
-            for lang_code, titles in manga['secondary_titles'].items():
-                if isinstance(titles, list):
-                    for title_info in titles:
-                        if isinstance(title_info, dict) and title_info.get('title'):
-                            secondary_titles.append((
-                                manga_id,
-                                lang_code,
-                                title_info['title'],
-                                title_info.get('type'),
-                                title_info.get('note')
-                            ))
-        
-        # External sources
-        if manga.get('source'):
-            for source_name, source_data in manga['source'].items():
-                if source_name in source_ids and source_data:
-                    external_source_records.append((
-                        manga_id,
-                        source_ids[source_name],
-                        source_data.get('id'),
-                        source_data.get('rating'),
-                        source_data.get('cover'),
-                        source_data.get('last_updated_at'),
-                        json.dumps(source_data.get('response')) if source_data.get('response') else None,
-                        json.dumps(source_data.get('statistics')) if source_data.get('statistics') else None
-                    ))
+    for record in manga_data:
+        manga_records.append(record['manga'])
+        cover_records.extend(record['covers'])
+        link_records.extend(record['links'])
+        secondary_titles.extend(record['secondary_titles'])
+        # Source rows arrive keyed by source name; only the id lookup needs the database
+        for row in record['sources']:
+            if row[1] in source_ids:
+                external_source_records.append((row[0], source_ids[row[1]]) + row[2:])
     
-    # Insert all data
+    # Junction rows, kept column-wise (manga ids, lookup ids) to match the unnest insert
+    author_relations = resolve_relation_ids(manga_data, 'authors', author_ids)
+    artist_relations = resolve_relation_ids(manga_data, 'artists', artist_ids)
+    genre_relations = resolve_relation_ids(manga_data, 'genres', genre_ids)
+    publisher_relations = resolve_relation_ids(manga_data, 'publishers', publisher_ids)
+    
+    # Insert all data; one connection runs one statement at a time, so tables load in sequence
     try:
-        with conn.cursor() as cur:
-            cur.execute("BEGIN")
+        async with conn.transaction():
+            # The JSONL file is the source of truth, so a crash can simply be re-imported
+            await conn.execute("SET LOCAL synchronous_commit = off")
             
             # Insert main manga data
             if manga_records:
-                execute_values(cur, """
-                    INSERT INTO manga (
-                        id, state, merged_with, title, native_title, romanized_title,
-                        description, year, status, is_licensed, has_anime, anime_id,
-                        content_rating, type, rating, final_volume, final_chapter,
-                        total_chapters, last_updated_at
-                    ) VALUES %s
-                    ON CONFLICT (id) DO UPDATE SET
-                        state = EXCLUDED.state,
-                        title = EXCLUDED.title,
-                        native_title = EXCLUDED.native_title,
-                        romanized_title = EXCLUDED.romanized_title,
-                        description = EXCLUDED.description,
-                        year = EXCLUDED.year,
-                        status = EXCLUDED.status,
-                        is_licensed = EXCLUDED.is_licensed,
-                        has_anime = EXCLUDED.has_anime,
-                        anime_id = EXCLUDED.anime_id,
-                        content_rating = EXCLUDED.content_rating,
-                        rating = EXCLUDED.rating,
-                        final_volume = EXCLUDED.final_volume,
-                        final_chapter = EXCLUDED.final_chapter,
-                        total_chapters = EXCLUDED.total_chapters,
-                        last_updated_at = EXCLUDED.last_updated_at,
+                await copy_and_merge(conn, 'manga', (
+                    'id', 'state', 'merged_with', 'title', 'native_title', 'romanized_title',
+                    'description', 'year', 'status', 'is_licensed', 'has_anime', 'anime',
+                    'content_rating', 'type', 'rating', 'final_volume', 'final_chapter',
+                    'total_chapters', 'last_updated_at'
+                ), manga_records, ('id',), """
+                    WHEN MATCHED THEN UPDATE SET
+                        state = s.state,
+                        title = s.title,
+                        native_title = s.native_title,
+                        romanized_title = s.romanized_title,
+                        description = s.description,
+                        year = s.year,
+                        status = s.status,
+                        is_licensed = s.is_licensed,
+                        has_anime = s.has_anime,
+                        anime = s.anime,
+                        content_rating = s.content_rating,
+                        rating = s.rating,
+                        final_volume = s.final_volume,
+                        final_chapter = s.final_chapter,
+                        total_chapters = s.total_chapters,
+                        last_updated_at = s.last_updated_at,
                         updated_at = CURRENT_TIMESTAMP
-                """, manga_records)
+                """)
                 print(f"✓ Inserted {len(manga_records)} manga records")
             
-            # Insert covers
+            # Covers, links and secondary titles have no unique key, so COPY them straight in
             if cover_records:
-                execute_values(cur, """
-                    INSERT INTO manga_covers (manga_id, type, url)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """, cover_records)
+                await copy_rows(conn, 'manga_covers', ('manga_id', 'type', 'url'), cover_records)
                 print(f"✓ Inserted {len(cover_records)} cover images")
             
-            # Insert links
             if link_records:
-                execute_values(cur, """
-                    INSERT INTO manga_links (manga_id, url, link_type)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """, link_records)
+                await copy_rows(conn, 'manga_links', ('manga_id', 'url', 'link_type'), link_records)
                 print(f"✓ Inserted {len(link_records)} external links")
             
             # Insert relationships
-            if author_relations:
-                execute_values(cur, """
-                    INSERT INTO manga_authors (manga_id, author_id)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """, author_relations)
-                print(f"✓ Inserted {len(author_relations)} author relationships")
+            if author_relations[0]:
+                await insert_id_pairs(conn, 'manga_authors', 'author_id', *author_relations)
+                print(f"✓ Inserted {len(author_relations[0])} author relationships")
             
-            if artist_relations:
-                execute_values(cur, """
-                    INSERT INTO manga_artists (manga_id, artist_id)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """, artist_relations)
-                print(f"✓ Inserted {len(artist_relations)} artist relationships")
+            if artist_relations[0]:
+                await insert_id_pairs(conn, 'manga_artists', 'artist_id', *artist_relations)
+                print(f"✓ Inserted {len(artist_relations[0])} artist relationships")
             
-            if genre_relations:
-                execute_values(cur, """
-                    INSERT INTO manga_genres (manga_id, genre_id)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """, genre_relations)
-                print(f"✓ Inserted {len(genre_relations)} genre relationships")
+            if genre_relations[0]:
+                await insert_id_pairs(conn, 'manga_genres', 'genre_id', *genre_relations)
+                print(f"✓ Inserted {len(genre_relations[0])} genre relationships")
             
-            if publisher_relations:
-                execute_values(cur, """
-                    INSERT INTO manga_publishers (manga_id, publisher_id)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """, publisher_relations)
-                print(f"✓ Inserted {len(publisher_relations)} publisher relationships")
+            if publisher_relations[0]:
+                await insert_id_pairs(conn, 'manga_publishers', 'publisher_id', *publisher_relations)
+                print(f"✓ Inserted {len(publisher_relations[0])} publisher relationships")
             
-            # Insert secondary titles
             if secondary_titles:
-                execute_values(cur, """
-                    INSERT INTO manga_secondary_titles (manga_id, language_code, title, type, note)
-                    VALUES %s ON CONFLICT DO NOTHING
-                """, secondary_titles)
+                await copy_rows(conn, 'manga_secondary_titles',
+                          ('manga_id', 'language_code', 'title', 'type', 'note'), secondary_titles)
                 print(f"✓ Inserted {len(secondary_titles)} secondary titles")
             
             # Insert external sources
             if external_source_records:
-                execute_values(cur, """
-                    INSERT INTO manga_external_sources (
-                        manga_id, source_id, external_id, rating, cover_url,
-                        last_updated_at, response_data, statistics
-                    ) VALUES %s
-                    ON CONFLICT (manga_id, source_id) DO UPDATE SET
-                        external_id = EXCLUDED.external_id,
-                        rating = EXCLUDED.rating,
-                        cover_url = EXCLUDED.cover_url,
-                        last_updated_at = EXCLUDED.last_updated_at,
-                        response_data = EXCLUDED.response_data,
-                        statistics = EXCLUDED.statistics
-                """, external_source_records)
+                await copy_and_merge(conn, 'manga_external_sources', (
+                    'manga_id', 'source_id', 'external_id', 'rating', 'cover_url',
+                    'last_updated_at', 'response_data', 'statistics'
+                ), external_source_records, ('manga_id', 'source_id'), """
+                    WHEN MATCHED THEN UPDATE SET
+                        external_id = s.external_id,
+                        rating = s.rating,
+                        cover_url = s.cover_url,
+                        last_updated_at = s.last_updated_at,
+                        response_data = s.response_data,
+                        statistics = s.statistics
+                """)
                 print(f"✓ Inserted {len(external_source_records)} external source records")
             
-            conn.commit()
-            print("✓ All data committed successfully!")
+        print("✓ All data committed successfully!")
             
     except Exception as e:
-        conn.rollback()
         print(f"✗ Error during import: {e}")
         raise
 
-def main():
+async def main():
     """Main function"""
-    if len(sys.argv) != 6:
-        print("Usage: python simple_import.py <jsonl_file> <host> <database> <username> <password>")
-        print("Example: python simple_import.py manga.jsonl localhost manga_db postgres mypassword")
+    args = [arg for arg in sys.argv[1:] if arg != '--initial-load']
+    initial_load = len(args) < len(sys.argv) - 1
+    if len(args) not in (5, 6):
+        print("Usage: python simple_import.py <jsonl_file> <host> <database> <username> <password> [workers] [--initial-load]")
+        print("Example: python simple_import.py manga.jsonl localhost manga_db postgres mypassword 8")
         sys.exit(1)
     
-    file_path = sys.argv[1]
-    host = sys.argv[2]
-    database = sys.argv[3]
-    username = sys.argv[4]
-    password = sys.argv[5]
+    file_path = args[0]
+    host = args[1]
+    database = args[2]
+    username = args[3]
+    password = args[4]
+    workers = int(args[5]) if len(args) == 6 else os.cpu_count() or 1
     port = 5432
     
     print(f"Starting import of {file_path} to {database}@{host}")
     
     # Connect to database
-    conn = connect_db(host, port, database, username, password)
+    conn = await connect_db(host, port, database, username, password)
+    
+    # On a first-time load, building indexes once at the end beats maintaining them row by row
+    dropped_indexes = await drop_secondary_indexes(conn) if initial_load else []
     
     try:
-        # Read data
-        manga_data = read_jsonl_file(file_path)
-        
-        # Import data
-        import_manga_simple(conn, manga_data)
+        # Parse and import one batch at a time so memory stays bounded
+        for batch_num, batch in enumerate(iter_batches(iter_jsonl(file_path, workers)), 1):
+            print(f"\nImporting batch {batch_num} ({len(batch)} records)")
+            await import_manga_simple(conn, batch)
         
+        await refresh_materialized_views(conn)
         print("\n🎉 Import completed successfully!")
         
     except Exception as e:
         print(f"\n💥 Import failed: {e}")
         sys.exit(1)
     finally:
-        conn.close()
+        if dropped_indexes:
+            await restore_indexes(conn, dropped_indexes)
+        await conn.close()
 
 
 if __name__ == '__main__':
-    main()
+    asyncio.run(main())
@@ -308,21 +308,19 @@ BEGIN
             WHEN search_text != '' THEN paradedb.score(m.id)::REAL
             ELSE 0::REAL
         END as relevance_score,
-        COALESCE(array_agg(DISTINCT a.name) FILTER (WHERE a.name IS NOT NULL), ARRAY[]::TEXT[]) as authors,
-        COALESCE(array_agg(DISTINCT g.name) FILTER (WHERE g.name IS NOT NULL), ARRAY[]::TEXT[]) as genres
+        COALESCE(f.authors, ARRAY[]::TEXT[]),
+        COALESCE(f.genres, ARRAY[]::TEXT[])
     FROM manga m
-    LEFT JOIN manga_authors ma ON m.id = ma.manga_id
-    LEFT JOIN authors a ON ma.author_id = a.id
-    LEFT JOIN manga_genres mg ON m.id = mg.manga_id
-    LEFT JOIN genres g ON mg.genre_id = g.id
+    -- Names come pre-aggregated from manga_search_facets (see schema.sql): one row per manga,
+    -- no junction fan-out to regroup. LEFT JOIN keeps manga added since the last refresh
+    LEFT JOIN manga_search_facets f ON f.manga_id = m.id
     WHERE 
         (search_text = '' OR m.search_text @@@ search_text)
         AND m.rating BETWEEN min_rating AND max_rating
         AND COALESCE(m.year, 0) BETWEEN year_from AND year_to
-        AND (array_length(genres, 1) IS NULL OR g.name = ANY(genres))
+        AND (array_length(genres, 1) IS NULL OR f.genres && genres)
         AND (status_filter = '' OR m.status = status_filter)
         AND (content_rating_filter = '' OR m.content_rating = content_rating_filter)
-    GROUP BY m.id, m.title, m.native_title, m.year, m.rating, m.status
     ORDER BY 
         CASE 
             WHEN search_text != '' THEN paradedb.score(m.id)
@@ -0,0 +1,23 @@
+-- ============================================================================
+-- Filter and junction indexes for databases created before they were added
+-- to schema.sql. CONCURRENTLY keeps the tables writable while the indexes
+-- build, so run this outside a transaction block (plain psql -f is fine).
+-- ============================================================================
+
+-- Manga list (keyset cursor) and export order: rating DESC NULLS LAST, id DESC
+DROP INDEX CONCURRENTLY IF EXISTS idx_manga_rating;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_manga_rating ON manga(rating DESC NULLS LAST, id DESC);
+
+-- Status + content rating filter pair used by the advanced search
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_manga_status_content_rating ON manga(status, content_rating);
+
+-- Secondary titles by manga and language; replaces the manga_id-only index
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_secondary_titles_manga_lang ON manga_secondary_titles(manga_id, language_code);
+DROP INDEX CONCURRENTLY IF EXISTS idx_secondary_titles_manga_id;
+
+-- Junction lookups from the author/artist/publisher/genre/tag side
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_manga_authors_author_id ON manga_authors(author_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_manga_artists_artist_id ON manga_artists(artist_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_manga_publishers_publisher_id ON manga_publishers(publisher_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_manga_genres_genre_id ON manga_genres(genre_id);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_manga_tags_tag_id ON manga_tags(tag_id);
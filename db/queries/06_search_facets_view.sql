@@ -0,0 +1,23 @@
+-- ============================================================================
+-- manga_search_facets for databases created before it was added to schema.sql.
+-- Re-run 02_useful_query_samples.sql afterwards so advanced_manga_search reads it.
+-- The API refreshes the view after its own writes and the importers in data/ at the
+-- end of a run; after any other write (manual SQL, restores) refresh it by hand:
+--     REFRESH MATERIALIZED VIEW CONCURRENTLY manga_search_facets;
+-- ============================================================================
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS manga_search_facets AS
+SELECT
+    m.id AS manga_id,
+    ARRAY(
+        SELECT a.name FROM manga_authors ma JOIN authors a ON a.id = ma.author_id
+        WHERE ma.manga_id = m.id ORDER BY a.name
+    ) AS authors,
+    ARRAY(
+        SELECT g.name FROM manga_genres mg JOIN genres g ON g.id = mg.genre_id
+        WHERE mg.manga_id = m.id ORDER BY g.name
+    ) AS genres
+FROM manga m;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_search_facets_manga_id ON manga_search_facets(manga_id);
+CREATE INDEX IF NOT EXISTS idx_search_facets_genres ON manga_search_facets USING gin(genres);
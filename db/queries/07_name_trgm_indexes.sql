@@ -0,0 +1,14 @@
+-- ============================================================================
+-- Trigram indexes for the author/artist/publisher/genre/tag name search
+-- (`name ILIKE '%...%'`), for databases created before they were added to
+-- schema.sql. CONCURRENTLY keeps the tables writable while the indexes
+-- build, so run this outside a transaction block (plain psql -f is fine).
+-- ============================================================================
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_authors_name_trgm ON authors USING gin(name gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_artists_name_trgm ON artists USING gin(name gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_publishers_name_trgm ON publishers USING gin(name gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_genres_name_trgm ON genres USING gin(name gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_tags_name_trgm ON tags USING gin(name gin_trgm_ops);
@@ -0,0 +1,33 @@
+-- ============================================================================
+-- Stats distribution views for databases created before they were added to
+-- schema.sql. The API refreshes them concurrently after manga writes and the
+-- data/ importers at the end of a run; refresh them by hand after other writes.
+-- ============================================================================
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_year_distribution AS
+SELECT
+    year,
+    COUNT(*) AS count,
+    AVG(rating) AS avg_rating
+FROM manga
+WHERE year IS NOT NULL
+GROUP BY year;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_year_distribution_year ON mv_year_distribution(year);
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_rating_distribution AS
+SELECT
+    CASE
+        WHEN rating >= 9.0 THEN '9.0+'
+        WHEN rating >= 8.0 THEN '8.0-8.9'
+        WHEN rating >= 7.0 THEN '7.0-7.9'
+        WHEN rating >= 6.0 THEN '6.0-6.9'
+        WHEN rating >= 5.0 THEN '5.0-5.9'
+        ELSE 'Below 5.0'
+    END AS rating_range,
+    COUNT(*) AS count
+FROM manga
+WHERE rating IS NOT NULL
+GROUP BY rating_range;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_rating_distribution_range ON mv_rating_distribution(rating_range);
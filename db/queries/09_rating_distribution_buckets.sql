@@ -0,0 +1,17 @@
+-- ============================================================================
+-- Rebuild mv_rating_distribution (08_stats_distribution_views.sql) keyed by an
+-- integer rating bucket instead of a CASE-built range label. The API maps the
+-- buckets to the same labels, so responses are unchanged.
+-- ============================================================================
+
+DROP MATERIALIZED VIEW IF EXISTS mv_rating_distribution;
+
+CREATE MATERIALIZED VIEW mv_rating_distribution AS
+SELECT
+    LEAST(9, GREATEST(4, FLOOR(rating)::int)) AS bucket,
+    COUNT(*) AS count
+FROM manga
+WHERE rating IS NOT NULL
+GROUP BY bucket;
+
+CREATE UNIQUE INDEX idx_mv_rating_distribution_bucket ON mv_rating_distribution(bucket);
@@ -0,0 +1,17 @@
+-- ============================================================================
+-- Covering versions of the year and genre/tag junction indexes, for databases
+-- created before schema.sql added INCLUDE columns to them. CONCURRENTLY keeps
+-- the tables writable while the indexes build, so run this outside a
+-- transaction block (plain psql -f is fine).
+-- ============================================================================
+
+-- Overall stats: count, avg(rating), rating >= 8 and min/max(year) in one index-only pass
+DROP INDEX CONCURRENTLY IF EXISTS idx_manga_year;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_manga_year ON manga(year) INCLUDE (rating);
+
+-- Popular genres/tags: per-id manga counts read in genre_id/tag_id order
+DROP INDEX CONCURRENTLY IF EXISTS idx_manga_genres_genre_id;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_manga_genres_genre_id ON manga_genres(genre_id) INCLUDE (manga_id);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_manga_tags_tag_id;
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_manga_tags_tag_id ON manga_tags(tag_id) INCLUDE (manga_id);
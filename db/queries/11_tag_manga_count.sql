@@ -0,0 +1,80 @@
+-- ============================================================================
+-- Trigger-maintained tags.manga_count for databases created before it was
+-- added to schema.sql. Runs as one transaction holding off manga_tags writes,
+-- so the backfill and the triggers agree on every link. Safe to re-run; doing
+-- so also installs triggers added since (manga_tags_count_update).
+-- ============================================================================
+
+BEGIN;
+
+LOCK TABLE manga_tags IN SHARE MODE;
+
+ALTER TABLE tags ADD COLUMN IF NOT EXISTS manga_count INTEGER NOT NULL DEFAULT 0;
+
+UPDATE tags t SET manga_count = c.total
+FROM (SELECT tag_id, COUNT(*) AS total FROM manga_tags GROUP BY tag_id) c
+WHERE t.id = c.tag_id;
+
+-- tags.manga_count follows manga_tags. Statement-level, so a bulk link insert/delete (or a
+-- manga delete cascading to its links) costs one UPDATE per distinct tag, not one per row
+CREATE OR REPLACE FUNCTION increment_tag_manga_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE tags t SET manga_count = t.manga_count + n.added
+    FROM (SELECT tag_id, COUNT(*) AS added FROM new_links GROUP BY tag_id) n
+    WHERE t.id = n.tag_id;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE OR REPLACE FUNCTION decrement_tag_manga_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE tags t SET manga_count = t.manga_count - o.removed
+    FROM (SELECT tag_id, COUNT(*) AS removed FROM old_links GROUP BY tag_id) o
+    WHERE t.id = o.tag_id;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE OR REPLACE TRIGGER manga_tags_count_insert
+    AFTER INSERT ON manga_tags
+    REFERENCING NEW TABLE AS new_links
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION increment_tag_manga_count();
+
+CREATE OR REPLACE TRIGGER manga_tags_count_delete
+    AFTER DELETE ON manga_tags
+    REFERENCING OLD TABLE AS old_links
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION decrement_tag_manga_count();
+
+-- An UPDATE can move links between tags (tag_id) or leave them on the same tag (manga_id);
+-- only the net change per tag is applied
+CREATE OR REPLACE FUNCTION move_tag_manga_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE tags t SET manga_count = t.manga_count + d.delta
+    FROM (
+        SELECT tag_id, SUM(delta) AS delta
+        FROM (
+            SELECT tag_id, 1 AS delta FROM new_links
+            UNION ALL
+            SELECT tag_id, -1 AS delta FROM old_links
+        ) moved
+        GROUP BY tag_id
+    ) d
+    WHERE t.id = d.tag_id AND d.delta <> 0;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE OR REPLACE TRIGGER manga_tags_count_update
+    AFTER UPDATE ON manga_tags
+    REFERENCING OLD TABLE AS old_links NEW TABLE AS new_links
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION move_tag_manga_count();
+
+CREATE INDEX IF NOT EXISTS idx_tags_manga_count ON tags(manga_count DESC, id);
+
+COMMIT;
@@ -7,6 +7,9 @@ CREATE EXTENSION IF NOT EXISTS pg_search;
 -- Enable UUID extension for better ID management (optional)
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
+-- Enable pg_trgm for trigram indexes (substring name search) and similarity()
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- Main manga table
 CREATE TABLE manga (
     id BIGINT PRIMARY KEY,
@@ -99,6 +102,8 @@ CREATE TABLE genres (
 CREATE TABLE tags (
     id SERIAL PRIMARY KEY,
     name TEXT NOT NULL UNIQUE,
+    -- Number of manga_tags rows for this tag, maintained by the manga_tags_count_* triggers
+    manga_count INTEGER NOT NULL DEFAULT 0,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
 );
 
@@ -219,19 +224,30 @@ WITH (key_field='id');
 -- Regular indexes for non-search queries
 CREATE INDEX idx_manga_status ON manga(status);
 CREATE INDEX idx_manga_type ON manga(type);
-CREATE INDEX idx_manga_year ON manga(year);
-CREATE INDEX idx_manga_rating ON manga(rating);
+-- rating rides along so the overall stats pass (count/avg rating/min-max year) is index-only
+CREATE INDEX idx_manga_year ON manga(year) INCLUDE (rating);
+-- Matches the manga list order (and its keyset cursor) and the export order
+CREATE INDEX idx_manga_rating ON manga(rating DESC NULLS LAST, id DESC);
 CREATE INDEX idx_manga_content_rating ON manga(content_rating);
 CREATE INDEX idx_manga_updated_at ON manga(last_updated_at);
 CREATE INDEX idx_manga_state ON manga(state);
 
-CREATE INDEX idx_secondary_titles_manga_id ON manga_secondary_titles(manga_id);
+CREATE INDEX idx_secondary_titles_manga_lang ON manga_secondary_titles(manga_id, language_code);
 CREATE INDEX idx_secondary_titles_language ON manga_secondary_titles(language_code);
 
 CREATE INDEX idx_covers_manga_id ON manga_covers(manga_id);
 CREATE INDEX idx_covers_type ON manga_covers(type);
 
 CREATE INDEX idx_links_manga_id ON manga_links(manga_id);
+
+-- Junction primary keys lead with manga_id; these serve lookups from the other side
+CREATE INDEX idx_manga_authors_author_id ON manga_authors(author_id);
+CREATE INDEX idx_manga_artists_artist_id ON manga_artists(artist_id);
+CREATE INDEX idx_manga_publishers_publisher_id ON manga_publishers(publisher_id);
+-- Genre/tag ones carry manga_id so the popular genres/tags aggregate reads them in id order, index-only
+CREATE INDEX idx_manga_genres_genre_id ON manga_genres(genre_id) INCLUDE (manga_id);
+CREATE INDEX idx_manga_tags_tag_id ON manga_tags(tag_id) INCLUDE (manga_id);
+
 CREATE INDEX idx_relationships_manga_id ON manga_relationships(manga_id);
 CREATE INDEX idx_relationships_related_id ON manga_relationships(related_manga_id);
 CREATE INDEX idx_relationships_type ON manga_relationships(relationship_type);
@@ -243,8 +259,20 @@ CREATE INDEX idx_external_sources_external_id ON manga_external_sources(external
 -- Composite indexes for common query patterns
 CREATE INDEX idx_manga_rating_year ON manga(rating DESC, year DESC) WHERE rating IS NOT NULL;
 CREATE INDEX idx_manga_status_type ON manga(status, type);
+CREATE INDEX idx_manga_status_content_rating ON manga(status, content_rating);
 CREATE INDEX idx_manga_year_rating ON manga(year DESC, rating DESC) WHERE year IS NOT NULL;
 
+-- Trigram indexes for the lookup list/count `name ILIKE '%...%'` search;
+-- exact name lookups use the UNIQUE constraint's btree
+CREATE INDEX idx_authors_name_trgm ON authors USING gin(name gin_trgm_ops);
+CREATE INDEX idx_artists_name_trgm ON artists USING gin(name gin_trgm_ops);
+CREATE INDEX idx_publishers_name_trgm ON publishers USING gin(name gin_trgm_ops);
+CREATE INDEX idx_genres_name_trgm ON genres USING gin(name gin_trgm_ops);
+CREATE INDEX idx_tags_name_trgm ON tags USING gin(name gin_trgm_ops);
+
+-- Popular tags: top tags by the maintained counter
+CREATE INDEX idx_tags_manga_count ON tags(manga_count DESC, id);
+
 -- =====================================
 -- JSONB INDEXES FOR SOURCE DATA
 -- =====================================
@@ -253,6 +281,59 @@ CREATE INDEX idx_manga_year_rating ON manga(year DESC, rating DESC) WHERE year I
 CREATE INDEX idx_external_response_data ON manga_external_sources USING gin(response_data);
 CREATE INDEX idx_external_statistics ON manga_external_sources USING gin(statistics);
 
+-- =====================================
+-- DENORMALIZED SEARCH FACETS
+-- =====================================
+
+-- Author and genre names per manga, pre-aggregated so advanced search reads one row per
+-- manga instead of joining and regrouping the junction tables on every call.
+-- Refreshed by the API (debounced) after writes and by the data/ importers after a run; other
+-- writes need a manual refresh. UNIQUE index allows REFRESH ... CONCURRENTLY.
+CREATE MATERIALIZED VIEW manga_search_facets AS
+SELECT
+    m.id AS manga_id,
+    ARRAY(
+        SELECT a.name FROM manga_authors ma JOIN authors a ON a.id = ma.author_id
+        WHERE ma.manga_id = m.id ORDER BY a.name
+    ) AS authors,
+    ARRAY(
+        SELECT g.name FROM manga_genres mg JOIN genres g ON g.id = mg.genre_id
+        WHERE mg.manga_id = m.id ORDER BY g.name
+    ) AS genres
+FROM manga m;
+
+CREATE UNIQUE INDEX idx_search_facets_manga_id ON manga_search_facets(manga_id);
+CREATE INDEX idx_search_facets_genres ON manga_search_facets USING gin(genres);
+
+-- =====================================
+-- STATISTICS DISTRIBUTIONS
+-- =====================================
+
+-- Year and rating histograms for the stats endpoints, so each request reads a few rows
+-- instead of aggregating manga. Refreshed by the API (debounced) after manga writes and by
+-- the data/ importers after a run; other writes need a manual refresh.
+CREATE MATERIALIZED VIEW mv_year_distribution AS
+SELECT
+    year,
+    COUNT(*) AS count,
+    AVG(rating) AS avg_rating
+FROM manga
+WHERE year IS NOT NULL
+GROUP BY year;
+
+CREATE UNIQUE INDEX idx_mv_year_distribution_year ON mv_year_distribution(year);
+
+-- Integer buckets (4 = below 5.0 ... 9 = 9.0+); the API maps them to range labels
+CREATE MATERIALIZED VIEW mv_rating_distribution AS
+SELECT
+    LEAST(9, GREATEST(4, FLOOR(rating)::int)) AS bucket,
+    COUNT(*) AS count
+FROM manga
+WHERE rating IS NOT NULL
+GROUP BY bucket;
+
+CREATE UNIQUE INDEX idx_mv_rating_distribution_bucket ON mv_rating_distribution(bucket);
+
 -- =====================================
 -- FUNCTIONS AND TRIGGERS
 -- =====================================
@@ -272,6 +353,66 @@ CREATE TRIGGER update_manga_updated_at
     FOR EACH ROW 
     EXECUTE FUNCTION update_updated_at_column();
 
+-- tags.manga_count follows manga_tags. Statement-level, so a bulk link insert/delete (or a
+-- manga delete cascading to its links) costs one UPDATE per distinct tag, not one per row
+CREATE OR REPLACE FUNCTION increment_tag_manga_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE tags t SET manga_count = t.manga_count + n.added
+    FROM (SELECT tag_id, COUNT(*) AS added FROM new_links GROUP BY tag_id) n
+    WHERE t.id = n.tag_id;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE OR REPLACE FUNCTION decrement_tag_manga_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE tags t SET manga_count = t.manga_count - o.removed
+    FROM (SELECT tag_id, COUNT(*) AS removed FROM old_links GROUP BY tag_id) o
+    WHERE t.id = o.tag_id;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE TRIGGER manga_tags_count_insert
+    AFTER INSERT ON manga_tags
+    REFERENCING NEW TABLE AS new_links
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION increment_tag_manga_count();
+
+CREATE TRIGGER manga_tags_count_delete
+    AFTER DELETE ON manga_tags
+    REFERENCING OLD TABLE AS old_links
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION decrement_tag_manga_count();
+
+-- An UPDATE can move links between tags (tag_id) or leave them on the same tag (manga_id);
+-- only the net change per tag is applied
+CREATE OR REPLACE FUNCTION move_tag_manga_count()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE tags t SET manga_count = t.manga_count + d.delta
+    FROM (
+        SELECT tag_id, SUM(delta) AS delta
+        FROM (
+            SELECT tag_id, 1 AS delta FROM new_links
+            UNION ALL
+            SELECT tag_id, -1 AS delta FROM old_links
+        ) moved
+        GROUP BY tag_id
+    ) d
+    WHERE t.id = d.tag_id AND d.delta <> 0;
+    RETURN NULL;
+END;
+$$ language 'plpgsql';
+
+CREATE TRIGGER manga_tags_count_update
+    AFTER UPDATE ON manga_tags
+    REFERENCING OLD TABLE AS old_links NEW TABLE AS new_links
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION move_tag_manga_count();
+
 -- =====================================
 -- SEARCH HELPER FUNCTIONS
 -- =====================================
@@ -0,0 +1,144 @@
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from typing import Any, Callable, List, Optional, Sequence, Type
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..infra.cache import ITEM_CACHE_TTL, TTLCache
+from ..infra.database import get_db, get_read_db
+from ..services.view_refresh import search_facets
+from ..services.crud import LookupCRUD
+from .search import search_cache
+
+
+def _dump(adapter: TypeAdapter, value: Any) -> bytes:
+    """Validate ORM objects and serialize them to JSON in one pass through a prebuilt adapter"""
+    return adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+
+
+def _render(adapter: TypeAdapter, value: Any, headers: Optional[dict] = None) -> Response:
+    return Response(content=_dump(adapter, value), media_type="application/json", headers=headers)
+
+
+async def _render_cached(cache: TTLCache, key: Any, adapter: TypeAdapter, load: Callable) -> Optional[Response]:
+    """Serve the cached JSON body for `key`, loading and caching it on a miss; None if not found"""
+    body = cache.get(key)
+    if body is None:
+        generation = cache.generation
+        value = await load()
+        if not value:
+            return None
+        body = _dump(adapter, value)
+        # Not stored if a write invalidated the cache while the row was loading
+        cache.set(key, body, generation)
+    return Response(content=body, media_type="application/json")
+
+
+def make_crud_router(
+    entity: str,
+    plural: str,
+    schema: Type[BaseModel],
+    create_schema: Type[BaseModel],
+    crud: LookupCRUD,
+    list_schema: Type[BaseModel],
+    extra_routes: Optional[Callable[[APIRouter], None]] = None,
+    invalidates: Sequence[TTLCache] = (),
+    in_search_facets: bool = False,
+) -> APIRouter:
+    """
+    Build the standard CRUD router shared by the lookup entities (authors, artists, ...).
+
+    `crud` is the entity's services.crud.LookupCRUD (e.g. author_crud). The list route
+    responds with `list_schema` (the *Simple variant without the manga list); single-item
+    routes use the full `schema`.
+    `extra_routes` registers additional routes before the
+    `/{id}` routes so static paths such as `/popular` are matched first; caches those
+    routes keep are passed in `invalidates` and cleared on every write.
+    `in_search_facets` marks entities whose names are denormalized into manga_search_facets
+    (authors, genres); their writes schedule a refresh of the view.
+    """
+    router = APIRouter(prefix=f"/{plural}", tags=[plural])
+    title = entity.capitalize()
+
+    # Built once per router; read endpoints return rendered Responses so FastAPI skips
+    # its own per-request response_model validation (response_model is kept for OpenAPI)
+    list_adapter = TypeAdapter(List[list_schema])
+    item_adapter = TypeAdapter(schema)
+    # Rendered `/{id}` bodies; PUT/DELETE invalidate, ITEM_CACHE_TTL bounds staleness across workers
+    item_cache = TTLCache(ttl=ITEM_CACHE_TTL)
+    # Cleared on this worker's writes; other workers see a write once their entry expires
+    count_cache = TTLCache(maxsize=512, ttl=30)
+
+    def invalidate(item_id: Optional[int] = None):
+        if item_id is not None:
+            item_cache.invalidate(item_id)
+        count_cache.clear()
+        for cache in invalidates:
+            cache.clear()
+        if in_search_facets:
+            # Search pages embed these names; cleared now and again after the view refresh
+            search_cache.clear()
+            search_facets.schedule_refresh()
+
+    @router.get("", response_model=List[list_schema], name=f"get_{plural}",
+                description=f"Get list of {plural}")
+    async def get_all(
+        skip: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=500),
+        search: Optional[str] = None,
+        db: AsyncSession = Depends(get_read_db)
+    ):
+        return _render(list_adapter, await crud.list(db, skip, limit, search))
+
+    @router.get("/count", name=f"get_{plural}_count",
+                description=f"Get total count of {plural}")
+    async def get_count(
+        search: Optional[str] = None,
+        db: AsyncSession = Depends(get_read_db)
+    ):
+        count = await count_cache.get_or_load(search, lambda: crud.count(db, search))
+        return {"total_count": count}
+
+    if extra_routes:
+        extra_routes(router)
+
+    @router.post("", response_model=schema, name=f"create_{entity}",
+                 description=f"Create a new {entity}")
+    async def create(item: create_schema, db: AsyncSession = Depends(get_db)):
+        created_item = await crud.create(db, item)
+        invalidate()
+        return created_item
+
+    @router.get("/{item_id}", response_model=schema, name=f"get_{entity}",
+                description=f"Get {entity} by ID")
+    async def get_one(item_id: int, db: AsyncSession = Depends(get_read_db)):
+        response = await _render_cached(item_cache, item_id, item_adapter, lambda: crud.get(db, item_id))
+        if response is None:
+            raise HTTPException(status_code=404, detail=f"{title} not found")
+        return response
+
+    @router.put("/{item_id}", response_model=schema, name=f"update_{entity}",
+                description=f"Update {entity}")
+    async def update(item_id: int, item: create_schema, db: AsyncSession = Depends(get_db)):
+        updated_item = await crud.update(db, item_id, item)
+        invalidate(item_id)
+        if not updated_item:
+            raise HTTPException(status_code=404, detail=f"{title} not found")
+        return updated_item
+
+    @router.delete("/{item_id}", name=f"delete_{entity}",
+                   description=f"Delete {entity}")
+    async def delete(item_id: int, db: AsyncSession = Depends(get_db)):
+        deleted = await crud.delete(db, item_id)
+        invalidate(item_id)
+        if not deleted:
+            raise HTTPException(status_code=400, detail=f"Cannot delete {entity} with manga relationships")
+        return {"message": f"{title} deleted successfully"}
+
+    @router.get("/{item_id}/manga-count", name=f"get_{entity}_manga_count",
+                description=f"Get count of manga for this {entity}")
+    async def get_manga_count(item_id: int, db: AsyncSession = Depends(get_read_db)):
+        count = await crud.manga_count(db, item_id)
+        return {"manga_count": count}
+
+    return router
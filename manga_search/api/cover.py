@@ -1,38 +1,58 @@
 from fastapi import APIRouter, HTTPException, Depends
+from pydantic import TypeAdapter
 from typing import List
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..infra.database import get_db
+from ..infra.cache import ITEM_CACHE_TTL, TTLCache
+from ..infra.database import get_db, get_read_db
 from ..model.schemas import MangaCoverCreate, MangaCover as MangaCoverSchema
 from ..services.crud import MangaCoverCRUD
+from ._crud_factory import _render_cached
+from .manga import manga_cache
 
 
 router = APIRouter(prefix="/manga", tags=["manga-covers"])
 
+cover_adapter = TypeAdapter(MangaCoverSchema)
+cover_cache = TTLCache(ttl=ITEM_CACHE_TTL)
+
 
 @router.get("/{manga_id}/covers", response_model=List[MangaCoverSchema])
-async def get_manga_covers(manga_id: int, db: AsyncSession = Depends(get_db)):
+async def get_manga_covers(manga_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get all covers for a manga"""
     return await MangaCoverCRUD.get_manga_covers(db, manga_id)
 
 @router.post("/covers", response_model=MangaCoverSchema)
 async def create_manga_cover(cover: MangaCoverCreate, db: AsyncSession = Depends(get_db)):
     """Create a new manga cover"""
-    return await MangaCoverCRUD.create_manga_cover(db, cover)
+    created_cover = await MangaCoverCRUD.create_manga_cover(db, cover)
+    manga_cache.invalidate(created_cover.manga_id)
+    return created_cover
+
+@router.post("/covers/bulk", response_model=List[MangaCoverSchema])
+async def create_manga_covers_bulk(covers: List[MangaCoverCreate], db: AsyncSession = Depends(get_db)):
+    """Create many manga covers in one batched insert"""
+    created = await MangaCoverCRUD.create_manga_covers_bulk(db, covers)
+    for manga_id in {created_cover.manga_id for created_cover in created}:
+        manga_cache.invalidate(manga_id)
+    return created
 
 @router.get("/covers/{cover_id}", response_model=MangaCoverSchema)
-async def get_manga_cover(cover_id: int, db: AsyncSession = Depends(get_db)):
+async def get_manga_cover(cover_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get cover by ID"""
-    cover = await MangaCoverCRUD.get_manga_cover(db, cover_id)
-    if not cover:
+    response = await _render_cached(cover_cache, cover_id, cover_adapter,
+                                    lambda: MangaCoverCRUD.get_manga_cover(db, cover_id))
+    if response is None:
         raise HTTPException(status_code=404, detail="Cover not found")
-    return cover
+    return response
 
 @router.put("/covers/{cover_id}", response_model=MangaCoverSchema)
 async def update_manga_cover(cover_id: int, cover: MangaCoverCreate, db: AsyncSession = Depends(get_db)):
     """Update manga cover"""
     updated_cover = await MangaCoverCRUD.update_manga_cover(db, cover_id, cover)
+    manga_cache.clear()
+    cover_cache.invalidate(cover_id)
     if not updated_cover:
         raise HTTPException(status_code=404, detail="Cover not found")
     return updated_cover
@@ -41,6 +61,8 @@ async def update_manga_cover(cover_id: int, cover: MangaCoverCreate, db: AsyncSe
 async def delete_manga_cover(cover_id: int, db: AsyncSession = Depends(get_db)):
     """Delete manga cover"""
     deleted = await MangaCoverCRUD.delete_manga_cover(db, cover_id)
+    manga_cache.clear()
+    cover_cache.invalidate(cover_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Cover not found")
     return {"message": "Cover deleted successfully"}
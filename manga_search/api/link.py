@@ -1,38 +1,58 @@
 from fastapi import APIRouter, HTTPException, Depends
+from pydantic import TypeAdapter
 from typing import List
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..infra.database import get_db
+from ..infra.cache import ITEM_CACHE_TTL, TTLCache
+from ..infra.database import get_db, get_read_db
 from ..model.schemas import MangaLinkCreate, MangaLink as MangaLinkSchema
 from ..services.crud import MangaLinkCRUD
+from ._crud_factory import _render_cached
+from .manga import manga_cache
 
 
 router = APIRouter(prefix="/manga", tags=["manga-links"])
 
+link_adapter = TypeAdapter(MangaLinkSchema)
+link_cache = TTLCache(ttl=ITEM_CACHE_TTL)
+
 
 @router.get("/{manga_id}/links", response_model=List[MangaLinkSchema])
-async def get_manga_links(manga_id: int, db: AsyncSession = Depends(get_db)):
+async def get_manga_links(manga_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get all links for a manga"""
     return await MangaLinkCRUD.get_manga_links(db, manga_id)
 
 @router.post("/links", response_model=MangaLinkSchema)
 async def create_manga_link(link: MangaLinkCreate, db: AsyncSession = Depends(get_db)):
     """Create a new manga link"""
-    return await MangaLinkCRUD.create_manga_link(db, link)
+    created_link = await MangaLinkCRUD.create_manga_link(db, link)
+    manga_cache.invalidate(created_link.manga_id)
+    return created_link
+
+@router.post("/links/bulk", response_model=List[MangaLinkSchema])
+async def create_manga_links_bulk(links: List[MangaLinkCreate], db: AsyncSession = Depends(get_db)):
+    """Create many manga links in one batched insert"""
+    created = await MangaLinkCRUD.create_manga_links_bulk(db, links)
+    for manga_id in {created_link.manga_id for created_link in created}:
+        manga_cache.invalidate(manga_id)
+    return created
 
 @router.get("/links/{link_id}", response_model=MangaLinkSchema)
-async def get_manga_link(link_id: int, db: AsyncSession = Depends(get_db)):
+async def get_manga_link(link_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get link by ID"""
-    link = await MangaLinkCRUD.get_manga_link(db, link_id)
-    if not link:
+    response = await _render_cached(link_cache, link_id, link_adapter,
+                                    lambda: MangaLinkCRUD.get_manga_link(db, link_id))
+    if response is None:
         raise HTTPException(status_code=404, detail="Link not found")
-    return link
+    return response
 
 @router.put("/links/{link_id}", response_model=MangaLinkSchema)
 async def update_manga_link(link_id: int, link: MangaLinkCreate, db: AsyncSession = Depends(get_db)):
     """Update manga link"""
     updated_link = await MangaLinkCRUD.update_manga_link(db, link_id, link)
+    manga_cache.clear()
+    link_cache.invalidate(link_id)
     if not updated_link:
         raise HTTPException(status_code=404, detail="Link not found")
     return updated_link
@@ -41,6 +61,8 @@ async def update_manga_link(link_id: int, link: MangaLinkCreate, db: AsyncSessio
 async def delete_manga_link(link_id: int, db: AsyncSession = Depends(get_db)):
     """Delete manga link"""
     deleted = await MangaLinkCRUD.delete_manga_link(db, link_id)
+    manga_cache.clear()
+    link_cache.invalidate(link_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Link not found")
     return {"message": "Link deleted successfully"}
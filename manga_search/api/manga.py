@@ -1,35 +1,84 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
 from fastapi.responses import StreamingResponse
-from typing import List, Optional
+from pydantic import TypeAdapter, ValidationError
+from typing import List, Optional, Tuple
 from datetime import datetime
 from decimal import Decimal
 import logging
+import base64
 import io
 import csv
+import orjson
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..infra.database import get_db
+from ..infra.cache import ITEM_CACHE_TTL, TTLCache
+from ..infra.database import AsyncSessionLocal, get_db, get_read_db
+from ..infra.responses import orjson_default
 from ..model.schemas import (
-    MangaCreate, MangaUpdate, Manga as MangaSchema
+    MangaCreate, MangaUpdate, MangaListItem, Manga as MangaSchema
 )
+from ..model.models import Manga
 from ..services.crud import MangaCRUD
+from ..services.view_refresh import manga_distributions, search_facets
+from ._crud_factory import _render, _render_cached
+from .search import search_cache
+from . import genre, tag
 
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/manga", tags=["manga"])
 
+_BULK_ADAPTER = TypeAdapter(List[MangaCreate])
+# Built once; routes validate ORM rows and dump JSON in one pydantic-core pass through these
+# and return the bytes, skipping FastAPI's response_model handling (kept for OpenAPI)
+_MANGA_ADAPTER = TypeAdapter(MangaSchema)
+_MANGA_LIST_ADAPTER = TypeAdapter(List[MangaSchema])
+_MANGA_ITEMS_ADAPTER = TypeAdapter(List[MangaListItem])
+
+# Rendered `/manga/{manga_id}` bodies. Manga, cover, secondary title and link writes invalidate;
+# the TTL bounds staleness across workers and from lookup renames
+manga_cache = TTLCache(ttl=ITEM_CACHE_TTL)
+
+EXPORT_CSV_COLUMNS = ('id', 'title', 'native_title', 'year', 'rating', 'status')
+# Manga table columns exposed by the list schema, in schema order
+EXPORT_JSON_COLUMNS = tuple(name for name in MangaListItem.model_fields if name in Manga.__table__.columns)
+
+
+def _dump_export_row(row) -> bytes:
+    return orjson.dumps(dict(zip(EXPORT_JSON_COLUMNS, row)), option=orjson.OPT_NAIVE_UTC, default=orjson_default)
+
+
+def _invalidate_reads(manga_id: Optional[int] = None):
+    """Drop cached reads a manga write can change"""
+    if manga_id is None:
+        manga_cache.clear()
+    else:
+        manga_cache.invalidate(manga_id)
+    search_cache.clear()
+    # Popularity counts manga per genre/tag
+    genre.popular_cache.clear()
+    tag.popular_cache.clear()
+    manga_distributions.schedule_refresh()
+
+
+def _encode_cursor(row) -> str:
+    """Opaque list cursor: the (rating, id) sort key of the last row, as URL-safe base64 JSON"""
+    return base64.urlsafe_b64encode(orjson.dumps([row["rating"], row["id"]])).decode()
 
-@router.get("/{manga_id}", response_model=MangaSchema)
-async def get_manga(manga_id: int, db: AsyncSession = Depends(get_db)):
-    """Get a specific manga by ID with all related data"""
-    manga = await MangaCRUD.get_manga(db, manga_id)
-    if not manga:
-        raise HTTPException(status_code=404, detail="Manga not found")
-    return manga
 
-@router.get("", response_model=List[MangaSchema])
+def _decode_cursor(cursor: str) -> Tuple[Optional[float], int]:
+    try:
+        rating, manga_id = orjson.loads(base64.urlsafe_b64decode(cursor))
+        return (None if rating is None else float(rating)), int(manga_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+@router.get("", response_model=List[MangaListItem])
 async def get_manga_list(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
@@ -39,13 +88,23 @@ async def get_manga_list(
     max_rating: Optional[Decimal] = None,
     content_rating: Optional[str] = None,
     manga_type: Optional[str] = None,
-    db: AsyncSession = Depends(get_db)
+    after: Optional[str] = Query(None, description="X-Next-Cursor of the previous page; replaces skip"),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get list of manga with optional filters"""
-    manga_list = await MangaCRUD.get_manga_list(
-        db, skip, limit, status, year, min_rating, max_rating, content_rating, manga_type
+    """
+    Get list of manga with optional filters. The first page sends the total match count as
+    X-Total-Count; full pages send X-Next-Cursor, which pages on by index seek instead of OFFSET
+    """
+    manga_list, total = await MangaCRUD.get_manga_list(
+        db, skip, limit, status, year, min_rating, max_rating, content_rating, manga_type,
+        after=_decode_cursor(after) if after else None
     )
-    return manga_list
+    headers = {}
+    if total is not None:
+        headers["X-Total-Count"] = str(total)
+    if len(manga_list) == limit:
+        headers["X-Next-Cursor"] = _encode_cursor(manga_list[-1])
+    return _render(_MANGA_ITEMS_ADAPTER, manga_list, headers=headers)
 
 @router.get("/count")
 async def get_manga_count(
@@ -55,50 +114,80 @@ async def get_manga_count(
     max_rating: Optional[Decimal] = None,
     content_rating: Optional[str] = None,
     manga_type: Optional[str] = None,
-    db: AsyncSession = Depends(get_db)
+    estimate: bool = Query(False, description="Allow an approximate total for unfiltered counts"),
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """Get total count of manga matching filters"""
-    count = await MangaCRUD.get_manga_count(
-        db, status, year, min_rating, max_rating, content_rating, manga_type
-    )
+    """
+    Get total count of manga matching filters.
+    With `estimate` and no filters, answers from table statistics instead of scanning
+    (flagged by `"estimated": true`); filtered counts are always exact.
+    """
+    filters = (status, year, min_rating, max_rating, content_rating, manga_type)
+    if estimate and not any(filters):
+        count = await MangaCRUD.estimate_manga_count(db)
+        if count is not None:
+            return {"total_count": count, "estimated": True}
+
+    count = await MangaCRUD.get_manga_count(db, *filters)
     return {"total_count": count}
 
+@router.get("/{manga_id}", response_model=MangaSchema)
+async def get_manga(manga_id: int, db: AsyncSession = Depends(get_read_db)):
+    """Get a specific manga by ID with all related data"""
+    response = await _render_cached(manga_cache, manga_id, _MANGA_ADAPTER,
+                                    lambda: MangaCRUD.get_manga(db, manga_id))
+    if response is None:
+        raise HTTPException(status_code=404, detail="Manga not found")
+    return response
+
 @router.post("", response_model=MangaSchema)
 async def create_manga(manga: MangaCreate, db: AsyncSession = Depends(get_db)):
     """Create a new manga"""
-    return await MangaCRUD.create_manga(db, manga)
+    created_manga = await MangaCRUD.create_manga(db, manga)
+    _invalidate_reads(created_manga.id)
+    search_facets.schedule_refresh()
+    return _render(_MANGA_ADAPTER, created_manga)
 
 @router.put("/{manga_id}", response_model=MangaSchema)
 async def update_manga(manga_id: int, manga: MangaUpdate, db: AsyncSession = Depends(get_db)):
     """Update an existing manga"""
     updated_manga = await MangaCRUD.update_manga(db, manga_id, manga)
+    _invalidate_reads(manga_id)
+    search_facets.schedule_refresh()
     if not updated_manga:
         raise HTTPException(status_code=404, detail="Manga not found")
-    return updated_manga
+    return _render(_MANGA_ADAPTER, updated_manga)
 
 @router.delete("/{manga_id}")
 async def delete_manga(manga_id: int, db: AsyncSession = Depends(get_db)):
     """Delete a manga"""
     deleted = await MangaCRUD.delete_manga(db, manga_id)
+    _invalidate_reads(manga_id)
     if not deleted:
         raise HTTPException(status_code=404, detail="Manga not found")
     return {"message": "Manga deleted successfully"}
 
 @router.post("/bulk", response_model=List[MangaSchema])
 async def create_bulk_manga(
-    manga_list: List[MangaCreate], 
+    request: Request,
     db: AsyncSession = Depends(get_db)
 ):
     """Create multiple manga in bulk - optimized for large datasets"""
-    created_manga = []
+    # Validate the raw body on pydantic's JSON path, off the event loop for large payloads
+    body = await request.body()
+    try:
+        manga_list = await run_in_threadpool(_BULK_ADAPTER.validate_json, body)
+    except ValidationError as e:
+        errors = [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        raise RequestValidationError(errors, body=body)
     
     try:
-        for manga_data in manga_list:
-            manga = await MangaCRUD.create_manga(db, manga_data)
-            created_manga.append(manga)
+        created_manga = await MangaCRUD.create_manga_bulk(db, manga_list)
+        _invalidate_reads()
+        search_facets.schedule_refresh()
         
         logger.info(f"Created {len(created_manga)} manga records in bulk")
-        return created_manga
+        return _render(_MANGA_LIST_ADAPTER, created_manga)
         
     except Exception as e:
         logger.error(f"Bulk creation failed: {e}")
@@ -112,49 +201,54 @@ async def create_bulk_manga(
 async def export_manga_bulk(
     limit: int = Query(1000, le=10000),
     offset: int = Query(0, ge=0),
-    format: str = Query("json", regex="^(json|csv)$"),
-    db: AsyncSession = Depends(get_db)
+    format: str = Query("json", regex="^(json|ndjson|csv)$")
 ):
     """Export manga data in bulk - demonstrates orjson performance with large datasets"""
     
+    # Rows go out as the server-side cursor advances; each generator opens its own session
+    # because the request's dependencies are closed before a streaming body starts
     if format == "csv":
-        # Get data
-        manga_list = await MangaCRUD.get_manga_list(db, offset, limit)
-        
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
-        
-        # Headers
-        writer.writerow(['id', 'title', 'native_title', 'year', 'rating', 'status'])
-        
-        # Data
-        for manga in manga_list:
-            writer.writerow([
-                manga.id, manga.title, manga.native_title, 
-                manga.year, manga.rating, manga.status
-            ])
+        async def csv_chunks():
+            output = io.StringIO()
+            writer = csv.writer(output)
+            writer.writerow(EXPORT_CSV_COLUMNS)
+            yield output.getvalue().encode()
+            
+            async with AsyncSessionLocal() as session:
+                async for rows in MangaCRUD.stream_manga_rows(session, offset, limit, EXPORT_CSV_COLUMNS):
+                    output.seek(0)
+                    output.truncate(0)
+                    writer.writerows(rows)
+                    yield output.getvalue().encode()
         
-        response = StreamingResponse(
-            io.BytesIO(output.getvalue().encode()), 
-            media_type="text/csv"
+        return StreamingResponse(
+            csv_chunks(),
+            media_type="text/csv",
+            headers={"Content-Disposition": "attachment; filename=manga_export.csv"}
         )
-        response.headers["Content-Disposition"] = "attachment; filename=manga_export.csv"
-        return response
     
-    else:
-        # JSON export using orjson (default)
-        manga_list = await MangaCRUD.get_manga_list(db, offset, limit)
-        
-        # Add metadata for large datasets
-        export_data = {
-            "metadata": {
-                "total_exported": len(manga_list),
-                "offset": offset,
-                "limit": limit,
-                "export_timestamp": datetime.utcnow().isoformat()
-            },
-            "data": [manga.__dict__ for manga in manga_list]
-        }
+    if format == "ndjson":
+        async def ndjson_chunks():
+            async with AsyncSessionLocal() as session:
+                async for rows in MangaCRUD.stream_manga_rows(session, offset, limit, EXPORT_JSON_COLUMNS):
+                    yield b"".join(_dump_export_row(row) + b"\n" for row in rows)
         
-        return export_data
+        return StreamingResponse(ndjson_chunks(), media_type="application/x-ndjson")
+    
+    # JSON export using orjson (default); metadata follows the data so the count is known
+    async def json_chunks():
+        exported = 0
+        yield b'{"data":['
+        async with AsyncSessionLocal() as session:
+            async for rows in MangaCRUD.stream_manga_rows(session, offset, limit, EXPORT_JSON_COLUMNS):
+                chunk = b",".join(map(_dump_export_row, rows))
+                yield chunk if not exported else b"," + chunk
+                exported += len(rows)
+        yield b'],"metadata":' + orjson.dumps({
+            "total_exported": exported,
+            "offset": offset,
+            "limit": limit,
+            "export_timestamp": datetime.utcnow().isoformat()
+        }) + b"}"
+    
+    return StreamingResponse(json_chunks(), media_type="application/json")
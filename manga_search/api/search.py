@@ -1,48 +1,114 @@
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Response
 from typing import List, Literal
+import asyncio
+import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
+from sqlalchemy import bindparam, text
 
-from ..infra.database import get_db
+from ..infra.cache import TTLCache
+from ..infra.database import ReadSessionLocal, get_read_db
+from ..infra.responses import dumps
 from ..model.schemas import SearchParams, MangaSearchResult, FuzzySearchParams, FuzzySearchResult
 from ..services.crud import MangaCRUD
+from ..services.view_refresh import search_facets
 
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/manga/search", tags=["search"])
 
+# Serialized result bodies keyed by endpoint and parameters, so repeated searches skip both
+# the database and serialization; manga writes clear it, the TTL bounds staleness across workers
+search_cache = TTLCache(maxsize=1024, ttl=60)
+# Pages carry author/genre names from manga_search_facets, which lags writes by REFRESH_DELAY;
+# searches in that window cache the old names, so drop them again once the view is current
+search_facets.on_refreshed.append(search_cache.clear)
+
+
+async def _cached_json(key, load) -> Response:
+    """Serve the cached body for `key`, awaiting `load()` for the JSON bytes on a miss"""
+    body = await search_cache.get_or_load(key, load)
+    return Response(content=body, media_type="application/json")
+
+
+# Basic search pages that came back full remember the params of the page after them; serving
+# such a page prefetches the next one into search_cache, so scrolling hits memory.
+# At most two prefetches run at a time per worker; beyond that they are skipped
+_next_search_pages = TTLCache(maxsize=1024, ttl=60)
+_prefetch_slots = asyncio.Semaphore(2)
+_prefetch_tasks = set()
+
+
+async def _load_search_page(db: AsyncSession, params: SearchParams) -> bytes:
+    body, row_count = await MangaCRUD.search_manga(db, params)
+    if row_count == params.limit:
+        _next_search_pages.set(
+            params.model_dump_json(),
+            params.model_copy(update={"offset": params.offset + params.limit})
+        )
+    return body
+
+
+async def _prefetch_search_page(params: SearchParams):
+    key = ("search", params.model_dump_json())
+    if search_cache.get(key) is not None:
+        return
+    async with _prefetch_slots:
+        generation = search_cache.generation
+        try:
+            # The request's session is closed by now, so the prefetch opens its own
+            async with ReadSessionLocal() as db:
+                # Dropped if a write cleared the cache while the page was loading
+                search_cache.set(key, await _load_search_page(db, params), generation)
+        except Exception as e:
+            logger.warning(f"Search page prefetch failed: {e}")
+
+# Simple title-based suggestions; built once so the compiled statement is reused per call
+SUGGESTIONS_QUERY = text("""
+    SELECT m.id, m.title, m.native_title,
+           paradedb.score(m.id) as relevance_score
+    FROM manga m
+    WHERE m.title_search @@@ :query
+    ORDER BY paradedb.score(m.id) DESC
+    LIMIT :limit
+""").bindparams(bindparam("query"), bindparam("limit"))
+
 
 @router.post("", response_model=List[MangaSearchResult])
-async def search_manga(params: SearchParams, db: AsyncSession = Depends(get_db)):
+async def search_manga(params: SearchParams, db: AsyncSession = Depends(get_read_db)):
     """Basic BM25 search for manga"""
-    return await MangaCRUD.search_manga(db, params)
+    params_json = params.model_dump_json()
+    response = await _cached_json(("search", params_json), lambda: _load_search_page(db, params))
+
+    next_params = _next_search_pages.get(params_json)
+    if next_params is not None and not _prefetch_slots.locked():
+        task = asyncio.create_task(_prefetch_search_page(next_params))
+        _prefetch_tasks.add(task)
+        task.add_done_callback(_prefetch_tasks.discard)
+    return response
 
 
 @router.post("/advanced")
-async def advanced_search_manga(params: SearchParams, db: AsyncSession = Depends(get_db)):
+async def advanced_search_manga(params: SearchParams, db: AsyncSession = Depends(get_read_db)):
     """Advanced search with filters using the database function"""
-    return await MangaCRUD.advanced_search_manga(db, params)
+    async def load():
+        return dumps(await MangaCRUD.advanced_search_manga(db, params))
+    return await _cached_json(("advanced", params.model_dump_json()), load)
 
 
 @router.get("/suggestions")
 async def get_search_suggestions(
     query: str = Query(..., min_length=1),
     limit: int = Query(5, ge=1, le=10),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """Get search suggestions for auto-complete"""
-    # Simple title-based suggestions
-    sql = text("""
-        SELECT m.id, m.title, m.native_title,
-               paradedb.score(m.id) as relevance_score
-        FROM manga m
-        WHERE m.title_search @@@ :query
-        ORDER BY paradedb.score(m.id) DESC
-        LIMIT :limit
-    """)
-    
-    result = await db.execute(sql, {'query': query, 'limit': limit})
-    return [dict(row._mapping) for row in result.fetchall()]
+    async def load():
+        result = await db.execute(SUGGESTIONS_QUERY, {'query': query, 'limit': limit})
+        # RowMappings go straight to orjson, bypassing FastAPI's jsonable_encoder pass
+        return dumps(result.mappings().all())
+    return await _cached_json(("suggestions", query, limit), load)
 
 
 @router.get("/fuzzy/suggestions")
@@ -50,7 +116,7 @@ async def get_fuzzy_suggestions(
     query: str = Query(..., min_length=1, description="Search query for suggestions"),
     limit: int = Query(10, ge=1, le=20, description="Maximum suggestions to return"),
     fuzzy_distance: int = Query(2, ge=0, le=5, description="Fuzzy matching distance"),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Get fuzzy search suggestions for auto-complete
@@ -59,7 +125,9 @@ async def get_fuzzy_suggestions(
     if len(query.strip()) == 0:
         raise HTTPException(status_code=400, detail="Query cannot be empty")
     
-    return await MangaCRUD.fuzzy_search_suggestions(db, query, limit, fuzzy_distance)
+    async def load():
+        return dumps(await MangaCRUD.fuzzy_search_suggestions(db, query, limit, fuzzy_distance))
+    return await _cached_json(("fuzzy", query, limit, fuzzy_distance), load)
 
 
 @router.get("/fuzzy/field/{field}")
@@ -68,13 +136,15 @@ async def fuzzy_search_by_field(
     query: str = Query(..., min_length=1),
     fuzzy_distance: int = Query(2, ge=0, le=5),
     limit: int = Query(20, ge=1, le=100),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_read_db)
 ):
     """
     Perform fuzzy search on a specific field
     Useful for targeted searches with typo tolerance
     """
+    async def load():
+        return dumps(await MangaCRUD.fuzzy_search_by_field(db, field, query, fuzzy_distance, limit))
     try:
-        return await MangaCRUD.fuzzy_search_by_field(db, field, query, fuzzy_distance, limit)
+        return await _cached_json(("fuzzy_field", field, query, fuzzy_distance, limit), load)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
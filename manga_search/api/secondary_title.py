@@ -1,36 +1,52 @@
 from fastapi import APIRouter, HTTPException, Depends
+from pydantic import TypeAdapter
 from typing import List
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..infra.database import get_db
+from ..infra.database import get_db, get_read_db
 from ..model.schemas import MangaSecondaryTitleCreate, MangaSecondaryTitle as MangaSecondaryTitleSchema
 from ..services.crud import MangaSecondaryTitleCRUD
+from ._crud_factory import _render
+from .manga import manga_cache
 
 router = APIRouter(prefix="/manga", tags=["manga-secondary-titles"])
 
+title_adapter = TypeAdapter(MangaSecondaryTitleSchema)
+
 @router.get("/{manga_id}/secondary-titles", response_model=List[MangaSecondaryTitleSchema])
-async def get_manga_secondary_titles(manga_id: int, db: AsyncSession = Depends(get_db)):
+async def get_manga_secondary_titles(manga_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get all secondary titles for a manga"""
     return await MangaSecondaryTitleCRUD.get_manga_secondary_titles(db, manga_id)
 
 @router.post("/secondary-titles", response_model=MangaSecondaryTitleSchema)
 async def create_manga_secondary_title(title: MangaSecondaryTitleCreate, db: AsyncSession = Depends(get_db)):
     """Create a new manga secondary title"""
-    return await MangaSecondaryTitleCRUD.create_manga_secondary_title(db, title)
+    created_title = await MangaSecondaryTitleCRUD.create_manga_secondary_title(db, title)
+    manga_cache.invalidate(created_title.manga_id)
+    return created_title
+
+@router.post("/secondary-titles/bulk", response_model=List[MangaSecondaryTitleSchema])
+async def create_manga_secondary_titles_bulk(titles: List[MangaSecondaryTitleCreate], db: AsyncSession = Depends(get_db)):
+    """Create many manga secondary titles in one batched insert"""
+    created = await MangaSecondaryTitleCRUD.create_manga_secondary_titles_bulk(db, titles)
+    for manga_id in {created_title.manga_id for created_title in created}:
+        manga_cache.invalidate(manga_id)
+    return created
 
 @router.get("/secondary-titles/{title_id}", response_model=MangaSecondaryTitleSchema)
-async def get_manga_secondary_title(title_id: int, db: AsyncSession = Depends(get_db)):
+async def get_manga_secondary_title(title_id: int, db: AsyncSession = Depends(get_read_db)):
     """Get secondary title by ID"""
     title = await MangaSecondaryTitleCRUD.get_manga_secondary_title(db, title_id)
     if not title:
         raise HTTPException(status_code=404, detail="Secondary title not found")
-    return title
+    return _render(title_adapter, title)
 
 @router.put("/secondary-titles/{title_id}", response_model=MangaSecondaryTitleSchema)
 async def update_manga_secondary_title(title_id: int, title: MangaSecondaryTitleCreate, db: AsyncSession = Depends(get_db)):
     """Update manga secondary title"""
     updated_title = await MangaSecondaryTitleCRUD.update_manga_secondary_title(db, title_id, title)
+    manga_cache.clear()
     if not updated_title:
         raise HTTPException(status_code=404, detail="Secondary title not found")
     return updated_title
@@ -39,6 +55,7 @@ async def update_manga_secondary_title(title_id: int, title: MangaSecondaryTitle
 async def delete_manga_secondary_title(title_id: int, db: AsyncSession = Depends(get_db)):
     """Delete manga secondary title"""
     deleted = await MangaSecondaryTitleCRUD.delete_manga_secondary_title(db, title_id)
+    manga_cache.clear()
     if not deleted:
         raise HTTPException(status_code=404, detail="Secondary title not found")
     return {"message": "Secondary title deleted successfully"}
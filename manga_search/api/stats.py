@@ -1,25 +1,47 @@
 from fastapi import APIRouter, Depends
+import asyncio
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..infra.database import get_db
+from ..infra.cache import TTLCache
+from ..infra.database import ReadSessionLocal, get_read_db
 from ..services.crud import StatisticsCRUD
 
 
 router = APIRouter(prefix="/stats", tags=["statistics"])
 
+# Aggregates over the whole catalogue; a minute of staleness saves a full scan per page load
+stats_cache = TTLCache(maxsize=16, ttl=60)
+
 
 @router.get("")
-async def get_database_stats(db: AsyncSession = Depends(get_db)):
+async def get_database_stats(db: AsyncSession = Depends(get_read_db)):
     """Get overall database statistics"""
-    return await StatisticsCRUD.get_database_stats(db)
+    return await stats_cache.get_or_load("database_stats", lambda: StatisticsCRUD.get_database_stats(db))
 
 @router.get("/year-distribution")
-async def get_year_distribution(db: AsyncSession = Depends(get_db)):
+async def get_year_distribution(db: AsyncSession = Depends(get_read_db)):
     """Get manga distribution by year"""
-    return await StatisticsCRUD.get_year_distribution(db)
+    return await stats_cache.get_or_load("year_distribution", lambda: StatisticsCRUD.get_year_distribution(db))
 
 @router.get("/rating-distribution")
-async def get_rating_distribution(db: AsyncSession = Depends(get_db)):
+async def get_rating_distribution(db: AsyncSession = Depends(get_read_db)):
     """Get manga distribution by rating ranges"""
-    return await StatisticsCRUD.get_rating_distribution(db)
+    return await stats_cache.get_or_load("rating_distribution", lambda: StatisticsCRUD.get_rating_distribution(db))
+
+@router.get("/all")
+async def get_all_stats():
+    """Get overall statistics and both distributions in one call"""
+    # One session each: a single asyncpg connection runs one query at a time
+    async def load(key, query):
+        async def run():
+            async with ReadSessionLocal() as session:
+                return await query(session)
+        return await stats_cache.get_or_load(key, run)
+
+    overall, by_year, by_rating = await asyncio.gather(
+        load("database_stats", StatisticsCRUD.get_database_stats),
+        load("year_distribution", StatisticsCRUD.get_year_distribution),
+        load("rating_distribution", StatisticsCRUD.get_rating_distribution),
+    )
+    return {"overall": overall, "by_year": by_year, "by_rating": by_rating}
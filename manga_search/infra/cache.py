@@ -0,0 +1,96 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable, Optional
+
+
+# TTL of the rendered single-item (`GET /{id}`) caches. Writes invalidate the handling worker's
+# copy right away; with WEB_CONCURRENCY > 1 this is how long other workers can serve the old body
+ITEM_CACHE_TTL = 10.0
+
+
+class TTLCache:
+    """
+    Small in-process LRU cache whose entries expire after `ttl` seconds.
+    Only touched from the event loop without awaiting in between, so no lock is needed;
+    get_or_load additionally lets concurrent misses on one key share a single load.
+    clear() and invalidate() bump `generation`; a load that started under an older generation
+    read pre-write data, so its result is returned to its callers but not cached.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._loading: "dict[Hashable, asyncio.Future]" = {}
+        self.generation = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """Cache `value`; with `generation`, only if nothing was cleared or invalidated since"""
+        if generation is not None and generation != self.generation:
+            return
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+        self._loading.pop(key, None)
+        self.generation += 1
+
+    def clear(self) -> None:
+        self._data.clear()
+        # Later misses start a fresh load instead of joining one that read pre-write data
+        self._loading.clear()
+        self.generation += 1
+
+    async def get_or_load(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Return the cached value for `key`, awaiting `load()` and caching its result on a miss.
+        Misses that arrive while a load for the same key is running wait for it instead of
+        starting their own, so an expired hot entry costs one query, not one per request.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        pending = self._loading.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # This request was cancelled, not the load it was waiting on
+            return await self.get_or_load(key, load)
+
+        generation = self.generation
+        future = asyncio.get_running_loop().create_future()
+        self._loading[key] = future
+        try:
+            value = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Waiters re-raise it; don't log it as never retrieved
+            raise
+        else:
+            self.set(key, value, generation)
+            future.set_result(value)
+        finally:
+            if self._loading.get(key) is future:
+                del self._loading[key]
+        return value
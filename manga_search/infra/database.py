@@ -1,8 +1,12 @@
 import os
+import asyncio
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
-from sqlalchemy import MetaData
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
+from sqlalchemy import text
 import logging
+import orjson
+from uuid import uuid4
 
 
 logger = logging.getLogger(__name__)
@@ -15,21 +19,64 @@ DATABASE_URL = os.getenv(
 )
 
 
-# Create async engine with optimized settings
-engine = create_async_engine(
-    DATABASE_URL,
+# Pool settings, overridable per deployment
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "20"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "3600"))  # Recycle connections every hour
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Set when DATABASE_URL points at PgBouncer in pool_mode=transaction
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "").lower() in ("1", "true", "yes")
+
+ENGINE_OPTIONS = dict(
     echo=False,  # Set to True for SQL debugging
+    poolclass=AsyncAdaptedQueuePool,
     pool_pre_ping=True,
-    pool_size=20,
-    max_overflow=30,
-    pool_recycle=3600,  # Recycle connections every hour
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_recycle=DB_POOL_RECYCLE,
+    pool_timeout=DB_POOL_TIMEOUT,
+    # Compiled SQL cache (default 500); ORM loaders, per-filter selects and the prebuilt
+    # CRUD statements together can exceed that and keep evicting each other
+    query_cache_size=1200,
+    # JSON/JSONB columns (e.g. manga.anime) are decoded by the driver codec; use orjson there
+    json_serializer=lambda value: orjson.dumps(value).decode(),
+    json_deserializer=orjson.loads,
     connect_args={
+        # Cache prepared statements per connection so hot queries skip parse/plan on reuse
+        "prepared_statement_cache_size": 500,
+        "statement_cache_size": 1024,
         "server_settings": {
             "jit": "off",  # Disable JIT for better connection speed
+            # Detect connections silently dropped by NATs/load balancers
+            "tcp_keepalives_idle": "30",
+            "tcp_keepalives_interval": "10",
+            "tcp_keepalives_count": "5",
         }
     }
 )
 
+if DB_PGBOUNCER:
+    # PgBouncer owns the server connections, so don't hold a second pool here. Consecutive
+    # transactions may land on different server connections, so prepared statements can't be
+    # cached per connection; server_settings need ignore_startup_parameters in pgbouncer.ini
+    # (or set them on the role/database instead)
+    for option in ("pool_size", "max_overflow", "pool_recycle", "pool_timeout"):
+        del ENGINE_OPTIONS[option]
+    ENGINE_OPTIONS["poolclass"] = NullPool
+    ENGINE_OPTIONS["connect_args"].update(
+        prepared_statement_cache_size=0,
+        statement_cache_size=0,
+        # Unique names so a statement prepared on a reused server connection can't collide
+        prepared_statement_name_func=lambda: f"__asyncpg_{uuid4()}__",
+    )
+
+# Create async engine with optimized settings
+engine = create_async_engine(DATABASE_URL, **ENGINE_OPTIONS)
+
+if not engine.dialect.supports_statement_cache:
+    # Third-party dialects must opt in on their concrete class, else every statement recompiles
+    logger.warning(f"Dialect {engine.dialect.name} does not support the SQLAlchemy statement cache")
+
 # Create session factory
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
@@ -38,9 +85,47 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False  # Manual flush control for better performance
 )
 
-# Base class for models
-Base = declarative_base()
-metadata = MetaData()
+# Read-only traffic runs in autocommit mode: no BEGIN/COMMIT round trips per request.
+# READ_DATABASE_URL may point at a replica; otherwise the primary's pool is shared.
+READ_DATABASE_URL = os.getenv("READ_DATABASE_URL")
+
+if READ_DATABASE_URL:
+    # The dedicated pool also refuses writes server-side, so a stray INSERT fails loudly
+    read_connect_args = dict(ENGINE_OPTIONS["connect_args"])
+    read_connect_args["server_settings"] = {
+        **read_connect_args["server_settings"],
+        "default_transaction_read_only": "on",
+    }
+    read_engine = create_async_engine(
+        READ_DATABASE_URL,
+        isolation_level="AUTOCOMMIT",
+        **{**ENGINE_OPTIONS, "connect_args": read_connect_args}
+    )
+else:
+    read_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+ReadSessionLocal = async_sessionmaker(
+    bind=read_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+    autoflush=False
+)
+
+async def warm_pool():
+    """Open pool_size connections up front so the first requests don't pay for connecting"""
+    if DB_PGBOUNCER:
+        return  # Nothing is pooled on this side
+
+    async def ping(bind):
+        async with bind.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    engines = [engine] if read_engine.pool is engine.pool else [engine, read_engine]
+    await asyncio.gather(*(ping(bind) for bind in engines for _ in range(DB_POOL_SIZE)))
+
+# Base class for models; Mapped[] annotations give typed attributes without extra descriptors
+class Base(DeclarativeBase):
+    pass
 
 # Dependency to get database session
 async def get_db():
@@ -54,3 +139,8 @@ async def get_db():
             raise
         finally:
             await session.close()
+
+# Dependency for read-only endpoints; nothing to commit or roll back
+async def get_read_db():
+    async with ReadSessionLocal() as session:
+        yield session
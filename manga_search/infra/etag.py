@@ -0,0 +1,62 @@
+import hashlib
+from typing import Iterable
+
+
+class ETagMiddleware:
+    """
+    Tag small, frequently polled GET responses with a content hash and answer a matching
+    If-None-Match with 304, so repeat hits skip the body transfer.
+    Bodies are buffered, so only configure paths with compact responses.
+    """
+
+    def __init__(self, app, prefixes: Iterable[str] = (), suffixes: Iterable[str] = ()):
+        self.app = app
+        self.prefixes = tuple(prefixes)
+        self.suffixes = tuple(suffixes)
+
+    def _matches(self, path: str) -> bool:
+        return path.startswith(self.prefixes) or path.endswith(self.suffixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET" or not self._matches(scope["path"]):
+            await self.app(scope, receive, send)
+            return
+
+        start = None
+        chunks = []
+
+        async def buffered_send(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                chunks.append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    await self._respond(scope, start, b"".join(chunks), send)
+            else:
+                await send(message)
+
+        await self.app(scope, receive, buffered_send)
+
+    @staticmethod
+    async def _respond(scope, start, body: bytes, send):
+        if start["status"] != 200:
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'.encode()
+        headers = [(name, value) for name, value in start["headers"] if name != b"etag"]
+        headers.append((b"etag", etag))
+
+        if_none_match = b",".join(value for name, value in scope["headers"] if name == b"if-none-match")
+        candidates = {candidate.strip().removeprefix(b"W/") for candidate in if_none_match.split(b",")}
+        if etag in candidates or b"*" in candidates:
+            headers = [(name, value) for name, value in headers
+                       if name not in (b"content-length", b"content-type")]
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send({**start, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
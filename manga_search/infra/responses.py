@@ -0,0 +1,29 @@
+from decimal import Decimal
+from typing import Any, Mapping
+
+import orjson
+from fastapi.responses import ORJSONResponse
+from sqlalchemy.engine import Row
+
+
+def orjson_default(value: Any) -> Any:
+    """Fallback for the types database rows carry that orjson does not serialize natively"""
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, Row):
+        return value._asdict()
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize like FastORJSONResponse, for bodies that are cached or streamed as bytes"""
+    return orjson.dumps(content, option=orjson.OPT_NAIVE_UTC, default=orjson_default)
+
+
+class FastORJSONResponse(ORJSONResponse):
+    """ORJSONResponse that also renders Decimal and SQLAlchemy rows, treating naive datetimes as UTC"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
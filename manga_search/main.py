@@ -1,13 +1,18 @@
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import ORJSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
 import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import text
+from sqlalchemy import select, text
+from sqlalchemy.orm import configure_mappers
 
-from .infra.database import engine, AsyncSessionLocal, get_db
+from .infra.database import ReadSessionLocal, engine, get_read_db, read_engine, warm_pool
+from .infra.etag import ETagMiddleware
+from .infra.responses import FastORJSONResponse
+from .model.models import Manga
+from .services.crud import MANGA_DETAIL_LOAD
 
 # Import all routers
 from .api import (
@@ -26,11 +31,16 @@ async def lifespan(app: FastAPI):
     """Manage application lifespan events"""
     # Startup
     logger.info("🚀 Starting up Manga Database API...")
+    # Compile mappers now rather than on the first request
+    configure_mappers()
     try:
-        # Test database connection
-        async with AsyncSessionLocal() as session:
-            await session.execute(text("SELECT 1"))
+        # Test database connection and pre-open the pool
+        await warm_pool()
         logger.info("✅ Database connection established successfully")
+        
+        # Run the detail query once so its SQL compilation is cached before traffic arrives
+        async with ReadSessionLocal() as session:
+            await session.execute(select(Manga).where(Manga.id == 0).options(*MANGA_DETAIL_LOAD))
     except Exception as e:
         logger.error(f"❌ Failed to connect to database: {e}")
         raise
@@ -42,6 +52,7 @@ async def lifespan(app: FastAPI):
     try:
         # Close database connections
         await engine.dispose()
+        await read_engine.dispose()
         logger.info("✅ Database connections closed successfully")
     except Exception as e:
         logger.error(f"❌ Error during shutdown: {e}")
@@ -52,7 +63,7 @@ app = FastAPI(
     description="FastAPI CRUD application for ParadeDB-based Manga database with BM25 search",
     version="1.0.0",
     lifespan=lifespan,
-    default_response_class=ORJSONResponse
+    default_response_class=FastORJSONResponse
 )
 
 # Configure CORS
@@ -62,9 +73,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["X-Total-Count", "X-Page-Count"]
+    expose_headers=["X-Total-Count", "X-Page-Count", "X-Next-Cursor"]
 )
 
+# Dashboards poll stats, popularity and counts; unchanged bodies come back as 304.
+# Registered before GZip so the hash is taken over the uncompressed body.
+app.add_middleware(ETagMiddleware, prefixes=("/stats",), suffixes=("/popular", "/count"))
+
+# JSON lists and exports compress 5-10x; small bodies aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Register all routers
 app.include_router(manga.router)
 app.include_router(author.router)
@@ -81,21 +99,19 @@ app.include_router(stats.router)
 
 # Health check endpoint (kept in main for simplicity)
 @app.get("/health")
-async def health_check(db: AsyncSession = Depends(get_db)):
+async def health_check(db: AsyncSession = Depends(get_read_db)):
     """Health check endpoint with database status"""
     try:
-        # Simple query to test database connection
-        result = await db.execute(text("SELECT 1"))
-        logger.info(f"Health check passed: {result.scalar()}")
-
-        # Additional database info
+        # Connectivity check and database info in a single round trip
         db_info = await db.execute(text("""
             SELECT 
+                1 as ok,
                 current_database() as database_name,
                 version() as version,
                 current_timestamp as server_time
         """))
         db_data = db_info.fetchone()
+        logger.info(f"Health check passed: {db_data.ok}")
         
         return {
             "status": "healthy",
@@ -117,6 +133,18 @@ async def health_check(db: AsyncSession = Depends(get_db)):
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
 
-    uvicorn.run("manga_search.main:app", host="0.0.0.0", port=8000, reload=True, log_level="info")
+    # Single worker on uvloop/httptools by default. The response caches and the materialized view
+    # refresh live in process, so each extra worker (WEB_CONCURRENCY=N) keeps its own copies:
+    # writes only invalidate the worker that served them and every worker refreshes the views
+    uvicorn.run(
+        "manga_search.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        loop="uvloop",
+        http="httptools",
+        log_level="info"
+    )
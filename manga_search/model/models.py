@@ -1,53 +1,19 @@
+from datetime import datetime
+from typing import Any, List, Optional
+
 from sqlalchemy import (
-    Column, Integer, BigInteger, String, Text, Boolean, 
-    DECIMAL, Float, TIMESTAMP, ForeignKey, JSON, Table, MetaData
+    Integer, BigInteger, String, Text, Boolean, 
+    DECIMAL, Float, TIMESTAMP, ForeignKey
 )
-from sqlalchemy.orm import relationship, declarative_base
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
-# Create metadata and base
-metadata = MetaData()
-Base = declarative_base(metadata=metadata)
-
-# ============================================================================
-# ASSOCIATION TABLES (Many-to-Many Relationships)
-# ============================================================================
-
-# 🔧 Define association tables BEFORE model classes
-manga_authors = Table(
-    'manga_authors',
-    Base.metadata,
-    Column('manga_id', BigInteger, ForeignKey('manga.id', ondelete='CASCADE'), primary_key=True),
-    Column('author_id', Integer, ForeignKey('authors.id', ondelete='CASCADE'), primary_key=True)
-)
-
-manga_artists = Table(
-    'manga_artists',
-    Base.metadata,
-    Column('manga_id', BigInteger, ForeignKey('manga.id', ondelete='CASCADE'), primary_key=True),
-    Column('artist_id', Integer, ForeignKey('artists.id', ondelete='CASCADE'), primary_key=True)
-)
-
-manga_publishers = Table(
-    'manga_publishers',
-    Base.metadata,
-    Column('manga_id', BigInteger, ForeignKey('manga.id', ondelete='CASCADE'), primary_key=True),
-    Column('publisher_id', Integer, ForeignKey('publishers.id', ondelete='CASCADE'), primary_key=True)
+from manga_search.infra.database import Base
+from manga_search.model.associations import (
+    manga_authors, manga_artists, manga_publishers, manga_genres, manga_tags
 )
 
-manga_genres = Table(
-    'manga_genres',
-    Base.metadata,
-    Column('manga_id', BigInteger, ForeignKey('manga.id', ondelete='CASCADE'), primary_key=True),
-    Column('genre_id', Integer, ForeignKey('genres.id', ondelete='CASCADE'), primary_key=True)
-)
-
-manga_tags = Table(
-    'manga_tags',
-    Base.metadata,
-    Column('manga_id', BigInteger, ForeignKey('manga.id', ondelete='CASCADE'), primary_key=True),
-    Column('tag_id', Integer, ForeignKey('tags.id', ondelete='CASCADE'), primary_key=True)
-)
 
 # ============================================================================
 # MODEL CLASSES
@@ -56,183 +22,174 @@ manga_tags = Table(
 class Manga(Base):
     __tablename__ = "manga"
 
-    id = Column(BigInteger, primary_key=True)
-    state = Column(String(20), nullable=False, default='active')
-    merged_with = Column(BigInteger, ForeignKey('manga.id'))
-    title = Column(Text, nullable=False)
-    native_title = Column(Text)
-    romanized_title = Column(Text)
-    description = Column(Text)
-    year = Column(Integer)
-    status = Column(String(20))
-    is_licensed = Column(Boolean, default=False)
-    has_anime = Column(Boolean, default=False)
-    anime = Column(JSON)
-    content_rating = Column(String(20))
-    type = Column(String(20), nullable=False, default='manga')
-    rating = Column(DECIMAL(3, 1))
-    final_volume = Column(Float)
-    final_chapter = Column(Float)
-    total_chapters = Column(Text)
-    last_updated_at = Column(TIMESTAMP(timezone=True), default=func.current_timestamp())
-    created_at = Column(TIMESTAMP(timezone=True), default=func.current_timestamp())
-    updated_at = Column(TIMESTAMP(timezone=True), default=func.current_timestamp())
-
-    # 🔧 Use Table objects directly (not strings) for secondary parameter
-    authors = relationship(
-        "Author", 
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    state: Mapped[str] = mapped_column(String(20), nullable=False, default='active')
+    merged_with: Mapped[Optional[int]] = mapped_column(BigInteger, ForeignKey('manga.id'))
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    native_title: Mapped[Optional[str]] = mapped_column(Text)
+    romanized_title: Mapped[Optional[str]] = mapped_column(Text)
+    description: Mapped[Optional[str]] = mapped_column(Text)
+    year: Mapped[Optional[int]] = mapped_column(Integer)
+    status: Mapped[Optional[str]] = mapped_column(String(20))
+    is_licensed: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    has_anime: Mapped[Optional[bool]] = mapped_column(Boolean, default=False)
+    anime: Mapped[Optional[Any]] = mapped_column(JSONB)
+    content_rating: Mapped[Optional[str]] = mapped_column(String(20))
+    type: Mapped[str] = mapped_column(String(20), nullable=False, default='manga')
+    # One decimal place, so float is exact enough and serializes without a Decimal fallback
+    rating: Mapped[Optional[float]] = mapped_column(DECIMAL(3, 1, asdecimal=False))
+    final_volume: Mapped[Optional[float]] = mapped_column(Float)
+    final_chapter: Mapped[Optional[float]] = mapped_column(Float)
+    total_chapters: Mapped[Optional[str]] = mapped_column(Text)
+    last_updated_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), default=func.current_timestamp())
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), default=func.current_timestamp())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), default=func.current_timestamp())
+
+    # 🔧 Use Table objects directly (not strings) for secondary parameter.
+    # Relationships raise unless a query asks for them; see the loader options in services.crud.
+    authors: Mapped[List["Author"]] = relationship(
         secondary=manga_authors,  # ✅ Table object, not string
         back_populates="manga",
-        lazy="selectin"
+        lazy="raise"
     )
-    artists = relationship(
-        "Artist", 
+    artists: Mapped[List["Artist"]] = relationship(
         secondary=manga_artists,
         back_populates="manga",
-        lazy="selectin"
+        lazy="raise"
     )
-    publishers = relationship(
-        "Publisher", 
+    publishers: Mapped[List["Publisher"]] = relationship(
         secondary=manga_publishers,
         back_populates="manga",
-        lazy="selectin"
+        lazy="raise"
     )
-    genres = relationship(
-        "Genre", 
+    genres: Mapped[List["Genre"]] = relationship(
         secondary=manga_genres,
         back_populates="manga",
-        lazy="selectin"
+        lazy="raise"
     )
-    tags = relationship(
-        "Tag", 
+    tags: Mapped[List["Tag"]] = relationship(
         secondary=manga_tags,
         back_populates="manga",
-        lazy="selectin"
+        lazy="raise"
     )
     
     # One-to-many relationships
-    covers = relationship(
-        "MangaCover", 
+    covers: Mapped[List["MangaCover"]] = relationship(
         back_populates="manga",
-        lazy="selectin",
+        lazy="raise",
         cascade="all, delete-orphan"
     )
-    secondary_titles = relationship(
-        "MangaSecondaryTitle", 
+    secondary_titles: Mapped[List["MangaSecondaryTitle"]] = relationship(
         back_populates="manga",
-        lazy="selectin",
+        lazy="raise",
         cascade="all, delete-orphan"
     )
-    links = relationship(
-        "MangaLink", 
+    links: Mapped[List["MangaLink"]] = relationship(
         back_populates="manga",
-        lazy="selectin",
+        lazy="raise",
         cascade="all, delete-orphan"
     )
 
 class Author(Base):
     __tablename__ = "authors"
 
-    id = Column(Integer, primary_key=True)
-    name = Column(Text, nullable=False, unique=True)
-    created_at = Column(TIMESTAMP(timezone=True), default=func.current_timestamp())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), default=func.current_timestamp())
 
     # Many-to-many back reference
-    manga = relationship(
-        "Manga", 
+    manga: Mapped[List["Manga"]] = relationship(
         secondary=manga_authors,
         back_populates="authors",
-        lazy="selectin"
+        lazy="raise"
     )
 
 class Artist(Base):
     __tablename__ = "artists"
 
-    id = Column(Integer, primary_key=True)
-    name = Column(Text, nullable=False, unique=True)
-    created_at = Column(TIMESTAMP(timezone=True), default=func.current_timestamp())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), default=func.current_timestamp())
 
-    manga = relationship(
-        "Manga", 
+    manga: Mapped[List["Manga"]] = relationship(
         secondary=manga_artists,
         back_populates="artists",
-        lazy="selectin"
+        lazy="raise"
     )
 
 class Publisher(Base):
     __tablename__ = "publishers"
 
-    id = Column(Integer, primary_key=True)
-    name = Column(Text, nullable=False, unique=True)
-    created_at = Column(TIMESTAMP(timezone=True), default=func.current_timestamp())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), default=func.current_timestamp())
 
-    manga = relationship(
-        "Manga", 
+    manga: Mapped[List["Manga"]] = relationship(
         secondary=manga_publishers,
         back_populates="publishers",
-        lazy="selectin"
+        lazy="raise"
     )
 
 class Genre(Base):
     __tablename__ = "genres"
 
-    id = Column(Integer, primary_key=True)
-    name = Column(Text, nullable=False, unique=True)
-    created_at = Column(TIMESTAMP(timezone=True), default=func.current_timestamp())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), default=func.current_timestamp())
 
-    manga = relationship(
-        "Manga", 
+    manga: Mapped[List["Manga"]] = relationship(
         secondary=manga_genres,
         back_populates="genres",
-        lazy="selectin"
+        lazy="raise"
     )
 
 class Tag(Base):
     __tablename__ = "tags"
 
-    id = Column(Integer, primary_key=True)
-    name = Column(Text, nullable=False, unique=True)
-    created_at = Column(TIMESTAMP(timezone=True), default=func.current_timestamp())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    name: Mapped[str] = mapped_column(Text, nullable=False, unique=True)
+    # Maintained by triggers on manga_tags (see schema.sql); never written from here
+    manga_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), default=func.current_timestamp())
 
-    manga = relationship(
-        "Manga", 
+    manga: Mapped[List["Manga"]] = relationship(
         secondary=manga_tags,
         back_populates="tags",
-        lazy="selectin"
+        lazy="raise"
     )
 
 class MangaCover(Base):
     __tablename__ = "manga_covers"
 
-    id = Column(Integer, primary_key=True)
-    manga_id = Column(BigInteger, ForeignKey('manga.id', ondelete='CASCADE'), nullable=False)
-    type = Column(String(20), nullable=False)
-    url = Column(Text, nullable=False)
-    width = Column(Integer)
-    height = Column(Integer)
-    created_at = Column(TIMESTAMP(timezone=True), default=func.current_timestamp())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    manga_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('manga.id', ondelete='CASCADE'), nullable=False)
+    type: Mapped[str] = mapped_column(String(20), nullable=False)
+    url: Mapped[str] = mapped_column(Text, nullable=False)
+    width: Mapped[Optional[int]] = mapped_column(Integer)
+    height: Mapped[Optional[int]] = mapped_column(Integer)
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), default=func.current_timestamp())
 
-    manga = relationship("Manga", back_populates="covers")
+    manga: Mapped["Manga"] = relationship(back_populates="covers")
 
 class MangaSecondaryTitle(Base):
     __tablename__ = "manga_secondary_titles"
 
-    id = Column(Integer, primary_key=True)
-    manga_id = Column(BigInteger, ForeignKey('manga.id', ondelete='CASCADE'), nullable=False)
-    language_code = Column(String(5), nullable=False)
-    title = Column(Text, nullable=False)
-    type = Column(String(20))
-    note = Column(Text)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    manga_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('manga.id', ondelete='CASCADE'), nullable=False)
+    language_code: Mapped[str] = mapped_column(String(5), nullable=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
+    type: Mapped[Optional[str]] = mapped_column(String(20))
+    note: Mapped[Optional[str]] = mapped_column(Text)
 
-    manga = relationship("Manga", back_populates="secondary_titles")
+    manga: Mapped["Manga"] = relationship(back_populates="secondary_titles")
 
 class MangaLink(Base):
     __tablename__ = "manga_links"
 
-    id = Column(Integer, primary_key=True)
-    manga_id = Column(BigInteger, ForeignKey('manga.id', ondelete='CASCADE'), nullable=False)
-    url = Column(Text, nullable=False)
-    link_type = Column(String(50))
-    created_at = Column(TIMESTAMP(timezone=True), default=func.current_timestamp())
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    manga_id: Mapped[int] = mapped_column(BigInteger, ForeignKey('manga.id', ondelete='CASCADE'), nullable=False)
+    url: Mapped[str] = mapped_column(Text, nullable=False)
+    link_type: Mapped[Optional[str]] = mapped_column(String(50))
+    created_at: Mapped[Optional[datetime]] = mapped_column(TIMESTAMP(timezone=True), default=func.current_timestamp())
 
-    manga = relationship("Manga", back_populates="links")
+    manga: Mapped["Manga"] = relationship(back_populates="links")
@@ -1,19 +1,19 @@
-from pydantic import BaseModel, ConfigDict, Field
-from typing import Optional, List, Any, Literal
+from pydantic import BaseModel, ConfigDict, Field, PlainSerializer
+from typing import Annotated, Optional, List, Any, Literal
 from datetime import datetime
 from decimal import Decimal
 
 
+# Decimal that serializes to a JSON number (pydantic's default is a string) inside
+# pydantic-core; datetimes already serialize to ISO 8601 there without help
+JsonDecimal = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used='json')]
+
+
 class BaseSchema(BaseModel):
     model_config = ConfigDict(
         from_attributes=True,
         # 🔧 Critical: Disable arbitrary types validation for SQLAlchemy objects
         arbitrary_types_allowed=True,
-        # Use orjson for better performance
-        json_encoders={
-            datetime: lambda v: v.isoformat() if v else None,
-            Decimal: lambda v: float(v) if v is not None else None
-        }
     )
 
 # Basic schemas without circular references
@@ -124,7 +124,7 @@ class MangaBase(BaseSchema):
     anime: Optional[Any] = None
     content_rating: Optional[str] = None
     type: str = 'manga'
-    rating: Optional[Decimal] = None
+    rating: Optional[float] = None
     final_volume: Optional[float] = None
     final_chapter: Optional[float] = None
     total_chapters: Optional[str] = None
@@ -148,7 +148,7 @@ class MangaUpdate(BaseSchema):
     anime: Optional[Any] = None
     content_rating: Optional[str] = None
     type: Optional[str] = None
-    rating: Optional[Decimal] = None
+    rating: Optional[float] = None
     final_volume: Optional[float] = None
     final_chapter: Optional[float] = None
     total_chapters: Optional[str] = None
@@ -158,15 +158,17 @@ class MangaUpdate(BaseSchema):
     genre_ids: Optional[List[int]] = None
     tag_ids: Optional[List[int]] = None
 
-class Manga(MangaBase):
-    """Full manga schema with all relationships"""
+class MangaListItem(MangaBase):
+    """Manga columns without relationships, for list views"""
     id: int
     state: str
     merged_with: Optional[int] = None
     last_updated_at: datetime
     created_at: datetime
     updated_at: datetime
-    
+
+class Manga(MangaListItem):
+    """Full manga schema with all relationships"""
     # 🔧 Use simple schemas to avoid circular references and lazy loading issues
     authors: List[AuthorSimple] = Field(default_factory=list)
     artists: List[ArtistSimple] = Field(default_factory=list)
@@ -205,15 +207,17 @@ class MangaSearchResult(BaseSchema):
     title: str
     native_title: Optional[str]
     year: Optional[int]
-    rating: Optional[Decimal]
+    rating: Optional[float]
     relevance_score: float
+    authors: List[str] = Field(default_factory=list)
+    genres: List[str] = Field(default_factory=list)
 
 class SearchParams(BaseSchema):
     query: str
     limit: int = 20
     offset: int = 0
-    min_rating: Optional[Decimal] = None
-    max_rating: Optional[Decimal] = None
+    min_rating: Optional[JsonDecimal] = None
+    max_rating: Optional[JsonDecimal] = None
     year_from: Optional[int] = None
     year_to: Optional[int] = None
     genres: Optional[List[str]] = None
@@ -247,8 +251,8 @@ class FuzzySearchParams(BaseModel):
     offset: int = Field(default=0, ge=0)
     
     # Additional filters
-    min_rating: Optional[Decimal] = None
-    max_rating: Optional[Decimal] = None
+    min_rating: Optional[JsonDecimal] = None
+    max_rating: Optional[JsonDecimal] = None
     year_from: Optional[int] = None
     year_to: Optional[int] = None
     status: Optional[str] = None
@@ -261,7 +265,7 @@ class FuzzySearchResult(BaseModel):
     romanized_title: Optional[str]
     description: Optional[str]
     year: Optional[int]
-    rating: Optional[Decimal]
+    rating: Optional[float]
     status: Optional[str]
     relevance_score: float
     matched_fields: List[str]  # Which fields matched the query
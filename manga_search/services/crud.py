@@ -1,7 +1,9 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, insert, update, delete, text, and_, func
-from sqlalchemy.orm import selectinload
-from typing import Optional, Sequence, List, Dict, Any
+from sqlalchemy import select, insert, update, delete, exists, text, bindparam, and_, or_, func, Integer
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from typing import Optional, Sequence, List, Any, Tuple, Set, Mapping
 from decimal import Decimal
 from time import time
 
@@ -10,51 +12,352 @@ from manga_search.model.models import (
     MangaCover, MangaSecondaryTitle, MangaLink
 )
 from manga_search.model.schemas import (
-    MangaCreate, MangaUpdate, SearchParams, MangaSearchResult,
-    AuthorCreate, ArtistCreate, PublisherCreate, GenreCreate, TagCreate,
+    MangaCreate, MangaUpdate, MangaListItem, SearchParams,
     MangaCoverCreate, MangaSecondaryTitleCreate, MangaLinkCreate,
-    FuzzySearchParams, FuzzySearchResult
+    FuzzySearchParams, FuzzySearchResult,
+    MangaCover as MangaCoverSchema, MangaSecondaryTitle as MangaSecondaryTitleSchema,
+    MangaLink as MangaLinkSchema
 )
-from manga_search.model.metadata import (
+from manga_search.model.associations import (
     manga_authors, manga_artists, manga_publishers, manga_genres, manga_tags
 )
 
 
+# Many-to-many sets serialized by the Manga schema: (attribute, association table, target FK, target).
+# They are filled by MangaCRUD._load_manga_m2m straight from the association table; selectinload
+# would join back to manga for every batch, and omit_join is not supported for secondary tables.
+MANGA_M2M = (
+    ('authors', manga_authors, manga_authors.c.author_id, Author),
+    ('artists', manga_artists, manga_artists.c.artist_id, Artist),
+    ('publishers', manga_publishers, manga_publishers.c.publisher_id, Publisher),
+    ('genres', manga_genres, manga_genres.c.genre_id, Genre),
+    ('tags', manga_tags, manga_tags.c.tag_id, Tag),
+)
+M2M_IN_BATCH = 500
+# Junction rows from one bulk create at or above this count go in through COPY instead of INSERT
+BULK_COPY_MIN_ROWS = 1000
+
+# MangaCreate/MangaUpdate id lists: the relationship each fills, its junction table and lookup column
+MANGA_LINK_FIELDS = {
+    'author_ids': ('authors', manga_authors, 'author_id'),
+    'artist_ids': ('artists', manga_artists, 'artist_id'),
+    'publisher_ids': ('publishers', manga_publishers, 'publisher_id'),
+    'genre_ids': ('genres', manga_genres, 'genre_id'),
+    'tag_ids': ('tags', manga_tags, 'tag_id'),
+}
+
+# One-to-many collections serialized by the Manga schema, each loaded with one IN query for all rows.
+# Anything else raises if touched (models default to lazy="raise").
+MANGA_SCHEMA_LOAD = (
+    selectinload(Manga.covers),
+    selectinload(Manga.secondary_titles),
+    selectinload(Manga.links),
+    raiseload("*"),
+)
+
+# Single-manga fetch: covers ride along on the manga row via a LEFT OUTER JOIN. Joining a second
+# sibling collection would return covers x titles x links rows, each repeating the manga row
+# (description included), so the others load with one IN query each.
+MANGA_DETAIL_OPTIONS = {
+    'covers': joinedload(Manga.covers),
+    'secondary_titles': selectinload(Manga.secondary_titles),
+    'links': selectinload(Manga.links),
+}
+MANGA_DETAIL_LOAD = (*MANGA_DETAIL_OPTIONS.values(), raiseload("*"))
+
+# Relationship names get_manga can load through `expand`
+MANGA_RELATIONS = frozenset(
+    [key for key, *_ in MANGA_M2M] + ['covers', 'secondary_titles', 'links']
+)
+
+# Columns of a manga list item; list queries select these instead of materializing Manga objects
+MANGA_LIST_COLUMNS = tuple(getattr(Manga, name) for name in MangaListItem.model_fields)
+
+# Fuzzy suggestions, shaped entirely in SQL so rows go out as they come back.
+# suggestion_text is the title plus the native (else romanized) title when it differs
+FUZZY_SUGGESTIONS_QUERY = text("""
+    SELECT DISTINCT
+        m.title,
+        m.native_title,
+        m.romanized_title,
+        paradedb.score(m.id) as relevance_score,
+        similarity(m.title, :query) as similarity_score,
+        m.title || CASE
+            WHEN COALESCE(m.native_title, '') NOT IN ('', m.title) THEN ' (' || m.native_title || ')'
+            WHEN COALESCE(m.romanized_title, '') NOT IN ('', m.title) THEN ' (' || m.romanized_title || ')'
+            ELSE ''
+        END as suggestion_text
+    FROM manga m
+    WHERE 
+        id @@@ paradedb.match('title_search', :query, distance => :fuzzy_distance)
+    ORDER BY 
+        relevance_score DESC,
+        similarity_score DESC
+    LIMIT :limit
+""")
+
+
+def _fuzzy_field_query(db_field: str, matched_text: str):
+    return text(f"""
+        SELECT 
+            m.id as manga_id,
+            m.title,
+            m.native_title,
+            m.romanized_title,
+            COALESCE(SUBSTR(m.description, 1, 200), '') as description_snippet,
+            m.year,
+            m.rating,
+            m.status,
+            paradedb.score(m.id) as relevance_score,
+            {matched_text} as matched_text
+        FROM manga m
+        WHERE id @@@ paradedb.match('{db_field}', :query, distance => :fuzzy_distance)
+        ORDER BY paradedb.score(m.id) DESC
+        LIMIT :limit
+    """)
+
+
+# Per-field fuzzy queries, keyed by API field name: (BM25 field searched, text echoed as matched_text)
+FUZZY_FIELD_QUERIES = {
+    'title': _fuzzy_field_query('title_search', "m.title"),
+    'description': _fuzzy_field_query('description', "COALESCE(SUBSTR(m.description, 1, 200), '')"),
+    'search_text': _fuzzy_field_query('search_text', "m.title"),
+    'title_search': _fuzzy_field_query('title_search', "m.title"),
+}
+
+
+# Hot read statements are built once at import; the asyncpg dialect then reuses each one's
+# prepared statement per connection (prepared_statement_cache_size in infra.database)
+
+# Basic search page, rendered to a JSON array in SQL (see MangaCRUD.search_manga). Author/genre
+# names for the whole page come from manga_search_facets in the same query, so callers don't
+# look them up per result; ORDINALITY keeps the function's ranking
+SEARCH_MANGA_QUERY = text("""
+    SELECT
+        COALESCE(json_agg(json_build_object(
+            'manga_id', s.manga_id,
+            'title', s.title,
+            'native_title', s.native_title,
+            'year', s.year,
+            'rating', s.rating,
+            'relevance_score', s.bm25_score,
+            'authors', COALESCE(f.authors, ARRAY[]::TEXT[]),
+            'genres', COALESCE(f.genres, ARRAY[]::TEXT[])
+        ) ORDER BY s.ordinality), '[]')::text AS body,
+        count(*) AS row_count
+    FROM search_manga(:query, :limit_count, :offset_count) WITH ORDINALITY AS s
+    LEFT JOIN manga_search_facets f ON f.manga_id = s.manga_id
+""")
+
+#TODO avoid select *
+ADVANCED_SEARCH_QUERY = text("""SELECT * FROM advanced_manga_search(
+    search_text := :search_text,
+    min_rating := :min_rating,
+    max_rating := :max_rating,
+    year_from := :year_from,
+    year_to := :year_to,
+    genres := :genres,
+    status_filter := :status_filter,
+    content_rating_filter := :content_rating_filter,
+    limit_count := :limit_count,
+    offset_count := :offset_count
+)""")
+
+# Genres ordered by manga count. The top :limit ids are picked from the junction + manga
+# aggregate (grouped on the integer key) before any lookup row is read, so only those names are
+# joined; ids without manga only fill the remainder when fewer than :limit have any
+def _popular_query(table: str, junction: str, fk: str):
+    return text(f"""
+        WITH totals AS (
+            SELECT j.{fk} AS id, COUNT(*) AS manga_count, AVG(m.rating) AS avg_rating
+            FROM {junction} j
+            JOIN manga m ON m.id = j.manga_id
+            GROUP BY j.{fk}
+            ORDER BY manga_count DESC, avg_rating DESC NULLS LAST
+            LIMIT :limit
+        )
+        SELECT x.id, x.name, t.manga_count, t.avg_rating
+        FROM totals t
+        JOIN {table} x ON x.id = t.id
+        UNION ALL
+        (
+            SELECT x.id, x.name, 0, NULL
+            FROM {table} x
+            WHERE NOT EXISTS (SELECT 1 FROM {junction} j WHERE j.{fk} = x.id)
+            LIMIT GREATEST(:limit - (SELECT COUNT(*) FROM totals), 0)
+        )
+        ORDER BY manga_count DESC, avg_rating DESC NULLS LAST
+    """).bindparams(bindparam("limit", type_=Integer))
+
+
+POPULAR_GENRES_QUERY = _popular_query('genres', 'manga_genres', 'genre_id')
+
+# Tags ordered by manga count, then average rating, read off the trigger-maintained
+# tags.manga_count (index idx_tags_manga_count). Candidates are every tag counting at least as
+# many manga as the :limit-th one, so ties at the cutoff are decided by rating as before; the
+# average rating is aggregated only for those candidates
+POPULAR_TAGS_QUERY = text("""
+    WITH cutoff AS (
+        SELECT manga_count FROM tags ORDER BY manga_count DESC LIMIT 1 OFFSET :limit - 1
+    ),
+    candidates AS (
+        SELECT id, name, manga_count
+        FROM tags
+        WHERE manga_count >= COALESCE((SELECT manga_count FROM cutoff), 0)
+    )
+    SELECT c.id, c.name, c.manga_count, r.avg_rating
+    FROM candidates c
+    CROSS JOIN LATERAL (
+        SELECT AVG(m.rating) AS avg_rating
+        FROM manga_tags j
+        JOIN manga m ON m.id = j.manga_id
+        WHERE j.tag_id = c.id
+    ) r
+    ORDER BY c.manga_count DESC, r.avg_rating DESC NULLS LAST
+    LIMIT :limit
+""").bindparams(bindparam("limit", type_=Integer))
+
+MANGA_ROW_ESTIMATE_QUERY = text("SELECT reltuples::bigint FROM pg_class WHERE oid = 'manga'::regclass")
+
+# Overall statistics: every manga figure comes from one pass over manga; the lookup tables are
+# counted once each
+DATABASE_STATS_QUERY = text("""
+    WITH m AS (
+        SELECT
+            COUNT(*) as total_manga,
+            AVG(rating) as avg_rating,
+            COUNT(*) FILTER (WHERE rating >= 8.0) as high_rated_manga,
+            MAX(year) as latest_year,
+            MIN(year) as earliest_year
+        FROM manga
+    )
+    SELECT 
+        m.total_manga,
+        (SELECT COUNT(*) FROM authors) as total_authors,
+        (SELECT COUNT(*) FROM artists) as total_artists,
+        (SELECT COUNT(*) FROM publishers) as total_publishers,
+        (SELECT COUNT(*) FROM genres) as total_genres,
+        (SELECT COUNT(*) FROM tags) as total_tags,
+        m.avg_rating,
+        m.high_rated_manga,
+        m.latest_year,
+        m.earliest_year
+    FROM m
+""")
+
+# Year/rating histograms for the stats endpoints
+YEAR_DISTRIBUTION_QUERY = text("SELECT year, count, avg_rating FROM mv_year_distribution ORDER BY year DESC")
+RATING_DISTRIBUTION_QUERY = text("SELECT bucket, count FROM mv_rating_distribution ORDER BY bucket DESC")
+
+# mv_rating_distribution groups on floor(rating) clamped to 4..9; these are the API's range labels
+RATING_RANGE_LABELS = {
+    9: '9.0+',
+    8: '8.0-8.9',
+    7: '7.0-7.9',
+    6: '6.0-6.9',
+    5: '5.0-5.9',
+    4: 'Below 5.0',
+}
+
+# Per-id and per-manga statements for the cover/secondary title/link CRUD, bound at execute time.
+# Reads select just their response schema's columns, as plain rows (no ORM objects)
+COVER_COLUMNS = tuple(getattr(MangaCover, name) for name in MangaCoverSchema.model_fields)
+SECONDARY_TITLE_COLUMNS = tuple(getattr(MangaSecondaryTitle, name) for name in MangaSecondaryTitleSchema.model_fields)
+LINK_COLUMNS = tuple(getattr(MangaLink, name) for name in MangaLinkSchema.model_fields)
+
+COVER_BY_ID = select(*COVER_COLUMNS).where(MangaCover.id == bindparam("item_id"))
+COVERS_BY_MANGA = (
+    select(*COVER_COLUMNS)
+    .where(MangaCover.manga_id == bindparam("manga_id"))
+    .order_by(MangaCover.type)
+)
+DELETE_COVER = delete(MangaCover).where(MangaCover.id == bindparam("item_id")).returning(MangaCover.id)
+
+SECONDARY_TITLE_BY_ID = select(*SECONDARY_TITLE_COLUMNS).where(MangaSecondaryTitle.id == bindparam("item_id"))
+SECONDARY_TITLES_BY_MANGA = (
+    select(*SECONDARY_TITLE_COLUMNS)
+    .where(MangaSecondaryTitle.manga_id == bindparam("manga_id"))
+    .order_by(MangaSecondaryTitle.language_code, MangaSecondaryTitle.type)
+)
+DELETE_SECONDARY_TITLE = delete(MangaSecondaryTitle).where(MangaSecondaryTitle.id == bindparam("item_id")).returning(MangaSecondaryTitle.id)
+
+LINK_BY_ID = select(*LINK_COLUMNS).where(MangaLink.id == bindparam("item_id"))
+LINKS_BY_MANGA = (
+    select(*LINK_COLUMNS)
+    .where(MangaLink.manga_id == bindparam("manga_id"))
+    .order_by(MangaLink.link_type)
+)
+DELETE_LINK = delete(MangaLink).where(MangaLink.id == bindparam("item_id")).returning(MangaLink.id)
+
+
 class MangaCRUD:
     """CRUD operations for Manga entity with fixed async handling"""
     
     @staticmethod
-    async def get_manga(db: AsyncSession, manga_id: int) -> Optional[Manga]:
-        """Get a single manga with all related data - fixed for async"""
-        # 🔧 Remove explicit selectinload since models now use lazy="selectin"
-        query = select(Manga).where(Manga.id == manga_id)
+    async def _load_manga_m2m(
+        db: AsyncSession, mangas: Sequence[Manga], keys: Optional[Set[str]] = None
+    ) -> None:
+        """
+        Fill the MANGA_M2M sets of `mangas` (only those named in `keys`, if given),
+        reading only the association and target tables
+        """
+        by_id = {manga.id: manga for manga in mangas}
+        manga_ids = list(by_id)
+        for key, assoc, target_fk, target in MANGA_M2M:
+            if keys is not None and key not in keys:
+                continue
+            collections = {manga_id: [] for manga_id in manga_ids}
+            for start in range(0, len(manga_ids), M2M_IN_BATCH):
+                result = await db.execute(
+                    select(assoc.c.manga_id, target)
+                    .join(target, target.id == target_fk)
+                    .where(assoc.c.manga_id.in_(manga_ids[start:start + M2M_IN_BATCH]))
+                )
+                for manga_id, item in result:
+                    collections[manga_id].append(item)
+            for manga_id, items in collections.items():
+                set_committed_value(by_id[manga_id], key, items)
+
+    @staticmethod
+    async def get_manga(
+        db: AsyncSession, manga_id: int, expand: Optional[Set[str]] = None
+    ) -> Optional[Manga]:
+        """
+        Get a single manga with its related data - fixed for async.
+        `expand` names the MANGA_RELATIONS to load (all of them by default); the others are
+        left unloaded and raise if touched, so only pass it when the caller won't serialize them.
+        """
+        if expand is None:
+            options = MANGA_DETAIL_LOAD
+        else:
+            options = [option for key, option in MANGA_DETAIL_OPTIONS.items() if key in expand]
+            options.append(raiseload("*"))
+
+        # populate_existing reloads a manga this session just created or updated
+        query = (
+            select(Manga)
+            .where(Manga.id == manga_id)
+            .options(*options)
+            .execution_options(populate_existing=True)
+        )
         
         result = await db.execute(query)
-        manga = result.scalar_one_or_none()
-        
-        if manga:
-            # 🔧 Force loading of relationships within async context
-            await db.refresh(manga, ["authors", "artists", "publishers", "genres", "tags", "covers", "secondary_titles", "links"])
-        
+        manga = result.unique().scalar_one_or_none()
+        if manga is not None:
+            await MangaCRUD._load_manga_m2m(db, [manga], expand)
         return manga
 
 
     @staticmethod
-    async def get_manga_list(
-        db: AsyncSession, 
-        skip: int = 0, 
-        limit: int = 20,
-        status: Optional[str] = None,
-        year: Optional[int] = None,
-        min_rating: Optional[Decimal] = None,
-        max_rating: Optional[Decimal] = None,
-        content_rating: Optional[str] = None,
-        manga_type: Optional[str] = None
-    ) -> Sequence[Manga]:
-        """Get list of manga with optional filters - fixed for async"""
-        # 🔧 Simplified query without explicit selectinload
-        query = select(Manga)
-
+    def _manga_filters(
+        status: Optional[str],
+        year: Optional[int],
+        min_rating: Optional[Decimal],
+        max_rating: Optional[Decimal],
+        content_rating: Optional[str],
+        manga_type: Optional[str]
+    ) -> List[Any]:
+        """WHERE conditions shared by the manga list and count queries"""
         conditions = []
         if status:
             conditions.append(Manga.status == status)
@@ -68,22 +371,101 @@ class MangaCRUD:
             conditions.append(Manga.content_rating == content_rating)
         if manga_type:
             conditions.append(Manga.type == manga_type)
+        return conditions
+
+    @staticmethod
+    async def get_manga_list(
+        db: AsyncSession, 
+        skip: int = 0, 
+        limit: int = 20,
+        status: Optional[str] = None,
+        year: Optional[int] = None,
+        min_rating: Optional[Decimal] = None,
+        max_rating: Optional[Decimal] = None,
+        content_rating: Optional[str] = None,
+        manga_type: Optional[str] = None,
+        after: Optional[Tuple[Optional[float], int]] = None
+    ) -> Tuple[Sequence[Any], Optional[int]]:
+        """
+        Get a page of manga rows (list item columns) with optional filters, plus the total number of matches.
+        `after` is the (rating, id) of the previous page's last row; it replaces `skip` with an index
+        seek, and such pages skip the count (None), which the first page already reported.
+        """
+        if after is not None:
+            query = select(*MANGA_LIST_COLUMNS)
+        else:
+            # The window count rides along with the page, so the filters run once for both
+            query = select(*MANGA_LIST_COLUMNS, func.count().over().label("total_count"))
+
+        conditions = MangaCRUD._manga_filters(
+            status, year, min_rating, max_rating, content_rating, manga_type
+        )
+        if after is not None:
+            # Rows past (rating, id) in rating DESC NULLS LAST, id DESC order
+            after_rating, after_id = after
+            if after_rating is None:
+                conditions.append(and_(Manga.rating.is_(None), Manga.id < after_id))
+            else:
+                conditions.append(or_(
+                    Manga.rating < after_rating,
+                    and_(Manga.rating == after_rating, Manga.id < after_id),
+                    Manga.rating.is_(None),
+                ))
+            skip = 0
             
         if conditions:
             query = query.where(and_(*conditions))
             
-        query = query.offset(skip).limit(limit).order_by(Manga.rating.desc().nulls_last())
+        query = query.offset(skip).limit(limit).order_by(Manga.rating.desc().nulls_last(), Manga.id.desc())
 
         result = await db.execute(query)
-        manga_list = result.scalars().all()
-        
-        # 🔧 Force refresh relationships for all manga in the list
-        for manga in manga_list:
-            await db.refresh(manga, ["authors", "artists", "publishers", "genres", "tags"])
-        
-        return manga_list
+        rows = result.mappings().all()
+        if after is not None:
+            return rows, None
+        if rows:
+            return rows, rows[0]["total_count"]
+        if not skip:
+            return [], 0
+
+        # Paged past the end: no row carries the count, so ask for it directly
+        total = await MangaCRUD.get_manga_count(
+            db, status, year, min_rating, max_rating, content_rating, manga_type
+        )
+        return [], total
 
 
+    @staticmethod
+    async def stream_manga_rows(
+        db: AsyncSession,
+        skip: int,
+        limit: int,
+        columns: Sequence[str],
+        batch_size: int = 1000
+    ):
+        """Stream selected manga columns through a server-side cursor, one batch of rows at a time"""
+        query = (
+            select(*(getattr(Manga, column) for column in columns))
+            .order_by(Manga.rating.desc().nulls_last(), Manga.id.desc())
+            .offset(skip)
+            .limit(limit)
+            .execution_options(yield_per=batch_size)
+        )
+
+        result = await db.stream(query)
+        async for partition in result.partitions():
+            yield partition
+
+
+    @staticmethod
+    async def estimate_manga_count(db: AsyncSession) -> Optional[int]:
+        """
+        Planner row estimate for the whole manga table (pg_class.reltuples, kept current by
+        autovacuum/ANALYZE): a catalog lookup instead of a scan. None if never analyzed.
+        """
+        result = await db.execute(MANGA_ROW_ESTIMATE_QUERY)
+        estimate = result.scalar()
+        return estimate if estimate is not None and estimate >= 0 else None
+
     @staticmethod
     async def get_manga_count(
         db: AsyncSession,
@@ -97,19 +479,9 @@ class MangaCRUD:
         """Get total count of manga matching filters"""
         query = select(func.count(Manga.id))
         
-        conditions = []
-        if status:
-            conditions.append(Manga.status == status)
-        if year:
-            conditions.append(Manga.year == year)
-        if min_rating:
-            conditions.append(Manga.rating >= min_rating)
-        if max_rating:
-            conditions.append(Manga.rating <= max_rating)
-        if content_rating:
-            conditions.append(Manga.content_rating == content_rating)
-        if manga_type:
-            conditions.append(Manga.type == manga_type)
+        conditions = MangaCRUD._manga_filters(
+            status, year, min_rating, max_rating, content_rating, manga_type
+        )
             
         if conditions:
             query = query.where(and_(*conditions))
@@ -121,39 +493,72 @@ class MangaCRUD:
     async def create_manga(db: AsyncSession, manga_data: MangaCreate) -> Manga:
         """Create a new manga with relationships - fixed for async"""
         # Create manga record
-        manga_dict = manga_data.model_dump(exclude={
-            'author_ids', 'artist_ids', 'publisher_ids', 'genre_ids', 'tag_ids'
-        })
+        manga_dict = manga_data.model_dump(exclude=set(MANGA_LINK_FIELDS))
         
         manga = Manga(**manga_dict)
         db.add(manga)
         await db.flush()  # Get the ID
         
         # Add relationships
-        if manga_data.author_ids:
-            await MangaCRUD._add_manga_authors(db, manga.id, manga_data.author_ids)
-        if manga_data.artist_ids:
-            await MangaCRUD._add_manga_artists(db, manga.id, manga_data.artist_ids)
-        if manga_data.publisher_ids:
-            await MangaCRUD._add_manga_publishers(db, manga.id, manga_data.publisher_ids)
-        if manga_data.genre_ids:
-            await MangaCRUD._add_manga_genres(db, manga.id, manga_data.genre_ids)
-        if manga_data.tag_ids:
-            await MangaCRUD._add_manga_tags(db, manga.id, manga_data.tag_ids)
-            
-        await db.commit()
+        await MangaCRUD._sync_manga_links(db, manga.id, manga_data, replace=False)
         
-        # 🔧 Return fresh instance with all relationships loaded
-        return await MangaCRUD.get_manga(db, manga.id)
+        # 🔧 Return fresh instance; only the sets given ids can be non-empty on a new manga.
+        # Read inside the write transaction so the COMMIT below is its last round trip
+        linked = {
+            key for field, (key, _, _) in MANGA_LINK_FIELDS.items() if getattr(manga_data, field)
+        }
+        manga = await MangaCRUD.get_manga(db, manga.id, expand=linked)
+        for key in MANGA_RELATIONS - linked:
+            set_committed_value(manga, key, [])
+        await db.commit()
+        return manga
+
+    @staticmethod
+    async def create_manga_bulk(db: AsyncSession, manga_list: List[MangaCreate]) -> List[Manga]:
+        """Create many manga with one batched INSERT per table instead of a round trip per manga"""
+        if not manga_list:
+            return []
+
+        rows = [manga_data.model_dump(exclude=set(MANGA_LINK_FIELDS)) for manga_data in manga_list]
+
+        # RETURNING ids in parameter order so they line up with manga_list
+        result = await db.execute(
+            insert(Manga).returning(Manga.id, sort_by_parameter_order=True), rows
+        )
+        manga_ids = result.scalars().all()
+
+        for field, (_, table, column) in MANGA_LINK_FIELDS.items():
+            records = [
+                (manga_id, related_id)
+                for manga_id, manga_data in zip(manga_ids, manga_list)
+                for related_id in dict.fromkeys(getattr(manga_data, field) or ())
+            ]
+            if len(records) >= BULK_COPY_MIN_ROWS:
+                # The manga are new and ids are deduplicated per manga, so nothing can conflict
+                # and binary COPY (no per-row parse/plan) is safe; same connection and transaction
+                connection = await db.connection()
+                raw_connection = await connection.get_raw_connection()
+                await raw_connection.driver_connection.copy_records_to_table(
+                    table.name, records=records, columns=('manga_id', column)
+                )
+            elif records:
+                await db.execute(
+                    pg_insert(table).on_conflict_do_nothing(),
+                    [{'manga_id': manga_id, column: related_id} for manga_id, related_id in records]
+                )
+
+        result = await db.execute(select(Manga).where(Manga.id.in_(manga_ids)).options(*MANGA_SCHEMA_LOAD))
+        by_id = {manga.id: manga for manga in result.scalars()}
+        await MangaCRUD._load_manga_m2m(db, list(by_id.values()))
+        await db.commit()
+        return [by_id[manga_id] for manga_id in manga_ids]
 
     @staticmethod
     async def update_manga(db: AsyncSession, manga_id: int, manga_data: MangaUpdate) -> Optional[Manga]:
         """Update an existing manga - fixed for async"""
         # Update manga fields
-        update_dict = {k: v for k, v in manga_data.model_dump().items() 
-                      if v is not None and k not in [
-                          'author_ids', 'artist_ids', 'publisher_ids', 'genre_ids', 'tag_ids'
-                      ]}
+        update_dict = {k: v for k, v in manga_data.model_dump(exclude=set(MANGA_LINK_FIELDS)).items()
+                      if v is not None}
         
         if update_dict:
             query = update(Manga).where(Manga.id == manga_id).values(**update_dict)
@@ -162,19 +567,11 @@ class MangaCRUD:
                 return None
         
         # Update relationships if provided
-        if manga_data.author_ids is not None:
-            await MangaCRUD._replace_manga_authors(db, manga_id, manga_data.author_ids)
-        if manga_data.artist_ids is not None:
-            await MangaCRUD._replace_manga_artists(db, manga_id, manga_data.artist_ids)
-        if manga_data.publisher_ids is not None:
-            await MangaCRUD._replace_manga_publishers(db, manga_id, manga_data.publisher_ids)
-        if manga_data.genre_ids is not None:
-            await MangaCRUD._replace_manga_genres(db, manga_id, manga_data.genre_ids)
-        if manga_data.tag_ids is not None:
-            await MangaCRUD._replace_manga_tags(db, manga_id, manga_data.tag_ids)
+        await MangaCRUD._sync_manga_links(db, manga_id, manga_data, replace=True)
             
+        manga = await MangaCRUD.get_manga(db, manga_id)
         await db.commit()
-        return await MangaCRUD.get_manga(db, manga_id)
+        return manga
 
     @staticmethod
     async def delete_manga(db: AsyncSession, manga_id: int) -> bool:
@@ -184,127 +581,63 @@ class MangaCRUD:
         await db.commit()
         return result.rowcount > 0
 
-    # Helper methods remain the same...
-    @staticmethod
-    async def _add_manga_authors(db: AsyncSession, manga_id: int, author_ids: List[int]):
-        if not author_ids:
-            return
-        values = [{'manga_id': manga_id, 'author_id': author_id} for author_id in author_ids]
-        query = insert(manga_authors).values(values)
-        await db.execute(query)
-
-    @staticmethod
-    async def _replace_manga_authors(db: AsyncSession, manga_id: int, author_ids: List[int]):
-        del_query = delete(manga_authors).where(manga_authors.c.manga_id == manga_id)
-        await db.execute(del_query)
-        if author_ids:
-            await MangaCRUD._add_manga_authors(db, manga_id, author_ids)
-
-    @staticmethod
-    async def _add_manga_artists(db: AsyncSession, manga_id: int, artist_ids: List[int]):
-        if not artist_ids:
-            return
-        values = [{'manga_id': manga_id, 'artist_id': artist_id} for artist_id in artist_ids]
-        query = insert(manga_artists).values(values)
-        await db.execute(query)
-
-    @staticmethod
-    async def _replace_manga_artists(db: AsyncSession, manga_id: int, artist_ids: List[int]):
-        del_query = delete(manga_artists).where(manga_artists.c.manga_id == manga_id)
-        await db.execute(del_query)
-        if artist_ids:
-            await MangaCRUD._add_manga_artists(db, manga_id, artist_ids)
-
-    @staticmethod
-    async def _add_manga_publishers(db: AsyncSession, manga_id: int, publisher_ids: List[int]):
-        if not publisher_ids:
-            return
-        values = [{'manga_id': manga_id, 'publisher_id': publisher_id} for publisher_id in publisher_ids]
-        query = insert(manga_publishers).values(values)
-        await db.execute(query)
-
-    @staticmethod
-    async def _replace_manga_publishers(db: AsyncSession, manga_id: int, publisher_ids: List[int]):
-        del_query = delete(manga_publishers).where(manga_publishers.c.manga_id == manga_id)
-        await db.execute(del_query)
-        if publisher_ids:
-            await MangaCRUD._add_manga_publishers(db, manga_id, publisher_ids)
-
-    @staticmethod
-    async def _add_manga_genres(db: AsyncSession, manga_id: int, genre_ids: List[int]):
-        if not genre_ids:
-            return
-        values = [{'manga_id': manga_id, 'genre_id': genre_id} for genre_id in genre_ids]
-        query = insert(manga_genres).values(values)
-        await db.execute(query)
-
     @staticmethod
-    async def _replace_manga_genres(db: AsyncSession, manga_id: int, genre_ids: List[int]):
-        del_query = delete(manga_genres).where(manga_genres.c.manga_id == manga_id)
-        await db.execute(del_query)
-        if genre_ids:
-            await MangaCRUD._add_manga_genres(db, manga_id, genre_ids)
-
-    @staticmethod
-    async def _add_manga_tags(db: AsyncSession, manga_id: int, tag_ids: List[int]):
-        if not tag_ids:
+    async def _sync_manga_links(db: AsyncSession, manga_id: int, manga_data, replace: bool):
+        """
+        Write the junction rows for each *_ids list set on `manga_data` in a single statement:
+        one INSERT ... ON CONFLICT DO NOTHING per table (repeated and already-linked ids are
+        skipped) and, with `replace`, one DELETE of the links missing from the list, chained as CTEs.
+        """
+        statements = []
+        for field, (_, table, column) in MANGA_LINK_FIELDS.items():
+            related_ids = getattr(manga_data, field)
+            if related_ids is None or not (related_ids or replace):
+                continue
+            related_ids = list(dict.fromkeys(related_ids))
+
+            if replace:
+                statements.append(
+                    delete(table)
+                    .where(table.c.manga_id == manga_id, table.c[column].not_in(related_ids))
+                )
+            if related_ids:
+                statements.append(
+                    pg_insert(table)
+                    .values([{'manga_id': manga_id, column: related_id} for related_id in related_ids])
+                    .on_conflict_do_nothing()
+                )
+
+        if not statements:
             return
-        values = [{'manga_id': manga_id, 'tag_id': tag_id} for tag_id in tag_ids]
-        query = insert(manga_tags).values(values)
+        # Data-modifying CTEs must sit at the top level, so all but the last hang off the last one;
+        # they touch disjoint rows, so sharing one snapshot is fine
+        *ctes, query = statements
+        for i, statement in enumerate(ctes):
+            query = query.add_cte(statement.cte(f'link_{i}'))
         await db.execute(query)
 
-    @staticmethod
-    async def _replace_manga_tags(db: AsyncSession, manga_id: int, tag_ids: List[int]):
-        del_query = delete(manga_tags).where(manga_tags.c.manga_id == manga_id)
-        await db.execute(del_query)
-        if tag_ids:
-            await MangaCRUD._add_manga_tags(db, manga_id, tag_ids)
-
 
     # Search methods remain the same...
     @staticmethod
-    async def search_manga(db: AsyncSession, params: SearchParams) -> List[MangaSearchResult]:
-        """Basic BM25 search using database function"""
-        #TODO avoid select *
-        query = text("""
-            SELECT * FROM search_manga(:query, :limit_count, :offset_count)
-        """)
-
-        result = await db.execute(query, {
+    async def search_manga(db: AsyncSession, params: SearchParams) -> Tuple[bytes, int]:
+        """
+        Basic BM25 search using database function. Returns the page already rendered as a JSON
+        array of MangaSearchResult objects (built by json_agg, so no per-row decoding here) and
+        the number of rows on it.
+        """
+        result = await db.execute(SEARCH_MANGA_QUERY, {
             'query': params.query,
             'limit_count': params.limit,
             'offset_count': params.offset
         })
-        
-        return [MangaSearchResult(
-            manga_id=row.manga_id,
-            title=row.title,
-            native_title=row.native_title,
-            year=row.year,
-            rating=row.rating,
-            relevance_score=row.bm25_score
-        ) for row in result.fetchall()]
+        body, row_count = result.one()
+        return body.encode(), row_count
 
 
     @staticmethod
-    async def advanced_search_manga(db: AsyncSession, params: SearchParams) -> List[Dict[str, Any]]:
+    async def advanced_search_manga(db: AsyncSession, params: SearchParams) -> Sequence[Any]:
         """Advanced search with filters using database function"""
-        #TODO avoid select *
-        q_str = """SELECT * FROM advanced_manga_search(
-    search_text := :search_text,
-    min_rating := :min_rating,
-    max_rating := :max_rating,
-    year_from := :year_from,
-    year_to := :year_to,
-    genres := :genres,
-    status_filter := :status_filter,
-    content_rating_filter := :content_rating_filter,
-    limit_count := :limit_count,
-    offset_count := :offset_count
-)"""
-        query = text(q_str)
-
-        result = await db.execute(query, {
+        result = await db.execute(ADVANCED_SEARCH_QUERY, {
             'search_text': params.query or '',
             'min_rating': params.min_rating or 0,
             'max_rating': params.max_rating or 10,
@@ -317,7 +650,7 @@ class MangaCRUD:
             'offset_count': params.offset
         })
 
-        return [dict(row._mapping) for row in result.fetchall()]
+        return result.mappings().all()
 
 
     @staticmethod
@@ -326,28 +659,12 @@ class MangaCRUD:
         query: str,
         limit: int = 10,
         fuzzy_distance: int = 2
-    ) -> List[Dict[str, Any]]:
+    ) -> Sequence[Any]:
         """
         Generate fuzzy search suggestions for auto-complete
         """
-        suggestion_query = text("""
-            SELECT DISTINCT
-                m.title,
-                m.native_title,
-                m.romanized_title,
-                paradedb.score(m.id) as relevance_score,
-                similarity(m.title, :query) as title_similarity
-            FROM manga m
-            WHERE 
-                id @@@ paradedb.match('title_search', :query, distance => :fuzzy_distance)
-            ORDER BY 
-                relevance_score DESC,
-                title_similarity DESC
-            LIMIT :limit
-        """)
-
         s1 =time()
-        result = await db.execute(suggestion_query, {
+        result = await db.execute(FUZZY_SUGGESTIONS_QUERY, {
             'query': query,
             'fuzzy_distance': fuzzy_distance,
             'limit': limit
@@ -355,27 +672,7 @@ class MangaCRUD:
         s2 = time()
         print(f"Fuzzy search suggestions executed in {s2 - s1:.4f} seconds")
 
-        suggestions = []
-        for row in result.fetchall():
-            suggestion = {
-                'title': row.title,
-                'native_title': row.native_title,
-                'romanized_title': row.romanized_title,
-                'relevance_score': row.relevance_score,
-                'similarity_score': row.title_similarity
-            }
-            
-            # Create suggestion text (prefer title, fallback to native/romanized)
-            suggestion_text = row.title
-            if row.native_title and row.native_title != row.title:
-                suggestion_text += f" ({row.native_title})"
-            elif row.romanized_title and row.romanized_title != row.title:
-                suggestion_text += f" ({row.romanized_title})"
-                
-            suggestion['suggestion_text'] = suggestion_text
-            suggestions.append(suggestion)
-        
-        return suggestions
+        return result.mappings().all()
 
 
     @staticmethod
@@ -385,49 +682,16 @@ class MangaCRUD:
         query: str,
         fuzzy_distance: int = 2,
         limit: int = 20
-    ) -> List[Dict[str, Any]]:
+    ) -> Sequence[Any]:
         """
         Perform fuzzy search on a specific field
         Supported fields: title, description, search_text
         """
 
         # Validate field
-        valid_fields = ['title', 'description', 'search_text', 'title_search']
-        if field not in valid_fields:
-            raise ValueError(f"Invalid field '{field}'. Must be one of: {valid_fields}")
-
-        # Map field to actual database column
-        field_mapping = {
-            'title': 'title_search',
-            'description': 'description',
-            'search_text': 'search_text',
-            'title_search': 'title_search'
-        }
-
-        db_field = field_mapping[field]
-
-        field_query = text(f"""
-            SELECT 
-                m.id as manga_id,
-                m.title,
-                m.native_title,
-                m.romanized_title,
-                COALESCE(SUBSTR(m.description, 1, 200), '') as description_snippet,
-                m.year,
-                m.rating,
-                m.status,
-                paradedb.score(m.id) as relevance_score,
-                -- Highlight matched text (basic implementation)
-                CASE 
-                    WHEN '{field}' = 'title' THEN m.title
-                    WHEN '{field}' = 'description' THEN COALESCE(SUBSTR(m.description, 1, 200), '')
-                    ELSE m.title
-                END as matched_text
-            FROM manga m
-            WHERE id @@@ paradedb.match('{db_field}', :query, distance => :fuzzy_distance)
-            ORDER BY paradedb.score(m.id) DESC
-            LIMIT :limit
-        """)
+        field_query = FUZZY_FIELD_QUERIES.get(field)
+        if field_query is None:
+            raise ValueError(f"Invalid field '{field}'. Must be one of: {list(FUZZY_FIELD_QUERIES)}")
 
         result = await db.execute(field_query, {
             'query': query,
@@ -435,574 +699,189 @@ class MangaCRUD:
             'limit': limit
         })
         
-        return [dict(row._mapping) for row in result.fetchall()]
-
-
-class AuthorCRUD:
-    """CRUD operations for Author entity"""
-
-    @staticmethod
-    async def get_authors(
-        db: AsyncSession, 
-        skip: int = 0, 
-        limit: int = 100,
-        search: Optional[str] = None
-    ) -> Sequence[Author]:
-        """Get list of authors with optional search"""
-        query = select(Author)
-        
-        if search:
-            query = query.where(Author.name.ilike(f"%{search}%"))
-            
-        query = query.offset(skip).limit(limit).order_by(Author.name)
-        result = await db.execute(query)
-        return result.scalars().all()
-
-    @staticmethod
-    async def get_authors_count(
-        db: AsyncSession,
-        search: Optional[str] = None
-    ) -> int:
-        """Get total count of authors"""
-        query = select(func.count(Author.id))
-        
-        if search:
-            query = query.where(Author.name.ilike(f"%{search}%"))
-            
-        result = await db.execute(query)
-        return result.scalar()
-
-    @staticmethod
-    async def create_author(db: AsyncSession, author: AuthorCreate) -> Author:
-        """Create a new author"""
-        db_author = Author(**author.model_dump())
-        db.add(db_author)
-        await db.commit()
-        await db.refresh(db_author)
-        return db_author
-
-    @staticmethod
-    async def get_author(db: AsyncSession, author_id: int) -> Optional[Author]:
-        """Get author by ID with related manga"""
-        query = select(Author).options(
-            selectinload(Author.manga)
-        ).where(Author.id == author_id)
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
-
-    @staticmethod
-    async def get_author_by_name(db: AsyncSession, name: str) -> Optional[Author]:
-        """Get author by exact name"""
-        query = select(Author).where(Author.name == name)
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
-
-    @staticmethod
-    async def update_author(
-        db: AsyncSession, 
-        author_id: int, 
-        author: AuthorCreate
-    ) -> Optional[Author]:
-        """Update author"""
-        query = update(Author).where(Author.id == author_id).values(**author.model_dump())
-        result = await db.execute(query)
-        if result.rowcount == 0:
-            return None
-        await db.commit()
-        return await AuthorCRUD.get_author(db, author_id)
-
-    @staticmethod
-    async def delete_author(db: AsyncSession, author_id: int) -> bool:
-        """Delete author (check for manga relationships first)"""
-        # Check if author has manga relationships
-        manga_count = await db.execute(
-            select(func.count(manga_authors.c.manga_id))
-            .where(manga_authors.c.author_id == author_id)
+        return result.mappings().all()
+
+
+class LookupCRUD:
+    """
+    CRUD operations shared by the lookup entities (Author, Artist, Publisher, Genre, Tag):
+    a `name`-keyed table linked to manga through `junction`.
+    Statements that don't depend on request values are built once here and reused per call.
+    """
+
+    def __init__(self, model, junction, fk_column: str, manga_count_column=None):
+        self.model = model
+        link = junction.c[fk_column]
+        # Lists are served with the *Simple schema; manga is loaded only for a single item
+        self._list = select(model).options(raiseload("*"))
+        self._count = select(func.count(model.id))
+        self._get = (
+            select(model)
+            .options(selectinload(model.manga))
+            .where(model.id == bindparam("item_id"))
         )
-        
-        if manga_count.scalar() > 0:
-            return False  # Cannot delete author with manga relationships
-            
-        query = delete(Author).where(Author.id == author_id)
-        result = await db.execute(query)
-        await db.commit()
-        return result.rowcount > 0
-
-    @staticmethod
-    async def get_author_manga_count(db: AsyncSession, author_id: int) -> int:
-        """Get count of manga for this author"""
-        result = await db.execute(
-            select(func.count(manga_authors.c.manga_id))
-            .where(manga_authors.c.author_id == author_id)
+        self._get_by_name = select(model).where(model.name == bindparam("name"))
+        # The relationship check is part of the DELETE: one round trip, no check-then-act gap
+        self._delete = (
+            delete(model)
+            .where(model.id == bindparam("item_id"))
+            .where(~exists().where(link == bindparam("item_id")))
         )
-        return result.scalar()
-
-
-class ArtistCRUD:
-    """CRUD operations for Artist entity"""
-    
-    @staticmethod
-    async def get_artists(
-        db: AsyncSession, 
-        skip: int = 0, 
+        # Entities with a trigger-maintained counter column (tags.manga_count) read it instead
+        if manga_count_column is not None:
+            self._manga_count = select(manga_count_column).where(model.id == bindparam("item_id"))
+        else:
+            self._manga_count = select(func.count(junction.c.manga_id)).where(link == bindparam("item_id"))
+
+    async def list(
+        self,
+        db: AsyncSession,
+        skip: int = 0,
         limit: int = 100,
         search: Optional[str] = None
-    ) -> Sequence[Artist]:
-        """Get list of artists with optional search"""
-        query = select(Artist)
-        
+    ) -> Sequence[Any]:
+        """Get a page of items ordered by name, with optional substring search"""
+        query = self._list
         if search:
-            query = query.where(Artist.name.ilike(f"%{search}%"))
-            
-        query = query.offset(skip).limit(limit).order_by(Artist.name)
+            query = query.where(self.model.name.ilike(f"%{search}%"))
+        query = query.offset(skip).limit(limit).order_by(self.model.name)
         result = await db.execute(query)
         return result.scalars().all()
 
-    @staticmethod
-    async def get_artists_count(
-        db: AsyncSession,
-        search: Optional[str] = None
-    ) -> int:
-        """Get total count of artists"""
-        query = select(func.count(Artist.id))
-        
+    async def count(self, db: AsyncSession, search: Optional[str] = None) -> int:
+        """Get total count of items, with optional substring search"""
+        query = self._count
         if search:
-            query = query.where(Artist.name.ilike(f"%{search}%"))
-            
+            query = query.where(self.model.name.ilike(f"%{search}%"))
         result = await db.execute(query)
         return result.scalar()
 
-    @staticmethod
-    async def create_artist(db: AsyncSession, artist: ArtistCreate) -> Artist:
-        """Create a new artist"""
-        db_artist = Artist(**artist.model_dump())
-        db.add(db_artist)
-        await db.commit()
-        await db.refresh(db_artist)
-        return db_artist
-
-    @staticmethod
-    async def get_artist(db: AsyncSession, artist_id: int) -> Optional[Artist]:
-        """Get artist by ID with related manga"""
-        query = select(Artist).options(
-            selectinload(Artist.manga)
-        ).where(Artist.id == artist_id)
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
-
-    @staticmethod
-    async def get_artist_by_name(db: AsyncSession, name: str) -> Optional[Artist]:
-        """Get artist by exact name"""
-        query = select(Artist).where(Artist.name == name)
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
-
-    @staticmethod
-    async def update_artist(
-        db: AsyncSession, 
-        artist_id: int, 
-        artist: ArtistCreate
-    ) -> Optional[Artist]:
-        """Update artist"""
-        query = update(Artist).where(Artist.id == artist_id).values(**artist.model_dump())
-        result = await db.execute(query)
-        if result.rowcount == 0:
-            return None
-        await db.commit()
-        return await ArtistCRUD.get_artist(db, artist_id)
-
-    @staticmethod
-    async def delete_artist(db: AsyncSession, artist_id: int) -> bool:
-        """Delete artist (check for manga relationships first)"""
-        # Check if artist has manga relationships
-        manga_count = await db.execute(
-            select(func.count(manga_artists.c.manga_id))
-            .where(manga_artists.c.artist_id == artist_id)
-        )
-        
-        if manga_count.scalar() > 0:
-            return False  # Cannot delete artist with manga relationships
-            
-        query = delete(Artist).where(Artist.id == artist_id)
-        result = await db.execute(query)
-        await db.commit()
-        return result.rowcount > 0
-
-    @staticmethod
-    async def get_artist_manga_count(db: AsyncSession, artist_id: int) -> int:
-        """Get count of manga for this artist"""
+    async def create(self, db: AsyncSession, data) -> Any:
+        """Create a new item"""
+        # RETURNING fills server defaults (id, created_at) in the INSERT itself; no refresh SELECT
         result = await db.execute(
-            select(func.count(manga_artists.c.manga_id))
-            .where(manga_artists.c.artist_id == artist_id)
+            insert(self.model).values(**data.model_dump()).returning(self.model)
         )
-        return result.scalar()
-
-
-class PublisherCRUD:
-    """CRUD operations for Publisher entity"""
-    
-    @staticmethod
-    async def get_publishers(
-        db: AsyncSession, 
-        skip: int = 0, 
-        limit: int = 100,
-        search: Optional[str] = None
-    ) -> Sequence[Publisher]:
-        """Get list of publishers with optional search"""
-        query = select(Publisher)
-        
-        if search:
-            query = query.where(Publisher.name.ilike(f"%{search}%"))
-            
-        query = query.offset(skip).limit(limit).order_by(Publisher.name)
-        result = await db.execute(query)
-        return result.scalars().all()
-
-    @staticmethod
-    async def get_publishers_count(
-        db: AsyncSession,
-        search: Optional[str] = None
-    ) -> int:
-        """Get total count of publishers"""
-        query = select(func.count(Publisher.id))
-        
-        if search:
-            query = query.where(Publisher.name.ilike(f"%{search}%"))
-            
-        result = await db.execute(query)
-        return result.scalar()
-
-    @staticmethod
-    async def create_publisher(db: AsyncSession, publisher: PublisherCreate) -> Publisher:
-        """Create a new publisher"""
-        db_publisher = Publisher(**publisher.model_dump())
-        db.add(db_publisher)
+        item = result.scalar_one()
         await db.commit()
-        await db.refresh(db_publisher)
-        return db_publisher
+        # A new item has no manga yet; mark the collection loaded instead of querying it
+        set_committed_value(item, "manga", [])
+        return item
 
-    @staticmethod
-    async def get_publisher(db: AsyncSession, publisher_id: int) -> Optional[Publisher]:
-        """Get publisher by ID with related manga"""
-        query = select(Publisher).options(
-            selectinload(Publisher.manga)
-        ).where(Publisher.id == publisher_id)
-        result = await db.execute(query)
+    async def get(self, db: AsyncSession, item_id: int) -> Optional[Any]:
+        """Get item by ID with related manga"""
+        result = await db.execute(self._get, {"item_id": item_id})
         return result.scalar_one_or_none()
 
-    @staticmethod
-    async def get_publisher_by_name(db: AsyncSession, name: str) -> Optional[Publisher]:
-        """Get publisher by exact name"""
-        query = select(Publisher).where(Publisher.name == name)
-        result = await db.execute(query)
+    async def get_by_name(self, db: AsyncSession, name: str) -> Optional[Any]:
+        """Get item by exact name"""
+        result = await db.execute(self._get_by_name, {"name": name})
         return result.scalar_one_or_none()
 
-    @staticmethod
-    async def update_publisher(
-        db: AsyncSession, 
-        publisher_id: int, 
-        publisher: PublisherCreate
-    ) -> Optional[Publisher]:
-        """Update publisher"""
-        query = update(Publisher).where(Publisher.id == publisher_id).values(**publisher.model_dump())
+    async def update(self, db: AsyncSession, item_id: int, data) -> Optional[Any]:
+        """Update item"""
+        query = update(self.model).where(self.model.id == item_id).values(**data.model_dump())
         result = await db.execute(query)
         if result.rowcount == 0:
             return None
+        item = await self.get(db, item_id)
         await db.commit()
-        return await PublisherCRUD.get_publisher(db, publisher_id)
+        return item
 
-    @staticmethod
-    async def delete_publisher(db: AsyncSession, publisher_id: int) -> bool:
-        """Delete publisher (check for manga relationships first)"""
-        # Check if publisher has manga relationships
-        manga_count = await db.execute(
-            select(func.count(manga_publishers.c.manga_id))
-            .where(manga_publishers.c.publisher_id == publisher_id)
-        )
-        
-        if manga_count.scalar() > 0:
-            return False  # Cannot delete publisher with manga relationships
-            
-        query = delete(Publisher).where(Publisher.id == publisher_id)
-        result = await db.execute(query)
+    async def delete(self, db: AsyncSession, item_id: int) -> bool:
+        """Delete item unless it has manga relationships; False if protected or not found"""
+        result = await db.execute(self._delete, {"item_id": item_id})
         await db.commit()
         return result.rowcount > 0
 
-    @staticmethod
-    async def get_publisher_manga_count(db: AsyncSession, publisher_id: int) -> int:
-        """Get count of manga for this publisher"""
-        result = await db.execute(
-            select(func.count(manga_publishers.c.manga_id))
-            .where(manga_publishers.c.publisher_id == publisher_id)
-        )
-        return result.scalar()
+    async def manga_count(self, db: AsyncSession, item_id: int) -> int:
+        """Get count of manga linked to this item"""
+        result = await db.execute(self._manga_count, {"item_id": item_id})
+        return result.scalar() or 0
 
 
-class GenreCRUD:
-    """CRUD operations for Genre entity"""
-    
-    @staticmethod
-    async def get_genres(
-        db: AsyncSession, 
-        skip: int = 0, 
-        limit: int = 100,
-        search: Optional[str] = None
-    ) -> Sequence[Genre]:
-        """Get list of genres with optional search"""
-        query = select(Genre)
-        
-        if search:
-            query = query.where(Genre.name.ilike(f"%{search}%"))
-            
-        query = query.offset(skip).limit(limit).order_by(Genre.name)
-        result = await db.execute(query)
-        return result.scalars().all()
-
-    @staticmethod
-    async def get_genres_count(
-        db: AsyncSession,
-        search: Optional[str] = None
-    ) -> int:
-        """Get total count of genres"""
-        query = select(func.count(Genre.id))
-        
-        if search:
-            query = query.where(Genre.name.ilike(f"%{search}%"))
-            
-        result = await db.execute(query)
-        return result.scalar()
-
-    @staticmethod
-    async def create_genre(db: AsyncSession, genre: GenreCreate) -> Genre:
-        """Create a new genre"""
-        db_genre = Genre(**genre.model_dump())
-        db.add(db_genre)
-        await db.commit()
-        await db.refresh(db_genre)
-        return db_genre
-
-    @staticmethod
-    async def get_genre(db: AsyncSession, genre_id: int) -> Optional[Genre]:
-        """Get genre by ID with related manga"""
-        query = select(Genre).options(
-            selectinload(Genre.manga)
-        ).where(Genre.id == genre_id)
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
-
-    @staticmethod
-    async def get_genre_by_name(db: AsyncSession, name: str) -> Optional[Genre]:
-        """Get genre by exact name"""
-        query = select(Genre).where(Genre.name == name)
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
-
-    @staticmethod
-    async def update_genre(
-        db: AsyncSession, 
-        genre_id: int, 
-        genre: GenreCreate
-    ) -> Optional[Genre]:
-        """Update genre"""
-        query = update(Genre).where(Genre.id == genre_id).values(**genre.model_dump())
-        result = await db.execute(query)
-        if result.rowcount == 0:
-            return None
-        await db.commit()
-        return await GenreCRUD.get_genre(db, genre_id)
+author_crud = LookupCRUD(Author, manga_authors, "author_id")
+artist_crud = LookupCRUD(Artist, manga_artists, "artist_id")
+publisher_crud = LookupCRUD(Publisher, manga_publishers, "publisher_id")
+genre_crud = LookupCRUD(Genre, manga_genres, "genre_id")
+tag_crud = LookupCRUD(Tag, manga_tags, "tag_id", manga_count_column=Tag.manga_count)
 
-    @staticmethod
-    async def delete_genre(db: AsyncSession, genre_id: int) -> bool:
-        """Delete genre (check for manga relationships first)"""
-        # Check if genre has manga relationships
-        manga_count = await db.execute(
-            select(func.count(manga_genres.c.manga_id))
-            .where(manga_genres.c.genre_id == genre_id)
-        )
-        
-        if manga_count.scalar() > 0:
-            return False  # Cannot delete genre with manga relationships
-            
-        query = delete(Genre).where(Genre.id == genre_id)
-        result = await db.execute(query)
-        await db.commit()
-        return result.rowcount > 0
 
-    @staticmethod
-    async def get_genre_manga_count(db: AsyncSession, genre_id: int) -> int:
-        """Get count of manga for this genre"""
-        result = await db.execute(
-            select(func.count(manga_genres.c.manga_id))
-            .where(manga_genres.c.genre_id == genre_id)
-        )
-        return result.scalar()
+class GenreCRUD:
+    """Genre queries beyond the shared lookup CRUD (genre_crud)"""
 
     @staticmethod
-    async def get_popular_genres(db: AsyncSession, limit: int = 20) -> List[Dict[str, Any]]:
+    async def get_popular_genres(db: AsyncSession, limit: int = 20) -> Sequence[Any]:
         """Get genres ordered by manga count"""
-        query = text("""
-            SELECT 
-                g.id,
-                g.name,
-                COUNT(mg.manga_id) as manga_count,
-                AVG(m.rating) as avg_rating
-            FROM genres g
-            LEFT JOIN manga_genres mg ON g.id = mg.genre_id
-            LEFT JOIN manga m ON mg.manga_id = m.id
-            GROUP BY g.id, g.name
-            ORDER BY manga_count DESC, avg_rating DESC NULLS LAST
-            LIMIT :limit
-        """)
-        
-        result = await db.execute(query, {'limit': limit})
-        return [dict(row._mapping) for row in result.fetchall()]
+        result = await db.execute(POPULAR_GENRES_QUERY, {'limit': limit})
+        return result.mappings().all()
 
 
 class TagCRUD:
-    """CRUD operations for Tag entity"""
-    
-    @staticmethod
-    async def get_tags(
-        db: AsyncSession, 
-        skip: int = 0, 
-        limit: int = 100,
-        search: Optional[str] = None
-    ) -> Sequence[Tag]:
-        """Get list of tags with optional search"""
-        query = select(Tag)
-        
-        if search:
-            query = query.where(Tag.name.ilike(f"%{search}%"))
-            
-        query = query.offset(skip).limit(limit).order_by(Tag.name)
-        result = await db.execute(query)
-        return result.scalars().all()
-
-    @staticmethod
-    async def get_tags_count(
-        db: AsyncSession,
-        search: Optional[str] = None
-    ) -> int:
-        """Get total count of tags"""
-        query = select(func.count(Tag.id))
-        
-        if search:
-            query = query.where(Tag.name.ilike(f"%{search}%"))
-            
-        result = await db.execute(query)
-        return result.scalar()
-
-    @staticmethod
-    async def create_tag(db: AsyncSession, tag: TagCreate) -> Tag:
-        """Create a new tag"""
-        db_tag = Tag(**tag.model_dump())
-        db.add(db_tag)
-        await db.commit()
-        await db.refresh(db_tag)
-        return db_tag
+    """Tag queries beyond the shared lookup CRUD (tag_crud)"""
 
     @staticmethod
-    async def get_tag(db: AsyncSession, tag_id: int) -> Optional[Tag]:
-        """Get tag by ID with related manga"""
-        query = select(Tag).options(
-            selectinload(Tag.manga)
-        ).where(Tag.id == tag_id)
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
-
-    @staticmethod
-    async def get_tag_by_name(db: AsyncSession, name: str) -> Optional[Tag]:
-        """Get tag by exact name"""
-        query = select(Tag).where(Tag.name == name)
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
-
-    @staticmethod
-    async def update_tag(
-        db: AsyncSession, 
-        tag_id: int, 
-        tag: TagCreate
-    ) -> Optional[Tag]:
-        """Update tag"""
-        query = update(Tag).where(Tag.id == tag_id).values(**tag.model_dump())
-        result = await db.execute(query)
-        if result.rowcount == 0:
-            return None
-        await db.commit()
-        return await TagCRUD.get_tag(db, tag_id)
-
-    @staticmethod
-    async def delete_tag(db: AsyncSession, tag_id: int) -> bool:
-        """Delete tag (check for manga relationships first)"""
-        # Check if tag has manga relationships
-        manga_count = await db.execute(
-            select(func.count(manga_tags.c.manga_id))
-            .where(manga_tags.c.tag_id == tag_id)
-        )
-        
-        if manga_count.scalar() > 0:
-            return False  # Cannot delete tag with manga relationships
-            
-        query = delete(Tag).where(Tag.id == tag_id)
-        result = await db.execute(query)
-        await db.commit()
-        return result.rowcount > 0
-
-    @staticmethod
-    async def get_tag_manga_count(db: AsyncSession, tag_id: int) -> int:
-        """Get count of manga for this tag"""
-        result = await db.execute(
-            select(func.count(manga_tags.c.manga_id))
-            .where(manga_tags.c.tag_id == tag_id)
-        )
-        return result.scalar()
-
-    @staticmethod
-    async def get_popular_tags(db: AsyncSession, limit: int = 50) -> List[Dict[str, Any]]:
+    async def get_popular_tags(db: AsyncSession, limit: int = 50) -> Sequence[Any]:
         """Get tags ordered by manga count"""
-        query = text("""
-            SELECT 
-                t.id,
-                t.name,
-                COUNT(mt.manga_id) as manga_count,
-                AVG(m.rating) as avg_rating
-            FROM tags t
-            LEFT JOIN manga_tags mt ON t.id = mt.tag_id
-            LEFT JOIN manga m ON mt.manga_id = m.id
-            GROUP BY t.id, t.name
-            ORDER BY manga_count DESC, avg_rating DESC NULLS LAST
-            LIMIT :limit
-        """)
-        
-        result = await db.execute(query, {'limit': limit})
-        return [dict(row._mapping) for row in result.fetchall()]
+        result = await db.execute(POPULAR_TAGS_QUERY, {'limit': limit})
+        return result.mappings().all()
+
+
+async def _create_many(db: AsyncSession, model, items: Sequence[Any]) -> List[Any]:
+    """
+    Insert `items` (Create schemas) as `model` rows in one executemany, batched into multi-row
+    INSERT ... RETURNING by insertmanyvalues, and commit once; rows come back in input order
+    """
+    if not items:
+        return []
+    result = await db.execute(
+        insert(model).returning(model, sort_by_parameter_order=True),
+        [item.model_dump() for item in items]
+    )
+    created = result.scalars().all()
+    await db.commit()
+    return created
+
+
+async def _delete_one(db: AsyncSession, stmt, item_id: int) -> bool:
+    """
+    Run a single-row DELETE ... RETURNING and report whether a row went. When it is the first
+    statement of the session it runs in autocommit, so the DELETE is the only round trip
+    (no BEGIN/COMMIT); the request's commit in get_db then has nothing left to send
+    """
+    if not db.in_transaction():
+        await db.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+    result = await db.execute(stmt, {"item_id": item_id})
+    return result.scalar_one_or_none() is not None
 
 
 class MangaCoverCRUD:
     """CRUD operations for MangaCover entity"""
     
     @staticmethod
-    async def get_manga_covers(db: AsyncSession, manga_id: int) -> Sequence[MangaCover]:
+    async def get_manga_covers(db: AsyncSession, manga_id: int) -> Sequence[Mapping[str, Any]]:
         """Get all covers for a manga"""
-        query = select(MangaCover).where(MangaCover.manga_id == manga_id).order_by(MangaCover.type)
-        result = await db.execute(query)
-        return result.scalars().all()
+        result = await db.execute(COVERS_BY_MANGA, {"manga_id": manga_id})
+        return result.mappings().all()
 
     @staticmethod
     async def create_manga_cover(db: AsyncSession, cover: MangaCoverCreate) -> MangaCover:
         """Create a new manga cover"""
-        db_cover = MangaCover(**cover.model_dump())
-        db.add(db_cover)
+        result = await db.execute(insert(MangaCover).values(**cover.model_dump()).returning(MangaCover))
+        db_cover = result.scalar_one()
         await db.commit()
-        await db.refresh(db_cover)
         return db_cover
 
     @staticmethod
-    async def get_manga_cover(db: AsyncSession, cover_id: int) -> Optional[MangaCover]:
+    async def create_manga_covers_bulk(db: AsyncSession, covers: List[MangaCoverCreate]) -> List[MangaCover]:
+        """Create many manga covers in one batched INSERT and a single commit"""
+        return await _create_many(db, MangaCover, covers)
+
+    @staticmethod
+    async def get_manga_cover(db: AsyncSession, cover_id: int) -> Optional[Mapping[str, Any]]:
         """Get cover by ID"""
-        query = select(MangaCover).where(MangaCover.id == cover_id)
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
+        result = await db.execute(COVER_BY_ID, {"item_id": cover_id})
+        return result.mappings().one_or_none()
 
     @staticmethod
     async def update_manga_cover(
@@ -1012,33 +891,29 @@ class MangaCoverCRUD:
     ) -> Optional[MangaCover]:
         """Update manga cover"""
         update_dict = cover_data.model_dump(exclude={'manga_id'})  # Don't update manga_id
-        query = update(MangaCover).where(MangaCover.id == cover_id).values(**update_dict)
+        # RETURNING hands back the updated row, so there is no follow-up SELECT
+        query = update(MangaCover).where(MangaCover.id == cover_id).values(**update_dict).returning(MangaCover)
         result = await db.execute(query)
-        if result.rowcount == 0:
+        updated = result.scalar_one_or_none()
+        if updated is None:
             return None
         await db.commit()
-        return await MangaCoverCRUD.get_manga_cover(db, cover_id)
+        return updated
 
     @staticmethod
     async def delete_manga_cover(db: AsyncSession, cover_id: int) -> bool:
         """Delete manga cover"""
-        query = delete(MangaCover).where(MangaCover.id == cover_id)
-        result = await db.execute(query)
-        await db.commit()
-        return result.rowcount > 0
+        return await _delete_one(db, DELETE_COVER, cover_id)
 
 
 class MangaSecondaryTitleCRUD:
     """CRUD operations for MangaSecondaryTitle entity"""
     
     @staticmethod
-    async def get_manga_secondary_titles(db: AsyncSession, manga_id: int) -> Sequence[MangaSecondaryTitle]:
+    async def get_manga_secondary_titles(db: AsyncSession, manga_id: int) -> Sequence[Mapping[str, Any]]:
         """Get all secondary titles for a manga"""
-        query = select(MangaSecondaryTitle).where(
-            MangaSecondaryTitle.manga_id == manga_id
-        ).order_by(MangaSecondaryTitle.language_code, MangaSecondaryTitle.type)
-        result = await db.execute(query)
-        return result.scalars().all()
+        result = await db.execute(SECONDARY_TITLES_BY_MANGA, {"manga_id": manga_id})
+        return result.mappings().all()
 
     @staticmethod
     async def create_manga_secondary_title(
@@ -1046,18 +921,21 @@ class MangaSecondaryTitleCRUD:
         title: MangaSecondaryTitleCreate
     ) -> MangaSecondaryTitle:
         """Create a new manga secondary title"""
-        db_title = MangaSecondaryTitle(**title.model_dump())
-        db.add(db_title)
+        result = await db.execute(insert(MangaSecondaryTitle).values(**title.model_dump()).returning(MangaSecondaryTitle))
+        db_title = result.scalar_one()
         await db.commit()
-        await db.refresh(db_title)
         return db_title
 
     @staticmethod
-    async def get_manga_secondary_title(db: AsyncSession, title_id: int) -> Optional[MangaSecondaryTitle]:
+    async def create_manga_secondary_titles_bulk(db: AsyncSession, titles: List[MangaSecondaryTitleCreate]) -> List[MangaSecondaryTitle]:
+        """Create many manga secondary titles in one batched INSERT and a single commit"""
+        return await _create_many(db, MangaSecondaryTitle, titles)
+
+    @staticmethod
+    async def get_manga_secondary_title(db: AsyncSession, title_id: int) -> Optional[Mapping[str, Any]]:
         """Get secondary title by ID"""
-        query = select(MangaSecondaryTitle).where(MangaSecondaryTitle.id == title_id)
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
+        result = await db.execute(SECONDARY_TITLE_BY_ID, {"item_id": title_id})
+        return result.mappings().one_or_none()
 
     @staticmethod
     async def update_manga_secondary_title(
@@ -1067,47 +945,47 @@ class MangaSecondaryTitleCRUD:
     ) -> Optional[MangaSecondaryTitle]:
         """Update manga secondary title"""
         update_dict = title_data.model_dump(exclude={'manga_id'})  # Don't update manga_id
-        query = update(MangaSecondaryTitle).where(MangaSecondaryTitle.id == title_id).values(**update_dict)
+        query = update(MangaSecondaryTitle).where(MangaSecondaryTitle.id == title_id).values(**update_dict).returning(MangaSecondaryTitle)
         result = await db.execute(query)
-        if result.rowcount == 0:
+        updated = result.scalar_one_or_none()
+        if updated is None:
             return None
         await db.commit()
-        return await MangaSecondaryTitleCRUD.get_manga_secondary_title(db, title_id)
+        return updated
 
     @staticmethod
     async def delete_manga_secondary_title(db: AsyncSession, title_id: int) -> bool:
         """Delete manga secondary title"""
-        query = delete(MangaSecondaryTitle).where(MangaSecondaryTitle.id == title_id)
-        result = await db.execute(query)
-        await db.commit()
-        return result.rowcount > 0
+        return await _delete_one(db, DELETE_SECONDARY_TITLE, title_id)
 
 
 class MangaLinkCRUD:
     """CRUD operations for MangaLink entity"""
     
     @staticmethod
-    async def get_manga_links(db: AsyncSession, manga_id: int) -> Sequence[MangaLink]:
+    async def get_manga_links(db: AsyncSession, manga_id: int) -> Sequence[Mapping[str, Any]]:
         """Get all links for a manga"""
-        query = select(MangaLink).where(MangaLink.manga_id == manga_id).order_by(MangaLink.link_type)
-        result = await db.execute(query)
-        return result.scalars().all()
+        result = await db.execute(LINKS_BY_MANGA, {"manga_id": manga_id})
+        return result.mappings().all()
 
     @staticmethod
     async def create_manga_link(db: AsyncSession, link: MangaLinkCreate) -> MangaLink:
         """Create a new manga link"""
-        db_link = MangaLink(**link.model_dump())
-        db.add(db_link)
+        result = await db.execute(insert(MangaLink).values(**link.model_dump()).returning(MangaLink))
+        db_link = result.scalar_one()
         await db.commit()
-        await db.refresh(db_link)
         return db_link
 
     @staticmethod
-    async def get_manga_link(db: AsyncSession, link_id: int) -> Optional[MangaLink]:
+    async def create_manga_links_bulk(db: AsyncSession, links: List[MangaLinkCreate]) -> List[MangaLink]:
+        """Create many manga links in one batched INSERT and a single commit"""
+        return await _create_many(db, MangaLink, links)
+
+    @staticmethod
+    async def get_manga_link(db: AsyncSession, link_id: int) -> Optional[Mapping[str, Any]]:
         """Get link by ID"""
-        query = select(MangaLink).where(MangaLink.id == link_id)
-        result = await db.execute(query)
-        return result.scalar_one_or_none()
+        result = await db.execute(LINK_BY_ID, {"item_id": link_id})
+        return result.mappings().one_or_none()
 
     @staticmethod
     async def update_manga_link(
@@ -1117,83 +995,43 @@ class MangaLinkCRUD:
     ) -> Optional[MangaLink]:
         """Update manga link"""
         update_dict = link_data.model_dump(exclude={'manga_id'})  # Don't update manga_id
-        query = update(MangaLink).where(MangaLink.id == link_id).values(**update_dict)
+        query = update(MangaLink).where(MangaLink.id == link_id).values(**update_dict).returning(MangaLink)
         result = await db.execute(query)
-        if result.rowcount == 0:
+        updated = result.scalar_one_or_none()
+        if updated is None:
             return None
         await db.commit()
-        return await MangaLinkCRUD.get_manga_link(db, link_id)
+        return updated
 
     @staticmethod
     async def delete_manga_link(db: AsyncSession, link_id: int) -> bool:
         """Delete manga link"""
-        query = delete(MangaLink).where(MangaLink.id == link_id)
-        result = await db.execute(query)
-        await db.commit()
-        return result.rowcount > 0
+        return await _delete_one(db, DELETE_LINK, link_id)
 
 
 class StatisticsCRUD:
     """Advanced statistics and analytics operations"""
     
     @staticmethod
-    async def get_database_stats(db: AsyncSession) -> Dict[str, Any]:
+    async def get_database_stats(db: AsyncSession) -> Mapping[str, Any]:
         """Get overall database statistics"""
-        stats_query = text("""
-            SELECT 
-                (SELECT COUNT(*) FROM manga) as total_manga,
-                (SELECT COUNT(*) FROM authors) as total_authors,
-                (SELECT COUNT(*) FROM artists) as total_artists,
-                (SELECT COUNT(*) FROM publishers) as total_publishers,
-                (SELECT COUNT(*) FROM genres) as total_genres,
-                (SELECT COUNT(*) FROM tags) as total_tags,
-                (SELECT AVG(rating) FROM manga WHERE rating IS NOT NULL) as avg_rating,
-                (SELECT COUNT(*) FROM manga WHERE rating >= 8.0) as high_rated_manga,
-                (SELECT MAX(year) FROM manga WHERE year IS NOT NULL) as latest_year,
-                (SELECT MIN(year) FROM manga WHERE year IS NOT NULL) as earliest_year
-        """)
-        
-        result = await db.execute(stats_query)
-        row = result.fetchone()
-        return dict(row._mapping)
+        result = await db.execute(DATABASE_STATS_QUERY)
+        return result.mappings().one()
 
     @staticmethod
-    async def get_year_distribution(db: AsyncSession) -> List[Dict[str, Any]]:
+    async def get_year_distribution(db: AsyncSession) -> Sequence[Any]:
         """Get manga distribution by year"""
-        query = text("""
-            SELECT 
-                year,
-                COUNT(*) as count,
-                AVG(rating) as avg_rating
-            FROM manga 
-            WHERE year IS NOT NULL
-            GROUP BY year
-            ORDER BY year DESC
-        """)
-        
-        result = await db.execute(query)
-        return [dict(row._mapping) for row in result.fetchall()]
+        # Pre-aggregated in mv_year_distribution (see schema.sql), refreshed after manga writes
+        result = await db.execute(YEAR_DISTRIBUTION_QUERY)
+        return result.mappings().all()
 
 
     @staticmethod
-    async def get_rating_distribution(db: AsyncSession) -> List[Dict[str, Any]]:
+    async def get_rating_distribution(db: AsyncSession) -> Sequence[Any]:
         """Get manga distribution by rating ranges"""
-        query = text("""
-            SELECT 
-                CASE 
-                    WHEN rating >= 9.0 THEN '9.0+'
-                    WHEN rating >= 8.0 THEN '8.0-8.9'
-                    WHEN rating >= 7.0 THEN '7.0-7.9'
-                    WHEN rating >= 6.0 THEN '6.0-6.9'
-                    WHEN rating >= 5.0 THEN '5.0-5.9'
-                    ELSE 'Below 5.0'
-                END as rating_range,
-                COUNT(*) as count
-            FROM manga 
-            WHERE rating IS NOT NULL
-            GROUP BY rating_range
-            ORDER BY rating_range DESC
-        """)
-        
-        result = await db.execute(query)
-        return [dict(row._mapping) for row in result.fetchall()]
+        # Pre-aggregated in mv_rating_distribution (see schema.sql), refreshed after manga writes
+        result = await db.execute(RATING_DISTRIBUTION_QUERY)
+        return [
+            {'rating_range': RATING_RANGE_LABELS[bucket], 'count': count}
+            for bucket, count in result
+        ]
@@ -0,0 +1,56 @@
+import asyncio
+import logging
+from typing import Callable, List, Optional
+
+from sqlalchemy import text
+
+from manga_search.infra.database import engine
+
+
+logger = logging.getLogger(__name__)
+
+# Writes landing within this window share a single refresh
+REFRESH_DELAY = 5.0
+
+
+class DebouncedViewRefresh:
+    """
+    Keeps materialized views current after writes: schedule_refresh() marks them stale and a
+    background task runs REFRESH ... CONCURRENTLY on each, REFRESH_DELAY seconds later.
+    Each view needs a UNIQUE index for CONCURRENTLY. Callbacks in `on_refreshed` run after
+    every successful refresh, e.g. to drop caches filled from the views' previous contents.
+    """
+
+    def __init__(self, *views: str):
+        self.views = views
+        self._refresh_queries = [text(f"REFRESH MATERIALIZED VIEW CONCURRENTLY {view}") for view in views]
+        self._stale = False
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.on_refreshed: List[Callable[[], None]] = []
+
+    def schedule_refresh(self):
+        self._stale = True
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh_while_stale())
+
+    async def _refresh_while_stale(self):
+        # Writes arriving during a refresh set _stale again and get one more pass
+        while self._stale:
+            await asyncio.sleep(REFRESH_DELAY)
+            self._stale = False
+            try:
+                async with engine.begin() as conn:
+                    for query in self._refresh_queries:
+                        await conn.execute(query)
+            except Exception as e:
+                logger.warning(f"Refreshing {', '.join(self.views)} failed: {e}")
+            else:
+                for callback in self.on_refreshed:
+                    callback()
+
+
+# Author and genre names per manga, read by basic and advanced search
+search_facets = DebouncedViewRefresh("manga_search_facets")
+
+# Year and rating histograms behind the stats endpoints; only manga rows feed them
+manga_distributions = DebouncedViewRefresh("mv_year_distribution", "mv_rating_distribution")